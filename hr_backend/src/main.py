@@ -5,6 +5,7 @@ from datetime import timedelta
 # DON'T CHANGE THIS !!!
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
+import click
 from flask import Flask, send_from_directory
 from flask_jwt_extended import JWTManager
 from flask_cors import CORS
@@ -17,6 +18,18 @@ from src.models.audit_log import AuditLog
 from src.models.evaluation_criteria import EvaluationCriteria, EvaluationItem, EvaluationTemplate, TemplateCriteria
 from src.models.bonus_policy import BonusPolicy, BonusCalculation, BonusDistribution
 from src.models.evaluation_simple import Evaluation, EvaluationResult, EvaluationScore
+from src.models.attendance_record import AttendanceRecord
+from src.models.attendance_daily_stat import AttendanceDailyStat
+from src.models.payroll_record import PayrollRecord
+from src.models.payroll_period_summary import PayrollPeriodSummary
+from src.models.payroll_recalc_job import PayrollRecalcJob
+from src.models.table_version import TableVersion
+from src.models.payroll_year_settlement import PayrollYearSettlement
+
+from src.utils.pdf_generator import benchmark_payslip_render
+from src.utils.change_tracking import register_change_tracking, bump_tables
+from src.utils.query_plans import check_query_plans
+from src.utils.schema import ensure_columns, ensure_indexes, run_migrations
 
 # 라우트 import
 from src.routes.auth import auth_bp
@@ -47,8 +60,13 @@ app.config['JWT_REFRESH_TOKEN_EXPIRES'] = timedelta(days=30)
 app.config['SQLALCHEMY_DATABASE_URI'] = f"sqlite:///{os.path.join(os.path.dirname(__file__), 'database', 'app.db')}"
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 
+# 확정된 급여명세서 PDF 캐시 설정
+app.config['PAYSLIP_CACHE_DIR'] = os.path.join(os.path.dirname(__file__), 'database', 'payslip_cache')
+app.config['PAYSLIP_CACHE_MAX_BYTES'] = 512 * 1024 * 1024  # 512MB
+
 # 데이터베이스 초기화
 db.init_app(app)
+register_change_tracking()
 
 # JWT 초기화
 jwt = JWTManager(app)
@@ -84,8 +102,31 @@ app.register_blueprint(dashboard_bp, url_prefix='/api')
 def init_database():
     """데이터베이스 초기화 및 기본 데이터 생성"""
     with app.app_context():
-        # 테이블 생성
+        # 테이블 생성 (기존 테이블에 새로 선언된 컬럼/인덱스도 추가)
         db.create_all()
+        ensure_columns(db)
+        applied_migrations = run_migrations(db)
+        for version, description in applied_migrations:
+            print(f"스키마 마이그레이션 {version} 적용: {description}")
+        if applied_migrations:
+            # 마이그레이션은 세션 밖에서 데이터를 바꾸므로 이전에 받은 ETag가 맞지 않게 카운터를 올린다
+            bump_tables(db.engine, db.metadata.tables)
+        ensure_indexes(db)
+        
+        # 급여 기간 집계가 비어 있으면 기존 급여명세서로부터 재생성
+        if not PayrollPeriodSummary.query.first() and PayrollRecord.query.first():
+            PayrollPeriodSummary.rebuild()
+            db.session.commit()
+        
+        # 일자/부서별 출퇴근 집계가 비어 있으면 기존 출퇴근 기록으로부터 재생성
+        if not AttendanceDailyStat.query.first() and AttendanceRecord.query.first():
+            AttendanceDailyStat.rebuild()
+            db.session.commit()
+        
+        # 연간 급여 합계(연말정산)도 비어 있으면 재생성
+        if not PayrollYearSettlement.query.first() and PayrollRecord.query.first():
+            PayrollYearSettlement.rebuild()
+            db.session.commit()
         
         # 기본 관리자 계정 확인 및 생성
         admin_user = User.query.filter_by(username='admin').first()
@@ -139,6 +180,58 @@ def init_database():
         else:
             print("기본 관리자 계정이 이미 존재합니다.")
 
+@app.cli.command('rebuild-payroll-summaries')
+def rebuild_payroll_summaries_command():
+    """급여 기간 집계 테이블(payroll_period_summaries) 재생성"""
+    period_count = PayrollPeriodSummary.rebuild()
+    db.session.commit()
+    print(f"{period_count}개 급여 기간 집계를 재생성했습니다.")
+
+@app.cli.command('rebuild-attendance-stats')
+def rebuild_attendance_stats_command():
+    """일자/부서별 출퇴근 집계 테이블(attendance_daily_stats) 재생성"""
+    row_count = AttendanceDailyStat.rebuild()
+    db.session.commit()
+    print(f"{row_count}건의 (일자, 부서) 출퇴근 집계를 재생성했습니다.")
+
+@app.cli.command('rebuild-payroll-settlements')
+@click.option('--year', type=int, default=None, help='재집계할 연도 (생략하면 전체 연도)')
+def rebuild_payroll_settlements_command(year):
+    """연말정산용 연간 급여 합계 테이블(payroll_year_settlements) 재생성"""
+    if year:
+        employee_count = PayrollYearSettlement.refresh(year)
+        db.session.commit()
+        print(f"{year}년 {employee_count}명의 연간 급여 합계를 재집계했습니다.")
+    else:
+        row_count = PayrollYearSettlement.rebuild()
+        db.session.commit()
+        print(f"{row_count}건의 (직원, 연도) 연간 급여 합계를 재생성했습니다.")
+
+@app.cli.command('check-query-plans')
+@click.option('--verbose', is_flag=True, help='모든 조회의 실행 계획 출력')
+def check_query_plans_command(verbose):
+    """자주 쓰는 조회가 인덱스를 쓰는지 EXPLAIN QUERY PLAN으로 점검 (전체 스캔이 있으면 종료 코드 1)"""
+    results = check_query_plans()
+    for result in results:
+        print(f"[{result['status']}] {result['name']}")
+        if verbose or result['status'] == 'full_scan':
+            for detail in result['plan']:
+                print(f"    {detail}")
+    full_scans = [result for result in results if result['status'] == 'full_scan']
+    if full_scans:
+        print(f"{len(full_scans)}개 조회가 테이블 전체를 읽습니다.")
+        raise SystemExit(1)
+    print(f"{len(results)}개 조회 점검 완료")
+
+@app.cli.command('bench-payslip-render')
+@click.option('--count', default=200, show_default=True, help='측정 반복 횟수')
+def bench_payslip_render_command(count):
+    """급여명세서 한 건당 렌더링 시간 비교 (전체 레이아웃 vs 미리 배치된 템플릿)"""
+    result = benchmark_payslip_render(count)
+    print(f"템플릿 준비: {result['template_setup_ms']}ms (프로세스/스레드당 1회)")
+    print(f"전체 레이아웃: {result['flow_layout_ms']}ms/건")
+    print(f"미리 배치된 템플릿: {result['template_ms']}ms/건 ({result['speedup']}배)")
+
 # 정적 파일 서빙 (프론트엔드)
 @app.route('/', defaults={'path': ''})
 @app.route('/<path:path>')
@@ -8,10 +8,14 @@ from .audit_log import AuditLog
 from .evaluation_criteria import EvaluationCriteria
 from .bonus_policy import BonusPolicy
 from .attendance_record import AttendanceRecord
+from .attendance_daily_stat import AttendanceDailyStat
 from .annual_leave_grant import AnnualLeaveGrant
 from .annual_leave_usage import AnnualLeaveUsage
 from .leave_request import LeaveRequest
 from .evaluation_simple import Evaluation, EvaluationResult, EvaluationScore
 from .bonus_calculation_advanced import BonusCalculation, BonusDistribution, BonusPaymentHistory
 from .payroll_record import PayrollRecord
+from .payroll_period_summary import PayrollPeriodSummary
 
+from .payroll_recalc_job import PayrollRecalcJob
+from .payroll_year_settlement import PayrollYearSettlement
@@ -4,6 +4,10 @@ from src.models.user import db
 class AnnualLeaveGrant(db.Model):
     """연차 부여 모델"""
     __tablename__ = 'annual_leave_grants'
+    __table_args__ = (
+        # 직원별 연도 부여 연차 조회용
+        db.Index('ix_annual_leave_grants_employee_year', 'employee_id', 'year'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     employee_id = db.Column(db.Integer, db.ForeignKey('employees.id'), nullable=False)
@@ -14,6 +18,11 @@ class AnnualLeaveGrant(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     created_by = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
     
+    @classmethod
+    def for_employee_year(cls, employee_id, year):
+        """직원의 해당 연도 연차 부여 조회 쿼리"""
+        return cls.query.filter_by(employee_id=employee_id, year=year)
+    
     def to_dict(self):
         """딕셔너리로 변환"""
         from src.models.employee import Employee
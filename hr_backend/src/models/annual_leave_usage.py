@@ -1,19 +1,37 @@
-from datetime import datetime
+from datetime import date, datetime
 from src.models.user import db
 
 class AnnualLeaveUsage(db.Model):
     """연차 사용 모델"""
     __tablename__ = 'annual_leave_usages'
+    __table_args__ = (
+        # 직원별 연간 사용 연차 합계 조회용
+        db.Index('ix_annual_leave_usages_employee_usage_date', 'employee_id', 'usage_date'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     employee_id = db.Column(db.Integer, db.ForeignKey('employees.id'), nullable=False)
-    usage_date = db.Column(db.Date, nullable=False)
+    usage_date = db.Column(db.Date, nullable=False, index=True)
     used_days = db.Column(db.Float, nullable=False)  # 사용한 연차 일수 (0.5일 단위 가능)
     linked_leave_request_id = db.Column(db.Integer, db.ForeignKey('leave_requests.id'), nullable=True)
     note = db.Column(db.Text, nullable=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     created_by = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
     
+    @classmethod
+    def used_days_in_year_query(cls, employee_id, year):
+        """직원의 해당 연도 사용 연차 합계 쿼리 ([1월 1일, 다음 해 1월 1일) 범위로 조회)"""
+        return db.session.query(db.func.sum(cls.used_days)).filter(
+            cls.employee_id == employee_id,
+            cls.usage_date >= date(year, 1, 1),
+            cls.usage_date < date(year + 1, 1, 1)
+        )
+    
+    @classmethod
+    def used_days_in_year(cls, employee_id, year):
+        """직원의 해당 연도 사용 연차 합계"""
+        return cls.used_days_in_year_query(employee_id, year).scalar() or 0
+    
     def to_dict(self):
         """딕셔너리로 변환"""
         from src.models.employee import Employee
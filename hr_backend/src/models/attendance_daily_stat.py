@@ -0,0 +1,132 @@
+from datetime import datetime
+from sqlalchemy import Column, Integer, Float, Date, DateTime, func, case, select, insert, and_
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from .user import db
+from .attendance_record import AttendanceRecord
+from .employee import Employee
+
+# 출퇴근 상태 -> 집계 컬럼
+STATUS_COLUMNS = {
+    '출근': 'on_time',
+    '지각': 'late',
+    '결근': 'absent',
+    '조퇴': 'early_leave',
+}
+
+COUNT_COLUMNS = ('on_time', 'late', 'absent', 'early_leave', 'record_count', 'hours_count')
+
+
+class AttendanceDailyStat(db.Model):
+    """일자/부서별 출퇴근 집계 모델 (attendance_records 롤업)
+
+    출퇴근 기록 생성/수정/삭제와 출근/퇴근 등록 시 같은 트랜잭션 안에서 증분 갱신된다.
+    부서는 출퇴근 기록에 저장된 기록 당시 소속 부서이며, 부서가 없는 직원은 department_id 0으로 모은다.
+    """
+    __tablename__ = 'attendance_daily_stats'
+
+    date = Column(Date, primary_key=True)
+    department_id = Column(Integer, primary_key=True, default=0)  # 0: 부서 미지정
+
+    on_time = Column(Integer, nullable=False, default=0)  # 정상 출근
+    late = Column(Integer, nullable=False, default=0)  # 지각
+    absent = Column(Integer, nullable=False, default=0)  # 결근
+    early_leave = Column(Integer, nullable=False, default=0)  # 조퇴
+    record_count = Column(Integer, nullable=False, default=0)  # 기록 수
+    hours_count = Column(Integer, nullable=False, default=0)  # 근무 시간이 있는 기록 수
+    sum_hours = Column(Float, nullable=False, default=0)  # 근무 시간 합계
+
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    @classmethod
+    def date_range(cls, start, end):
+        """집계 일자가 [start, end) 범위인 조건"""
+        return and_(cls.date >= start, cls.date < end)
+
+    @classmethod
+    def apply_record(cls, record, sign=1):
+        """출퇴근 기록 한 건을 집계에 더하거나(sign=1) 뺌(sign=-1) (커밋은 호출하는 쪽에서 수행)
+
+        같은 일자/부서 행을 여러 요청이 동시에 갱신하므로 INSERT ... ON CONFLICT DO UPDATE로
+        값을 누적한다. 기록을 수정할 때는 변경 전에 -1, 변경 후에 +1로 두 번 호출한다.
+        부서는 기록에 저장된 department_id를 쓰므로 직원이 부서를 옮긴 뒤 기록을 수정/삭제해도
+        처음 더한 부서 행에서 뺀다. 값이 없으면 현재 소속 부서를 기록에 채워 넣는다.
+        """
+        if record is None or record.date is None:
+            return
+        if record.department_id is None:
+            record.department_id = db.session.query(Employee.department_id).filter(
+                Employee.id == record.employee_id
+            ).scalar() or 0
+        department_id = record.department_id
+
+        values = {column: 0 for column in COUNT_COLUMNS}
+        values['record_count'] = sign
+        status_column = STATUS_COLUMNS.get(record.status)
+        if status_column:
+            values[status_column] = sign
+        if record.work_hours is not None:
+            values['hours_count'] = sign
+        values['sum_hours'] = sign * (record.work_hours or 0)
+
+        statement = sqlite_insert(cls).values(
+            date=record.date,
+            department_id=department_id,
+            updated_at=datetime.utcnow(),
+            **values
+        )
+        db.session.execute(statement.on_conflict_do_update(
+            index_elements=['date', 'department_id'],
+            set_={
+                **{column: getattr(cls, column) + statement.excluded[column] for column in values},
+                'updated_at': statement.excluded.updated_at
+            }
+        ))
+
+    @classmethod
+    def _insert_aggregate(cls, *conditions):
+        """조건에 맞는 출퇴근 기록을 (일자, 부서)별로 집계하여 insert -> 만든 행 수"""
+        work_hours = AttendanceRecord.work_hours
+        department_id = func.coalesce(AttendanceRecord.department_id, Employee.department_id, 0)
+        aggregate = select(
+            AttendanceRecord.date,
+            department_id,
+            *[func.count(case((AttendanceRecord.status == status, 1))) for status in STATUS_COLUMNS],
+            func.count(AttendanceRecord.id),
+            func.count(work_hours),
+            func.coalesce(func.sum(work_hours), 0),
+            func.max(func.coalesce(AttendanceRecord.updated_at, AttendanceRecord.created_at))
+        ).join(
+            Employee, AttendanceRecord.employee_id == Employee.id
+        ).where(*conditions).group_by(AttendanceRecord.date, department_id)
+
+        result = db.session.execute(
+            insert(cls).from_select(
+                ['date', 'department_id', *STATUS_COLUMNS.values(), 'record_count', 'hours_count',
+                 'sum_hours', 'updated_at'],
+                aggregate
+            )
+        )
+        return result.rowcount
+
+    @classmethod
+    def rebuild(cls):
+        """attendance_records 전체를 다시 집계하여 롤업 테이블 재생성 (커밋은 호출하는 쪽에서 수행)"""
+        db.session.query(cls).delete(synchronize_session=False)
+        return cls._insert_aggregate()
+
+    def to_dict(self):
+        """딕셔너리로 변환"""
+        return {
+            'date': self.date.isoformat() if self.date else None,
+            'department_id': self.department_id or None,
+            'on_time': self.on_time,
+            'late': self.late,
+            'absent': self.absent,
+            'early_leave': self.early_leave,
+            'record_count': self.record_count,
+            'sum_hours': self.sum_hours,
+            'avg_hours': self.sum_hours / self.hours_count if self.hours_count else 0
+        }
+
+    def __repr__(self):
+        return f'<AttendanceDailyStat {self.date} {self.department_id}: {self.record_count}건>'
@@ -4,10 +4,15 @@ from src.models.user import db
 class AttendanceRecord(db.Model):
     """출퇴근 기록 모델"""
     __tablename__ = 'attendance_records'
+    __table_args__ = (
+        # 직원별 일자 기록은 하나 (직원-기간 조회에도 사용)
+        db.Index('uq_attendance_records_employee_date', 'employee_id', 'date', unique=True),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     employee_id = db.Column(db.Integer, db.ForeignKey('employees.id'), nullable=False)
-    date = db.Column(db.Date, nullable=False)
+    department_id = db.Column(db.Integer, nullable=True)  # 기록 당시 직원 소속 부서 (일자/부서별 집계 기준)
+    date = db.Column(db.Date, nullable=False, index=True)
     check_in = db.Column(db.Time, nullable=True)
     check_out = db.Column(db.Time, nullable=True)
     work_hours = db.Column(db.Float, nullable=True)  # 근무 시간 (시간 단위)
@@ -16,6 +21,16 @@ class AttendanceRecord(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
+    @classmethod
+    def for_employee_on(cls, employee_id, day):
+        """직원의 해당 일자 기록 조회 쿼리 ((직원, 일자) 유일 인덱스 사용)"""
+        return cls.query.filter_by(employee_id=employee_id, date=day)
+    
+    @classmethod
+    def date_range(cls, start, end):
+        """기록 일자가 [start, end) 범위인 조건"""
+        return db.and_(cls.date >= start, cls.date < end)
+    
     def calculate_work_hours(self):
         """근무 시간 계산"""
         if self.check_in and self.check_out:
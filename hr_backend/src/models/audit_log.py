@@ -4,6 +4,11 @@ import json
 
 class AuditLog(db.Model):
     __tablename__ = 'audit_logs'
+    __table_args__ = (
+        # Recent-first listings, overall and per user
+        db.Index('ix_audit_logs_created_at', 'created_at'),
+        db.Index('ix_audit_logs_user_created_at', 'user_id', 'created_at'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
@@ -61,6 +66,14 @@ class AuditLog(db.Model):
             'created_at': self.created_at.isoformat() if self.created_at else None
         }
     
+    @classmethod
+    def recent_first(cls, user_id=None):
+        """Newest-first query, optionally limited to one user's entries"""
+        query = cls.query
+        if user_id is not None:
+            query = query.filter(cls.user_id == user_id)
+        return query.order_by(cls.created_at.desc())
+    
     @staticmethod
     def log_action(user_id, action_type, entity_type, entity_id, message, 
                    old_values=None, new_values=None, ip_address=None, user_agent=None):
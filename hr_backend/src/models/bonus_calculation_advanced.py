@@ -1,6 +1,6 @@
 from flask_sqlalchemy import SQLAlchemy
 from datetime import datetime
-from sqlalchemy import func, and_
+from sqlalchemy import func
 
 db = SQLAlchemy()
 
@@ -228,10 +228,7 @@ class BonusCalculationEngine:
         for employee in employees:
             # 해당 기간의 평가 결과 찾기
             evaluation_result = EvaluationResult.query.filter(
-                and_(
-                    EvaluationResult.employee_id == employee.id,
-                    EvaluationResult.status.in_(['완료', '승인'])
-                )
+                EvaluationResult.completed_condition(employee.id)
             ).first()
             
             # 기본 정보 설정
@@ -321,10 +318,7 @@ class BonusCalculationEngine:
         
         for employee in team_employees:
             result = EvaluationResult.query.filter(
-                and_(
-                    EvaluationResult.employee_id == employee.id,
-                    EvaluationResult.status.in_(['완료', '승인'])
-                )
+                EvaluationResult.completed_condition(employee.id)
             ).first()
             
             if result and result.weighted_score:
@@ -340,7 +334,7 @@ class BonusCalculationEngine:
         from .evaluation_simple import EvaluationResult
         
         results = EvaluationResult.query.filter(
-            EvaluationResult.status.in_(['완료', '승인'])
+            EvaluationResult.completed_condition()
         ).all()
         
         if not results:
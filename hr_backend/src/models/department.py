@@ -1,5 +1,6 @@
 from src.models.user import db
 from datetime import datetime
+from sqlalchemy import select
 
 class Department(db.Model):
     __tablename__ = 'departments'
@@ -23,6 +24,21 @@ class Department(db.Model):
     # Relationship with manager
     manager = db.relationship('Employee', backref='managed_department', foreign_keys=[manager_id])
     
+    @classmethod
+    def subtree_mapping(cls):
+        """부서 -> 자기 자신을 포함한 모든 하위 부서 매핑 재귀 CTE (ancestor_id, descendant_id)
+
+        UNION(중복 제거)으로 이어 붙이므로 parent_id가 순환하더라도 재귀가 끝난다.
+        """
+        tree = select(
+            cls.id.label('ancestor_id'),
+            cls.id.label('descendant_id')
+        ).cte('department_tree', recursive=True)
+        child = db.aliased(cls)
+        return tree.union(
+            select(tree.c.ancestor_id, child.id).join(child, child.parent_id == tree.c.descendant_id)
+        )
+
     def __repr__(self):
         return f'<Department {self.code}: {self.name}>'
     
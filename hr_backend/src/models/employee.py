@@ -16,6 +16,9 @@ class Employee(db.Model):
     birth_date = db.Column(db.Date)
     address = db.Column(db.Text)
     salary_grade = db.Column(db.String(10))
+    bank_name = db.Column(db.String(50))  # 급여 이체 은행
+    bank_account_number = db.Column(db.String(50))  # 급여 이체 계좌번호
+    account_holder = db.Column(db.String(100))  # 예금주
     status = db.Column(db.String(20), default='active', nullable=False)  # active, inactive, terminated
     created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -40,6 +43,9 @@ class Employee(db.Model):
             'birth_date': self.birth_date.isoformat() if self.birth_date else None,
             'address': self.address,
             'salary_grade': self.salary_grade,
+            'bank_name': self.bank_name,
+            'bank_account_number': self.bank_account_number,
+            'account_holder': self.account_holder,
             'status': self.status,
             'created_at': self.created_at.isoformat() if self.created_at else None,
             'updated_at': self.updated_at.isoformat() if self.updated_at else None
@@ -49,6 +49,10 @@ class Evaluation(db.Model):
 class EvaluationResult(db.Model):
     """평가 결과 모델"""
     __tablename__ = 'evaluation_results'
+    __table_args__ = (
+        # 직원별 상태(완료/승인) 평가 결과 조회용
+        db.Index('ix_evaluation_results_employee_status', 'employee_id', 'status'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     
@@ -85,6 +89,17 @@ class EvaluationResult(db.Model):
     # 관계
     evaluation_scores = db.relationship("EvaluationScore", backref="evaluation_result", cascade="all, delete-orphan")
     
+    # 점수를 집계에 쓰는 평가 결과 상태
+    COMPLETED_STATUSES = ('완료', '승인')
+    
+    @classmethod
+    def completed_condition(cls, employee_id=None):
+        """완료/승인된 평가 결과 조건 (employee_id가 있으면 해당 직원으로 한정)"""
+        condition = cls.status.in_(cls.COMPLETED_STATUSES)
+        if employee_id is not None:
+            condition = db.and_(cls.employee_id == employee_id, condition)
+        return condition
+    
     def to_dict(self):
         return {
             'id': self.id,
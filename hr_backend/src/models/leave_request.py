@@ -4,6 +4,10 @@ from src.models.user import db
 class LeaveRequest(db.Model):
     """휴가 신청 모델"""
     __tablename__ = 'leave_requests'
+    __table_args__ = (
+        # 직원별 상태(대기/승인) 휴가 신청 조회용
+        db.Index('ix_leave_requests_employee_status', 'employee_id', 'status'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     employee_id = db.Column(db.Integer, db.ForeignKey('employees.id'), nullable=False)
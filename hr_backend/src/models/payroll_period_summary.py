@@ -0,0 +1,91 @@
+from datetime import datetime
+from sqlalchemy import Column, Integer, String, Float, DateTime, func, case, insert, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from .user import db
+from .payroll_record import PayrollRecord
+
+class PayrollPeriodSummary(db.Model):
+    """급여 기간별 집계 모델 (payroll_records 롤업)
+
+    급여명세서 생성/수정/확정/삭제 시 같은 트랜잭션 안에서 증분 갱신된다.
+    """
+    __tablename__ = 'payroll_period_summaries'
+    
+    period = Column(String(20), primary_key=True)  # 급여 지급 기간 (예: 2025-01)
+    year = Column(Integer, nullable=False)
+    month = Column(Integer, nullable=False)
+    
+    employee_count = Column(Integer, nullable=False, default=0)  # 급여명세서 수
+    total_gross_pay = Column(Float, nullable=False, default=0)  # 총 지급액 합계
+    total_net_pay = Column(Float, nullable=False, default=0)  # 실지급액 합계
+    finalized_count = Column(Integer, nullable=False, default=0)  # 확정된 급여명세서 수
+    
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    @classmethod
+    def apply_delta(cls, period, employee_count=0, gross_pay=0, net_pay=0, finalized_count=0):
+        """기간 집계에 변화량 반영 (커밋은 호출하는 쪽에서 수행)
+
+        같은 기간 행을 여러 요청이 동시에 갱신하므로 읽고-더하고-쓰는 대신
+        INSERT ... ON CONFLICT DO UPDATE 한 문장으로 DB에서 값을 누적한다.
+        """
+        year, month = (int(value) for value in period.split('-'))
+        values = {
+            'employee_count': employee_count,
+            'total_gross_pay': gross_pay,
+            'total_net_pay': net_pay,
+            'finalized_count': finalized_count,
+        }
+        statement = sqlite_insert(cls).values(
+            period=period,
+            year=year,
+            month=month,
+            updated_at=datetime.utcnow(),
+            **values
+        )
+        db.session.execute(statement.on_conflict_do_update(
+            index_elements=['period'],
+            set_={
+                **{column: getattr(cls, column) + statement.excluded[column] for column in values},
+                'updated_at': statement.excluded.updated_at
+            }
+        ))
+    
+    @classmethod
+    def rebuild(cls):
+        """payroll_records 전체를 다시 집계하여 롤업 테이블 재생성 (커밋은 호출하는 쪽에서 수행)"""
+        db.session.query(cls).delete(synchronize_session=False)
+        
+        aggregate = select(
+            PayrollRecord.period,
+            func.min(PayrollRecord.year),
+            func.min(PayrollRecord.month),
+            func.count(PayrollRecord.id),
+            func.coalesce(func.sum(PayrollRecord.gross_pay), 0),
+            func.coalesce(func.sum(PayrollRecord.net_pay), 0),
+            func.coalesce(func.sum(case((PayrollRecord.is_final.is_(True), 1), else_=0)), 0),
+            func.max(func.coalesce(PayrollRecord.updated_at, PayrollRecord.created_at))
+        ).group_by(PayrollRecord.period)
+        
+        db.session.execute(
+            insert(cls).from_select(
+                ['period', 'year', 'month', 'employee_count', 'total_gross_pay',
+                 'total_net_pay', 'finalized_count', 'updated_at'],
+                aggregate
+            )
+        )
+        return db.session.query(func.count(cls.period)).scalar()
+    
+    def to_dict(self):
+        """딕셔너리로 변환"""
+        return {
+            'period': self.period,
+            'employee_count': self.employee_count,
+            'total_gross_pay': self.total_gross_pay,
+            'total_net_pay': self.total_net_pay,
+            'average_gross_pay': self.total_gross_pay / self.employee_count if self.employee_count else 0,
+            'finalized_count': self.finalized_count
+        }
+    
+    def __repr__(self):
+        return f'<PayrollPeriodSummary {self.period}: {self.employee_count}건>'
@@ -0,0 +1,220 @@
+from datetime import datetime, timedelta
+from sqlalchemy import Column, Integer, String, Float, DateTime, Text, ForeignKey, update, tuple_, and_, or_
+from .user import db
+from .payroll_record import PayrollRecord
+from .payroll_period_summary import PayrollPeriodSummary
+from .payroll_year_settlement import PayrollYearSettlement
+from .audit_log import AuditLog
+from ..utils import tax_engine
+
+class ClaimLost(Exception):
+    """실행 중에 다른 워커가 작업 점유를 가져감 (heartbeat가 만료된 뒤 재개된 경우)"""
+
+class PayrollRecalcJob(db.Model):
+    """초안 급여명세서 일괄 재계산 작업 모델
+
+    요율/정책 변경 후 기간 범위의 초안 급여명세서를 id 순으로 chunk_size건씩 다시 계산한다.
+    각 묶음의 급여명세서 갱신과 진행 위치(last_record_id) 저장을 한 트랜잭션으로 커밋하므로,
+    중간에 프로세스가 죽어도 마지막으로 커밋된 위치 다음부터 이어서 실행할 수 있다.
+
+    실행은 claim()으로 데이터베이스에서 점유하며(owner), 점유한 워커는 묶음마다 heartbeat_at을 갱신한다.
+    heartbeat가 HEARTBEAT_TIMEOUT보다 오래된 running 작업은 워커가 죽은 것으로 보고 다시 점유할 수 있다.
+    """
+    __tablename__ = 'payroll_recalc_jobs'
+
+    HEARTBEAT_TIMEOUT = timedelta(minutes=5)
+
+    id = Column(Integer, primary_key=True)
+    start_period = Column(String(20), nullable=False)  # 대상 시작 기간 (예: 2025-01)
+    end_period = Column(String(20), nullable=False)  # 대상 종료 기간 (포함)
+    chunk_size = Column(Integer, nullable=False, default=500)
+
+    status = Column(String(20), nullable=False, default='queued')  # queued, running, completed, failed
+    total_count = Column(Integer, nullable=False, default=0)  # 시작 시점의 대상 건수
+    processed_count = Column(Integer, nullable=False, default=0)  # 처리한 건수
+    updated_count = Column(Integer, nullable=False, default=0)  # 금액이 바뀐 건수
+    last_record_id = Column(Integer, nullable=False, default=0)  # 마지막으로 커밋된 급여명세서 id
+    gross_pay_delta = Column(Float, nullable=False, default=0)  # 총 지급액 변화량 합계
+    net_pay_delta = Column(Float, nullable=False, default=0)  # 실지급액 변화량 합계
+    error_message = Column(Text)
+    owner = Column(String(100))  # 실행을 점유한 워커 (호스트:프로세스:토큰)
+    heartbeat_at = Column(DateTime)  # 점유한 워커가 마지막으로 진행을 커밋한 시각
+
+    created_by = Column(Integer, ForeignKey('users.id'), nullable=False)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+    finished_at = Column(DateTime)
+
+    @classmethod
+    def claim(cls, job_id, owner):
+        """작업 실행 점유 (queued/failed 또는 heartbeat가 끊긴 running 작업만, 성공 여부 반환)
+
+        상태를 조건으로 건 UPDATE 한 번으로 점유하므로 여러 워커 프로세스가 동시에 요청해도 한 곳만 성공한다.
+        """
+        now = datetime.utcnow()
+        result = db.session.execute(
+            update(cls).where(
+                cls.id == job_id,
+                or_(
+                    cls.status.in_(('queued', 'failed')),
+                    and_(
+                        cls.status == 'running',
+                        or_(cls.heartbeat_at.is_(None), cls.heartbeat_at < now - cls.HEARTBEAT_TIMEOUT)
+                    )
+                )
+            ).values(
+                status='running', owner=owner, heartbeat_at=now, error_message=None, updated_at=now
+            ).execution_options(synchronize_session=False)
+        )
+        db.session.commit()
+        return result.rowcount == 1
+
+    @classmethod
+    def release(cls, job_id, owner, error_message):
+        """점유한 작업을 실행하지 못했을 때 failed로 되돌림 (resume으로 다시 점유 가능)"""
+        db.session.execute(
+            update(cls).where(cls.id == job_id, cls.owner == owner).values(
+                status='failed', error_message=error_message, updated_at=datetime.utcnow()
+            ).execution_options(synchronize_session=False)
+        )
+        db.session.commit()
+
+    def _renew_claim(self, owner, now):
+        """커밋 전에 점유 확인 후 heartbeat 갱신 (점유를 잃었으면 롤백 후 ClaimLost)"""
+        result = db.session.execute(
+            update(PayrollRecalcJob).where(
+                PayrollRecalcJob.id == self.id, PayrollRecalcJob.owner == owner
+            ).values(heartbeat_at=now).execution_options(synchronize_session=False)
+        )
+        if result.rowcount != 1:
+            db.session.rollback()
+            raise ClaimLost(f'급여 일괄 재계산 작업 {self.id}을 다른 워커가 점유했습니다.')
+
+    def _target_filter(self):
+        start_year, start_month = (int(value) for value in self.start_period.split('-'))
+        end_year, end_month = (int(value) for value in self.end_period.split('-'))
+        return (
+            PayrollRecord.status == '초안',
+            PayrollRecord.is_final.is_(False),
+            tuple_(PayrollRecord.year, PayrollRecord.month).between((start_year, start_month), (end_year, end_month))
+        )
+
+    def count_targets(self):
+        """대상 초안 급여명세서 수"""
+        return db.session.query(db.func.count(PayrollRecord.id)).filter(*self._target_filter()).scalar()
+
+    def process_next_chunk(self, user_id, owner):
+        """다음 묶음 재계산 후 heartbeat와 함께 커밋 (남은 대상이 없으면 False)"""
+        input_columns = [getattr(PayrollRecord, field) for field in tax_engine.INPUT_FIELDS]
+        result_columns = [getattr(PayrollRecord, field) for field in tax_engine.RESULT_FIELDS]
+        records = db.session.query(
+            PayrollRecord.id, PayrollRecord.employee_id, PayrollRecord.period, PayrollRecord.year, *input_columns, *result_columns
+        ).filter(
+            *self._target_filter(),
+            PayrollRecord.id > self.last_record_id
+        ).order_by(PayrollRecord.id).limit(self.chunk_size).all()
+
+        if not records:
+            return False
+
+        rows = [
+            {field: getattr(record, field) for field in ('id', 'year') + tax_engine.INPUT_FIELDS}
+            for record in records
+        ]
+        PayrollRecord.calculate_batch(rows)
+
+        now = datetime.utcnow()
+        updates = []
+        period_deltas = {}
+        settlement_keys = set()
+        for record, row in zip(records, rows):
+            if all(abs(row[field] - (getattr(record, field) or 0)) < 1e-6 for field in tax_engine.RESULT_FIELDS):
+                continue
+            updates.append({
+                'id': record.id,
+                'updated_by': user_id,
+                'updated_at': now,
+                **{field: row[field] for field in tax_engine.RESULT_FIELDS}
+            })
+            settlement_keys.add((record.year, record.employee_id))
+            gross_delta, net_delta = period_deltas.get(record.period, (0, 0))
+            period_deltas[record.period] = (
+                gross_delta + row['gross_pay'] - record.gross_pay,
+                net_delta + row['net_pay'] - record.net_pay
+            )
+
+        if updates:
+            db.session.execute(update(PayrollRecord), updates)
+        for period, (gross_delta, net_delta) in period_deltas.items():
+            PayrollPeriodSummary.apply_delta(period, gross_pay=gross_delta, net_pay=net_delta)
+            self.gross_pay_delta += gross_delta
+            self.net_pay_delta += net_delta
+        PayrollYearSettlement.refresh_many(settlement_keys)
+
+        self.processed_count += len(records)
+        self.updated_count += len(updates)
+        self.last_record_id = records[-1].id
+        self.updated_at = now
+        self._renew_claim(owner, now)
+        db.session.commit()
+        return True
+
+    def run(self, user_id, owner):
+        """claim()으로 점유한 작업의 남은 묶음을 모두 처리하고 완료 시 요약 감사 로그 1건 기록 (백그라운드 스레드에서 호출)
+
+        오류가 나면 진행 중이던 묶음만 롤백하고 작업을 failed로 남긴다 (resume으로 재개 가능).
+        다른 워커가 점유를 가져갔으면 상태를 바꾸지 않고 ClaimLost를 올린다.
+        """
+        try:
+            while self.process_next_chunk(user_id, owner):
+                pass
+        except ClaimLost:
+            raise
+        except Exception as e:
+            db.session.rollback()
+            self.status = 'failed'
+            self.error_message = str(e)
+            self._renew_claim(owner, datetime.utcnow())
+            db.session.commit()
+            raise
+
+        self.status = 'completed'
+        self.finished_at = datetime.utcnow()
+        AuditLog.log_action(
+            user_id=user_id,
+            action_type='UPDATE',
+            entity_type='payroll_recalculation',
+            entity_id=self.id,
+            message=f'초안 급여명세서 일괄 재계산: {self.start_period} ~ {self.end_period} '
+                    f'({self.processed_count}건 처리, {self.updated_count}건 변경)',
+            new_values=self.to_dict()
+        )
+        self._renew_claim(owner, self.finished_at)
+        db.session.commit()
+
+    def to_dict(self):
+        """딕셔너리로 변환"""
+        return {
+            'id': self.id,
+            'start_period': self.start_period,
+            'end_period': self.end_period,
+            'chunk_size': self.chunk_size,
+            'status': self.status,
+            'total_count': self.total_count,
+            'processed_count': self.processed_count,
+            'updated_count': self.updated_count,
+            'progress': round(min(self.processed_count / self.total_count, 1) * 100, 1) if self.total_count else 100.0,
+            'last_record_id': self.last_record_id,
+            'gross_pay_delta': self.gross_pay_delta,
+            'net_pay_delta': self.net_pay_delta,
+            'error_message': self.error_message,
+            'owner': self.owner,
+            'heartbeat_at': self.heartbeat_at.isoformat() if self.heartbeat_at else None,
+            'created_by': self.created_by,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None,
+            'finished_at': self.finished_at.isoformat() if self.finished_at else None
+        }
+
+    def __repr__(self):
+        return f'<PayrollRecalcJob {self.id}: {self.start_period}~{self.end_period} {self.status}>'
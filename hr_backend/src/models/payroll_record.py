@@ -1,11 +1,18 @@
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Float, DateTime, Text, ForeignKey, Boolean
+from sqlalchemy import Column, Integer, String, Float, DateTime, Text, ForeignKey, Boolean, Index, select, func, desc, tuple_, and_
 from sqlalchemy.orm import relationship
 from .user import db
+from ..utils import tax_engine
 
 class PayrollRecord(db.Model):
     """급여명세서 모델"""
     __tablename__ = 'payroll_records'
+    __table_args__ = (
+        # 직원별 최근 급여명세서 조회 / 직원-기간 조회용
+        Index('ix_payroll_records_employee_year_month', 'employee_id', 'year', 'month'),
+        # 기간별 조회 / 직원-기간 중복 방지용
+        Index('uq_payroll_records_period_employee', 'period', 'employee_id', unique=True),
+    )
     
     id = Column(Integer, primary_key=True)
     employee_id = Column(Integer, ForeignKey('employees.id'), nullable=False)
@@ -74,6 +81,17 @@ class PayrollRecord(db.Model):
     creator = relationship('User', foreign_keys=[created_by])
     updater = relationship('User', foreign_keys=[updated_by])
     
+    # 수당 / 보너스 / 기타 공제 항목 (직접 입력)
+    ALLOWANCE_FIELDS = tax_engine.ALLOWANCE_FIELDS
+    BONUS_FIELDS = tax_engine.BONUS_FIELDS
+    MANUAL_DEDUCTION_FIELDS = tax_engine.MANUAL_DEDUCTION_FIELDS
+
+    # 매월 반복되는 항목 (급여 일괄 생성 시 이전 급여에서 복사)
+    RECURRING_FIELDS = (
+        'basic_salary', 'position_allowance', 'meal_allowance', 'transport_allowance',
+        'family_allowance', 'union_fee'
+    )
+
     def __init__(self, **kwargs):
         super(PayrollRecord, self).__init__(**kwargs)
         if self.period:
@@ -81,7 +99,7 @@ class PayrollRecord(db.Model):
             if len(year_month) == 2:
                 self.year = int(year_month[0])
                 self.month = int(year_month[1])
-    
+
     def calculate_totals(self):
         """총액 계산"""
         # 총 수당 계산
@@ -108,35 +126,47 @@ class PayrollRecord(db.Model):
         self.net_pay = self.gross_pay - self.total_deductions
     
     def calculate_tax_and_insurance(self):
-        """세금 및 보험료 자동 계산 (간단한 계산식)"""
-        # 국민연금 (4.5%, 상한액 적용)
-        pension_base = min(self.basic_salary + self.total_allowances, 5530000)  # 2025년 기준 상한액
-        self.national_pension = pension_base * 0.045
-        
-        # 건강보험 (3.545%)
-        health_base = self.basic_salary + self.total_allowances
-        self.health_insurance = health_base * 0.03545
-        
-        # 장기요양보험 (건강보험료의 12.95%)
-        self.long_term_care = self.health_insurance * 0.1295
-        
-        # 고용보험 (0.9%)
-        self.employment_insurance = (self.basic_salary + self.total_allowances) * 0.009
-        
-        # 소득세 (간단한 계산 - 실제로는 더 복잡)
-        taxable_income = self.gross_pay - (self.national_pension + self.health_insurance + self.employment_insurance)
-        if taxable_income <= 1200000:
-            self.income_tax = taxable_income * 0.06
-        elif taxable_income <= 4600000:
-            self.income_tax = 72000 + (taxable_income - 1200000) * 0.15
-        elif taxable_income <= 8800000:
-            self.income_tax = 582000 + (taxable_income - 4600000) * 0.24
-        else:
-            self.income_tax = 1590000 + (taxable_income - 8800000) * 0.35
-        
-        # 지방소득세 (소득세의 10%)
-        self.local_tax = self.income_tax * 0.1
-    
+        """세금 및 보험료 자동 계산 (급여 연도의 요율표 적용, tax_engine.compute_batch 사용)
+
+        총 수당, 총 보너스, 총 지급액, 총 공제액, 실지급액도 함께 갱신한다.
+        """
+        row = {field: getattr(self, field) for field in tax_engine.INPUT_FIELDS}
+        row['year'] = self.year
+        tax_engine.compute_batch([row])
+        for field in tax_engine.RESULT_FIELDS:
+            setattr(self, field, row[field])
+
+    @classmethod
+    def latest_per_employee(cls, before=None, employee_ids=None):
+        """직원별 가장 최근 급여명세서 id 서브쿼리 (employee_id, id)
+
+        (employee_id, year, month) 인덱스를 타는 ROW_NUMBER() 윈도 함수 한 번으로 구한다.
+        before=(year, month)를 주면 그 기간보다 이전 급여명세서 중에서 고르고,
+        employee_ids(목록 또는 서브쿼리)를 주면 해당 직원만 계산한다.
+        """
+        ranked = select(
+            cls.employee_id,
+            cls.id,
+            func.row_number().over(
+                partition_by=cls.employee_id,
+                order_by=(desc(cls.year), desc(cls.month), desc(cls.id))
+            ).label('row_number')
+        )
+        if before:
+            ranked = ranked.where(tuple_(cls.year, cls.month) < tuple(before))
+        if employee_ids is not None:
+            ranked = ranked.where(cls.employee_id.in_(employee_ids))
+        ranked = ranked.subquery()
+        return select(ranked.c.employee_id, ranked.c.id).where(ranked.c.row_number == 1).subquery()
+
+    @classmethod
+    def calculate_batch(cls, rows):
+        """여러 급여 행(dict)의 총액, 세금 및 보험료를 한 번에 계산 (tax_engine.compute_batch)
+
+        벌크 insert/update에 바로 넘길 수 있도록 rows를 그대로 반환한다.
+        """
+        return tax_engine.compute_batch(rows)
+
     def to_dict(self):
         """딕셔너리로 변환"""
         return {
@@ -211,10 +241,22 @@ class PayrollRecord(db.Model):
             } if self.creator else None
         }
     
+    @classmethod
+    def period_range(cls, start_period, end_period=None):
+        """급여 기간 코드(YYYY-MM)가 [start_period, end_period) 범위인 조건 (end_period가 없으면 이후 전체)"""
+        if end_period is None:
+            return cls.period >= start_period
+        return and_(cls.period >= start_period, cls.period < end_period)
+    
+    @classmethod
+    def by_employee_and_period(cls, employee_id, period):
+        """직원과 기간으로 급여명세서 조회 쿼리"""
+        return cls.query.filter_by(employee_id=employee_id, period=period)
+    
     @classmethod
     def get_by_employee_and_period(cls, employee_id, period):
         """직원과 기간으로 급여명세서 조회"""
-        return cls.query.filter_by(employee_id=employee_id, period=period).first()
+        return cls.by_employee_and_period(employee_id, period).first()
     
     @classmethod
     def get_by_period(cls, period):
@@ -0,0 +1,125 @@
+from datetime import datetime
+from sqlalchemy import Column, Integer, Float, DateTime, ForeignKey, UniqueConstraint, func, case, insert, select, delete
+from sqlalchemy.orm import relationship
+from .user import db
+from .payroll_record import PayrollRecord
+from ..utils import tax_engine
+
+class PayrollYearSettlement(db.Model):
+    """연말정산용 직원별 연간 급여 합계 모델 (payroll_records의 (직원, 연도) 롤업)
+
+    급여명세서가 생성/수정/확정/삭제되면 같은 트랜잭션 안에서 해당 (직원, 연도) 행만 다시 집계된다.
+    """
+    __tablename__ = 'payroll_year_settlements'
+    __table_args__ = (
+        UniqueConstraint('employee_id', 'year', name='uq_payroll_year_settlements_employee_year'),
+    )
+
+    id = Column(Integer, primary_key=True)
+    employee_id = Column(Integer, ForeignKey('employees.id'), nullable=False)
+    year = Column(Integer, nullable=False, index=True)
+
+    record_count = Column(Integer, nullable=False, default=0)  # 급여명세서 수
+    finalized_count = Column(Integer, nullable=False, default=0)  # 확정된 급여명세서 수
+
+    # 지급 항목 연간 합계
+    basic_salary = Column(Float, nullable=False, default=0)  # 기본급
+    position_allowance = Column(Float, nullable=False, default=0)  # 직책수당
+    meal_allowance = Column(Float, nullable=False, default=0)  # 식대
+    transport_allowance = Column(Float, nullable=False, default=0)  # 교통비
+    family_allowance = Column(Float, nullable=False, default=0)  # 가족수당
+    overtime_allowance = Column(Float, nullable=False, default=0)  # 연장근무수당
+    night_allowance = Column(Float, nullable=False, default=0)  # 야간근무수당
+    holiday_allowance = Column(Float, nullable=False, default=0)  # 휴일근무수당
+    other_allowances = Column(Float, nullable=False, default=0)  # 기타수당
+    performance_bonus = Column(Float, nullable=False, default=0)  # 성과급
+    annual_bonus = Column(Float, nullable=False, default=0)  # 연말보너스
+    special_bonus = Column(Float, nullable=False, default=0)  # 특별보너스
+    total_allowances = Column(Float, nullable=False, default=0)  # 총 수당
+    total_bonus = Column(Float, nullable=False, default=0)  # 총 보너스
+    gross_pay = Column(Float, nullable=False, default=0)  # 총 지급액
+
+    # 공제 항목 연간 합계
+    national_pension = Column(Float, nullable=False, default=0)  # 국민연금
+    health_insurance = Column(Float, nullable=False, default=0)  # 건강보험
+    long_term_care = Column(Float, nullable=False, default=0)  # 장기요양보험
+    employment_insurance = Column(Float, nullable=False, default=0)  # 고용보험
+    income_tax = Column(Float, nullable=False, default=0)  # 소득세
+    local_tax = Column(Float, nullable=False, default=0)  # 지방소득세
+    union_fee = Column(Float, nullable=False, default=0)  # 조합비
+    other_deductions = Column(Float, nullable=False, default=0)  # 기타공제
+    total_deductions = Column(Float, nullable=False, default=0)  # 총 공제액
+    net_pay = Column(Float, nullable=False, default=0)  # 실지급액
+
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    employee = relationship('Employee')
+
+    # 연간 합계를 내는 급여명세서 금액 항목 (급여명세서와 같은 컬럼 이름)
+    AMOUNT_FIELDS = tax_engine.INPUT_FIELDS + tax_engine.RESULT_FIELDS
+
+    @classmethod
+    def refresh(cls, year, employee_ids=None):
+        """해당 연도(employee_ids를 주면 그 직원들만)의 연간 합계를 다시 집계 (커밋은 호출하는 쪽에서 수행)
+
+        기존 행을 지우고 payroll_records를 GROUP BY employee_id 한 번으로 집계해 insert 한다.
+        급여명세서가 모두 삭제된 직원의 행은 다시 생기지 않는다. 집계한 직원 수를 반환한다.
+        """
+        db.session.flush()
+
+        stale = delete(cls).where(cls.year == year)
+        aggregate = select(
+            PayrollRecord.employee_id,
+            PayrollRecord.year,
+            func.count(PayrollRecord.id),
+            func.coalesce(func.sum(case((PayrollRecord.is_final.is_(True), 1), else_=0)), 0),
+            *[func.coalesce(func.sum(getattr(PayrollRecord, field)), 0) for field in cls.AMOUNT_FIELDS],
+            func.max(func.coalesce(PayrollRecord.updated_at, PayrollRecord.created_at))
+        ).where(PayrollRecord.year == year).group_by(PayrollRecord.employee_id, PayrollRecord.year)
+
+        if employee_ids is not None:
+            employee_ids = list(employee_ids)
+            if not employee_ids:
+                return 0
+            stale = stale.where(cls.employee_id.in_(employee_ids))
+            aggregate = aggregate.where(PayrollRecord.employee_id.in_(employee_ids))
+
+        db.session.execute(stale)
+        result = db.session.execute(
+            insert(cls).from_select(
+                ['employee_id', 'year', 'record_count', 'finalized_count', *cls.AMOUNT_FIELDS, 'updated_at'],
+                aggregate
+            )
+        )
+        return result.rowcount
+
+    @classmethod
+    def refresh_many(cls, keys):
+        """(연도, 직원 id) 목록의 연간 합계를 연도별로 묶어 다시 집계"""
+        employees_by_year = {}
+        for year, employee_id in keys:
+            employees_by_year.setdefault(year, set()).add(employee_id)
+        for year, employee_ids in employees_by_year.items():
+            cls.refresh(year, employee_ids)
+
+    @classmethod
+    def rebuild(cls):
+        """모든 연도의 연간 합계 재생성 (커밋은 호출하는 쪽에서 수행) -> 집계한 (직원, 연도) 수"""
+        years = [row.year for row in db.session.query(PayrollRecord.year).distinct().all()]
+        db.session.query(cls).delete(synchronize_session=False)
+        return sum(cls.refresh(year) for year in years)
+
+    def to_dict(self):
+        """딕셔너리로 변환"""
+        return {
+            'id': self.id,
+            'employee_id': self.employee_id,
+            'year': self.year,
+            'record_count': self.record_count,
+            'finalized_count': self.finalized_count,
+            **{field: getattr(self, field) for field in self.AMOUNT_FIELDS},
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+        }
+
+    def __repr__(self):
+        return f'<PayrollYearSettlement {self.employee_id}-{self.year}>'
@@ -0,0 +1,34 @@
+from sqlalchemy import Column, Integer, String, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from .user import db
+
+class TableVersion(db.Model):
+    """테이블별 변경 카운터 모델 (ETag 계산용)
+
+    커밋되는 쓰기와 같은 트랜잭션 안에서 1씩 올리므로, 같은 데이터베이스를 쓰는 모든 워커 프로세스가
+    같은 값을 본다.
+    """
+    __tablename__ = 'table_versions'
+
+    table_name = Column(String(100), primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+
+    @classmethod
+    def bump(cls, executor, tables):
+        """테이블 카운터 증가 (executor는 세션 또는 커넥션, 커밋은 호출하는 쪽에서 수행)"""
+        statement = sqlite_insert(cls).values([{'table_name': table, 'version': 1} for table in sorted(tables)])
+        executor.execute(statement.on_conflict_do_update(
+            index_elements=['table_name'],
+            set_={'version': cls.version + 1}
+        ))
+
+    @classmethod
+    def current(cls, tables=None):
+        """{테이블: 버전} (tables가 없으면 전체, 카운터가 없는 테이블은 빠짐)"""
+        statement = select(cls.table_name, cls.version)
+        if tables is not None:
+            statement = statement.where(cls.table_name.in_(tables))
+        return dict(db.session.execute(statement.order_by(cls.table_name)).all())
+
+    def __repr__(self):
+        return f'<TableVersion {self.table_name}: {self.version}>'
@@ -9,11 +9,13 @@ from src.models.leave_request import LeaveRequest
 from src.models.employee import Employee
 from src.utils.auth import admin_required
 from src.utils.audit import log_action
+from src.utils.change_tracking import etag_cached
 
 annual_leave_bp = Blueprint('annual_leave', __name__)
 
 @annual_leave_bp.route('/annual-leave/grants', methods=['GET'])
 @jwt_required()
+@etag_cached(tables=('annual_leave_grants', 'employees'))
 def get_annual_leave_grants():
     """연차 부여 내역 조회"""
     try:
@@ -86,10 +88,7 @@ def create_annual_leave_grant():
             return jsonify({'error': '직원을 찾을 수 없습니다.'}), 404
         
         # 중복 부여 확인
-        existing_grant = AnnualLeaveGrant.query.filter_by(
-            employee_id=data['employee_id'],
-            year=data['year']
-        ).first()
+        existing_grant = AnnualLeaveGrant.for_employee_year(data['employee_id'], data['year']).first()
         
         if existing_grant:
             return jsonify({'error': f'{data["year"]}년도 연차가 이미 부여되었습니다.'}), 400
@@ -135,6 +134,7 @@ def create_annual_leave_grant():
 
 @annual_leave_bp.route('/annual-leave/usages', methods=['GET'])
 @jwt_required()
+@etag_cached(tables=('annual_leave_usages', 'employees'))
 def get_annual_leave_usages():
     """연차 사용 내역 조회"""
     try:
@@ -222,19 +222,12 @@ def get_annual_leave_balance(employee_id):
         year = request.args.get('year', datetime.now().year, type=int)
         
         # 부여된 연차 조회
-        grant = AnnualLeaveGrant.query.filter_by(
-            employee_id=employee_id,
-            year=year
-        ).first()
+        grant = AnnualLeaveGrant.for_employee_year(employee_id, year).first()
         
         total_granted = grant.total_days if grant else 0
         
         # 사용한 연차 조회
-        used_query = db.session.query(func.sum(AnnualLeaveUsage.used_days)).filter(
-            AnnualLeaveUsage.employee_id == employee_id,
-            func.extract('year', AnnualLeaveUsage.usage_date) == year
-        )
-        total_used = used_query.scalar() or 0
+        total_used = AnnualLeaveUsage.used_days_in_year(employee_id, year)
         
         # 잔여 연차 계산
         remaining = total_granted - total_used
@@ -267,19 +260,12 @@ def get_my_annual_leave_balance():
         year = request.args.get('year', datetime.now().year, type=int)
         
         # 부여된 연차 조회
-        grant = AnnualLeaveGrant.query.filter_by(
-            employee_id=employee.id,
-            year=year
-        ).first()
+        grant = AnnualLeaveGrant.for_employee_year(employee.id, year).first()
         
         total_granted = grant.total_days if grant else 0
         
         # 사용한 연차 조회
-        used_query = db.session.query(func.sum(AnnualLeaveUsage.used_days)).filter(
-            AnnualLeaveUsage.employee_id == employee.id,
-            func.extract('year', AnnualLeaveUsage.usage_date) == year
-        )
-        total_used = used_query.scalar() or 0
+        total_used = AnnualLeaveUsage.used_days_in_year(employee.id, year)
         
         # 잔여 연차 계산
         remaining = total_granted - total_used
@@ -324,20 +310,13 @@ def use_annual_leave():
         
         # 연차 잔여일수 확인
         year = usage_date.year
-        grant = AnnualLeaveGrant.query.filter_by(
-            employee_id=data['employee_id'],
-            year=year
-        ).first()
+        grant = AnnualLeaveGrant.for_employee_year(data['employee_id'], year).first()
         
         if not grant:
             return jsonify({'error': f'{year}년도 연차가 부여되지 않았습니다.'}), 400
         
         # 사용한 연차 조회
-        used_query = db.session.query(func.sum(AnnualLeaveUsage.used_days)).filter(
-            AnnualLeaveUsage.employee_id == data['employee_id'],
-            func.extract('year', AnnualLeaveUsage.usage_date) == year
-        )
-        total_used = used_query.scalar() or 0
+        total_used = AnnualLeaveUsage.used_days_in_year(data['employee_id'], year)
         
         # 잔여 연차 확인
         remaining = grant.total_days - total_used
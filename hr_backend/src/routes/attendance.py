@@ -4,14 +4,17 @@ from datetime import datetime, date, time
 from sqlalchemy import and_, or_, desc
 from src.models.user import db
 from src.models.attendance_record import AttendanceRecord
+from src.models.attendance_daily_stat import AttendanceDailyStat
 from src.models.employee import Employee
 from src.utils.auth import admin_required
 from src.utils.audit import log_action
+from src.utils.change_tracking import etag_cached
 
 attendance_bp = Blueprint('attendance', __name__)
 
 @attendance_bp.route('/attendance', methods=['GET'])
 @jwt_required()
+@etag_cached(tables=('attendance_records', 'employees'))
 def get_attendance_records():
     """출퇴근 기록 조회"""
     try:
@@ -118,10 +121,7 @@ def create_attendance_record():
             return jsonify({'error': '날짜 형식이 올바르지 않습니다.'}), 400
         
         # 중복 기록 확인
-        existing_record = AttendanceRecord.query.filter_by(
-            employee_id=employee_id,
-            date=record_date
-        ).first()
+        existing_record = AttendanceRecord.for_employee_on(employee_id, record_date).first()
         
         if existing_record:
             return jsonify({'error': '해당 날짜의 출퇴근 기록이 이미 존재합니다.'}), 400
@@ -151,6 +151,7 @@ def create_attendance_record():
         # 출퇴근 기록 생성
         record = AttendanceRecord(
             employee_id=employee_id,
+            department_id=employee.department_id or 0,
             date=record_date,
             check_in=check_in_time,
             check_out=check_out_time,
@@ -162,6 +163,7 @@ def create_attendance_record():
         record.determine_status()
         
         db.session.add(record)
+        AttendanceDailyStat.apply_record(record, 1)
         db.session.commit()
         
         # 감사 로그 기록
@@ -207,6 +209,9 @@ def update_attendance_record(record_id):
         
         data = request.get_json()
         
+        # 변경 전 기록을 일별 집계에서 제외 (변경 후 다시 반영)
+        AttendanceDailyStat.apply_record(record, -1)
+        
         # 시간 업데이트
         if 'check_in' in data:
             if data['check_in']:
@@ -238,6 +243,7 @@ def update_attendance_record(record_id):
         # 근무 시간 재계산 및 상태 재결정
         record.calculate_work_hours()
         record.determine_status()
+        AttendanceDailyStat.apply_record(record, 1)
         
         db.session.commit()
         
@@ -247,7 +253,7 @@ def update_attendance_record(record_id):
             action_type='UPDATE',
             entity_type='attendance_record',
             entity_id=record.id,
-            message=f'출퇴근 기록 수정: {record.employee.name} ({record.date})'
+            message=f'출퇴근 기록 수정: {Employee.query.get(record.employee_id).name} ({record.date})'
         )
         
         return jsonify({
@@ -261,7 +267,7 @@ def update_attendance_record(record_id):
 
 @attendance_bp.route('/attendance/<int:record_id>', methods=['DELETE'])
 @admin_required
-def delete_attendance_record(record_id):
+def delete_attendance_record(current_user, record_id):
     """출퇴근 기록 삭제 (관리자만)"""
     try:
         current_user_id = get_jwt_identity()
@@ -270,9 +276,10 @@ def delete_attendance_record(record_id):
         if not record:
             return jsonify({'error': '출퇴근 기록을 찾을 수 없습니다.'}), 404
         
-        employee_name = record.employee.name
+        employee_name = Employee.query.get(record.employee_id).name
         record_date = record.date
         
+        AttendanceDailyStat.apply_record(record, -1)
         db.session.delete(record)
         db.session.commit()
         
@@ -307,18 +314,17 @@ def check_in():
         current_time = datetime.now().time()
         
         # 오늘 기록 확인
-        existing_record = AttendanceRecord.query.filter_by(
-            employee_id=employee.id,
-            date=today
-        ).first()
+        existing_record = AttendanceRecord.for_employee_on(employee.id, today).first()
         
         if existing_record:
             if existing_record.check_in:
                 return jsonify({'error': '이미 출근 등록이 완료되었습니다.'}), 400
             else:
                 # 기존 기록에 출근 시간 추가
+                AttendanceDailyStat.apply_record(existing_record, -1)
                 existing_record.check_in = current_time
                 existing_record.determine_status()
+                AttendanceDailyStat.apply_record(existing_record, 1)
                 db.session.commit()
                 
                 log_action(
@@ -337,12 +343,14 @@ def check_in():
             # 새 기록 생성
             record = AttendanceRecord(
                 employee_id=employee.id,
+                department_id=employee.department_id or 0,
                 date=today,
                 check_in=current_time
             )
             record.determine_status()
             
             db.session.add(record)
+            AttendanceDailyStat.apply_record(record, 1)
             db.session.commit()
             
             log_action(
@@ -378,10 +386,7 @@ def check_out():
         current_time = datetime.now().time()
         
         # 오늘 기록 확인
-        record = AttendanceRecord.query.filter_by(
-            employee_id=employee.id,
-            date=today
-        ).first()
+        record = AttendanceRecord.for_employee_on(employee.id, today).first()
         
         if not record:
             return jsonify({'error': '출근 기록이 없습니다. 먼저 출근을 등록해주세요.'}), 400
@@ -393,9 +398,11 @@ def check_out():
             return jsonify({'error': '이미 퇴근 등록이 완료되었습니다.'}), 400
         
         # 퇴근 시간 등록
+        AttendanceDailyStat.apply_record(record, -1)
         record.check_out = current_time
         record.calculate_work_hours()
         record.determine_status()
+        AttendanceDailyStat.apply_record(record, 1)
         
         db.session.commit()
         
@@ -431,10 +438,7 @@ def get_today_attendance():
         today = date.today()
         
         # 오늘 기록 조회
-        record = AttendanceRecord.query.filter_by(
-            employee_id=employee.id,
-            date=today
-        ).first()
+        record = AttendanceRecord.for_employee_on(employee.id, today).first()
         
         if record:
             return jsonify({'record': record.to_dict()})
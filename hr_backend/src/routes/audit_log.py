@@ -3,6 +3,7 @@ from flask_jwt_extended import jwt_required, get_jwt_identity, get_jwt
 from datetime import datetime, timedelta
 from src.models.user import db, User
 from src.models.audit_log import AuditLog
+from src.utils.change_tracking import etag_cached
 
 audit_log_bp = Blueprint('audit_log', __name__)
 
@@ -15,6 +16,7 @@ def require_admin():
 
 @audit_log_bp.route('/audit-logs', methods=['GET'])
 @jwt_required()
+@etag_cached(tables=('audit_logs', 'users'))
 def get_audit_logs():
     """감사 로그 목록 조회 (관리자 전용)"""
     try:
@@ -101,6 +103,7 @@ def get_audit_log(log_id):
 
 @audit_log_bp.route('/audit-logs/my', methods=['GET'])
 @jwt_required()
+@etag_cached(tables=('audit_logs', 'users'))
 def get_my_audit_logs():
     """내 활동 로그 조회"""
     try:
@@ -114,7 +117,7 @@ def get_my_audit_logs():
         end_date = request.args.get('end_date')
         
         # 본인의 로그만 조회
-        query = AuditLog.query.filter(AuditLog.user_id == current_user_id)
+        query = AuditLog.recent_first(current_user_id)
         
         # 필터 적용
         if action_type:
@@ -128,9 +131,6 @@ def get_my_audit_logs():
             end_datetime = datetime.strptime(end_date, '%Y-%m-%d') + timedelta(days=1)
             query = query.filter(AuditLog.created_at < end_datetime)
         
-        # 최신순 정렬
-        query = query.order_by(AuditLog.created_at.desc())
-        
         # 페이지네이션
         logs = query.paginate(page=page, per_page=per_page, error_out=False)
         
@@ -160,6 +160,7 @@ def get_my_audit_logs():
 
 @audit_log_bp.route('/audit-logs/summary', methods=['GET'])
 @jwt_required()
+@etag_cached(tables=('audit_logs', 'users'))
 def get_audit_log_summary():
     """감사 로그 요약 통계 (관리자 전용)"""
     try:
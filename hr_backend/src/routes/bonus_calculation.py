@@ -394,10 +394,13 @@ def process_bonus_payment(current_user, distribution_id):
 def get_bonus_statistics(current_user):
     try:
         year = request.args.get('year', datetime.now().year, type=int)
+        year_start = datetime(year, 1, 1)
+        next_year_start = datetime(year + 1, 1, 1)
         
         # 연도별 성과급 통계
         calculations = BonusCalculation.query.filter(
-            func.extract('year', BonusCalculation.start_date) == year
+            BonusCalculation.start_date >= year_start,
+            BonusCalculation.start_date < next_year_start
         ).all()
         
         # 기본 통계
@@ -441,7 +444,8 @@ def get_bonus_statistics(current_user):
         # 월별 지급 통계
         monthly_stats = {}
         payments = BonusPaymentHistory.query.filter(
-            func.extract('year', BonusPaymentHistory.payment_date) == year
+            BonusPaymentHistory.payment_date >= year_start,
+            BonusPaymentHistory.payment_date < next_year_start
         ).all()
         
         for payment in payments:
@@ -1,415 +1,703 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, jsonify, current_app
 from flask_jwt_extended import jwt_required, get_jwt_identity
-from sqlalchemy import and_, or_, desc, func, extract, case
+from sqlalchemy import and_, or_, desc, func, extract, case, inspect, tuple_, true
 from datetime import datetime, timedelta, date
+from types import SimpleNamespace
+from concurrent.futures import ThreadPoolExecutor
 import calendar
+import threading
+import time
 
 from ..models.user import db, User
 from ..models.employee import Employee
 from ..models.department import Department
 from ..models.attendance_record import AttendanceRecord
+from ..models.attendance_daily_stat import AttendanceDailyStat
 from ..models.annual_leave_grant import AnnualLeaveGrant
 from ..models.annual_leave_usage import AnnualLeaveUsage
 from ..models.leave_request import LeaveRequest
-from ..models.evaluation_simple import Evaluation
+from ..models.evaluation_simple import Evaluation, EvaluationResult
 from ..models.bonus_calculation_advanced import BonusCalculation, BonusDistribution
 from ..models.payroll_record import PayrollRecord
 from ..models.audit_log import AuditLog
 from ..utils.auth import admin_required, get_current_user
 from ..utils.report_generator import ReportGenerator
+from ..utils.download import send_download
+from ..utils.cache import get_query_cache
+from ..utils.change_tracking import etag_cached, table_versions, version_snapshot
 
 dashboard_bp = Blueprint('dashboard', __name__)
 
+# 영역별로 읽는 테이블 (조건부 GET의 ETag와 조회 결과 캐시의 버전 계산용)
+OVERVIEW_STATS_TABLES = (
+    'employees', 'departments', 'attendance_daily_stats', 'annual_leave_usages', 'evaluations',
+    'evaluation_results', 'payroll_records', 'bonus_calculations', 'bonus_distributions'
+)
+OVERVIEW_TABLES = OVERVIEW_STATS_TABLES + ('audit_logs',)
+ATTENDANCE_TREND_TABLES = ('attendance_daily_stats',)
+DEPARTMENT_STATS_TABLES = ('departments', 'employees', 'payroll_records', 'annual_leave_usages', 'attendance_daily_stats')
+PAYROLL_TREND_TABLES = ('payroll_records',)
+
+# 대시보드 묶음 조회용 스레드 풀 (요청 간 공유, 최초 사용 시 생성)
+DASHBOARD_BUNDLE_WORKERS = 4
+_bundle_executor = None
+_bundle_executor_lock = threading.Lock()
+
+def period_bounds(year, month=None):
+    """연도(month가 없으면) 또는 월의 [시작일, 다음 기간 시작일) 날짜 범위"""
+    if not month:
+        return date(year, 1, 1), date(year + 1, 1, 1)
+    start = date(year, month, 1)
+    return start, (date(year + 1, 1, 1) if month == 12 else date(year, month + 1, 1))
+
+def period_codes(year, month=None):
+    """급여 기간 코드(YYYY-MM)의 [시작, 다음 기간 시작) 범위 (period 인덱스 범위 조회용)"""
+    start, end = period_bounds(year, month)
+    return start.strftime('%Y-%m'), end.strftime('%Y-%m')
+
 @dashboard_bp.route('/dashboard/overview', methods=['GET'])
 @jwt_required()
 @admin_required
-def get_dashboard_overview():
-    """대시보드 개요 통계"""
+@etag_cached(tables=OVERVIEW_TABLES)
+def get_dashboard_overview(current_user):
+    """대시보드 개요 통계
+
+    집계 통계는 조회 결과 캐시('dashboard' 네임스페이스)에 집계 대상 테이블의 변경 카운터와 함께 보관하며,
+    카운터가 바뀌면(다른 워커, CLI, 마이그레이션, 백그라운드 작업의 쓰기 포함) 다시 집계한다.
+    최근 활동(감사 로그)은 매번 조회한다.
+    """
     try:
-        current_year = datetime.now().year
-        current_month = datetime.now().month
-        
-        # 기본 통계
-        total_employees = Employee.query.count()
-        total_departments = Department.query.count()
-        
-        # 이번 달 출근 통계
-        attendance_stats = db.session.query(
-            func.count(AttendanceRecord.id).label('total_records'),
-            func.avg(AttendanceRecord.work_hours).label('avg_work_hours'),
-            func.count(case([(AttendanceRecord.status == '지각', 1)])).label('late_count'),
-            func.count(case([(AttendanceRecord.status == '결근', 1)])).label('absent_count')
-        ).filter(
-            extract('year', AttendanceRecord.date) == current_year,
-            extract('month', AttendanceRecord.date) == current_month
-        ).first()
-        
-        # 연차 사용 통계
-        annual_leave_stats = db.session.query(
-            func.sum(AnnualLeaveUsage.used_days).label('total_used'),
-            func.count(AnnualLeaveUsage.id).label('usage_count')
-        ).filter(
-            extract('year', AnnualLeaveUsage.usage_date) == current_year
-        ).first()
-        
-        # 평가 진행 상황
-        evaluation_stats = db.session.query(
-            func.count(Evaluation.id).label('total_evaluations'),
-            func.count(case([(Evaluation.status == 'completed', 1)])).label('completed_evaluations'),
-            func.avg(case([(Evaluation.status == 'completed', Evaluation.total_score)])).label('avg_score')
-        ).filter(
-            extract('year', Evaluation.created_at) == current_year
-        ).first()
-        
-        # 급여 통계 (이번 달)
-        payroll_stats = db.session.query(
-            func.count(PayrollRecord.id).label('total_payrolls'),
-            func.sum(PayrollRecord.gross_pay).label('total_gross_pay'),
-            func.sum(PayrollRecord.net_pay).label('total_net_pay'),
-            func.avg(PayrollRecord.net_pay).label('avg_net_pay')
-        ).filter(
-            PayrollRecord.year == current_year,
-            PayrollRecord.month == current_month
-        ).first()
-        
-        # 성과급 통계
-        bonus_stats = db.session.query(
-            func.count(BonusCalculation.id).label('total_calculations'),
-            func.sum(BonusCalculation.total_amount).label('total_bonus_amount'),
-            func.count(BonusDistribution.id).label('total_distributions')
-        ).outerjoin(BonusDistribution).filter(
-            extract('year', BonusCalculation.created_at) == current_year
-        ).first()
-        
-        # 최근 활동 (감사 로그)
-        recent_activities = AuditLog.query.order_by(desc(AuditLog.created_at)).limit(10).all()
-        
-        return jsonify({
-            'overview': {
-                'total_employees': total_employees,
-                'total_departments': total_departments,
-                'current_period': f"{current_year}년 {current_month}월"
-            },
-            'attendance': {
-                'total_records': attendance_stats.total_records or 0,
-                'avg_work_hours': float(attendance_stats.avg_work_hours or 0),
-                'late_count': attendance_stats.late_count or 0,
-                'absent_count': attendance_stats.absent_count or 0,
-                'attendance_rate': round((1 - (attendance_stats.absent_count or 0) / max(attendance_stats.total_records or 1, 1)) * 100, 1)
-            },
-            'annual_leave': {
-                'total_used': float(annual_leave_stats.total_used or 0),
-                'usage_count': annual_leave_stats.usage_count or 0,
-                'avg_per_employee': round(float(annual_leave_stats.total_used or 0) / max(total_employees, 1), 1)
-            },
-            'evaluation': {
-                'total_evaluations': evaluation_stats.total_evaluations or 0,
-                'completed_evaluations': evaluation_stats.completed_evaluations or 0,
-                'completion_rate': round((evaluation_stats.completed_evaluations or 0) / max(evaluation_stats.total_evaluations or 1, 1) * 100, 1),
-                'avg_score': round(float(evaluation_stats.avg_score or 0), 1)
-            },
-            'payroll': {
-                'total_payrolls': payroll_stats.total_payrolls or 0,
-                'total_gross_pay': float(payroll_stats.total_gross_pay or 0),
-                'total_net_pay': float(payroll_stats.total_net_pay or 0),
-                'avg_net_pay': float(payroll_stats.avg_net_pay or 0)
-            },
-            'bonus': {
-                'total_calculations': bonus_stats.total_calculations or 0,
-                'total_bonus_amount': float(bonus_stats.total_bonus_amount or 0),
-                'total_distributions': bonus_stats.total_distributions or 0
-            },
-            'recent_activities': [
-                {
-                    'id': activity.id,
-                    'user_id': activity.user_id,
-                    'action_type': activity.action_type,
-                    'entity_type': activity.entity_type,
-                    'message': activity.message,
-                    'created_at': activity.created_at.isoformat()
-                } for activity in recent_activities
-            ]
-        })
+        return jsonify(get_overview_data())
         
     except Exception as e:
         return jsonify({'error': f'대시보드 개요를 불러오는데 실패했습니다: {str(e)}'}), 500
 
+def get_overview_data(fields=None):
+    """이번 달 대시보드 개요 (fields에 recent_activities가 없으면 감사 로그는 조회하지 않음)"""
+    current_year = datetime.now().year
+    current_month = datetime.now().month
+
+    data = dict(get_query_cache().get_or_compute(
+        'dashboard', ('overview', current_year, current_month),
+        lambda: get_overview_stats(current_year, current_month),
+        version=table_versions(OVERVIEW_STATS_TABLES)
+    ))
+
+    if fields is None or 'recent_activities' in fields:
+        # 최근 활동 (감사 로그)
+        recent_activities = AuditLog.recent_first().limit(10).all()
+        data['recent_activities'] = [
+            {
+                'id': activity.id,
+                'user_id': activity.user_id,
+                'action_type': activity.action_type,
+                'entity_type': activity.entity_type,
+                'message': activity.message,
+                'created_at': activity.created_at.isoformat()
+            } for activity in recent_activities
+        ]
+    return data
+
+@dashboard_bp.route('/dashboard/cache-stats', methods=['GET'])
+@jwt_required()
+@admin_required
+def get_dashboard_cache_stats(current_user):
+    """조회 결과 캐시 적중/미적중 통계와 테이블별 변경 카운터"""
+    return jsonify({'cache': get_query_cache().stats(), 'table_versions': version_snapshot()})
+
+# 평가/성과급 테이블이 없을 때 개요 집계에서 빠지는 컬럼
+OPTIONAL_OVERVIEW_COLUMNS = (
+    'total_evaluations', 'completed_evaluations', 'avg_score',
+    'total_calculations', 'total_bonus_amount', 'total_distributions'
+)
+
+def tables_exist(*table_names):
+    """현재 DB에 테이블이 모두 있는지 확인
+
+    평가/성과급 모델은 별도 SQLAlchemy 인스턴스에 선언되어 init_database()가 테이블을 만들지 않으므로
+    이 테이블을 읽는 집계는 먼저 확인한다.
+    """
+    inspector = inspect(db.engine)
+    return all(inspector.has_table(table_name) for table_name in table_names)
+
+def get_overview_stats(current_year, current_month):
+    """대시보드 개요 집계 (단일 쿼리)
+
+    영역별로 한 행짜리 집계 서브쿼리를 만들고 이를 한 SELECT에서 조합한다.
+    날짜 조건은 extract() 대신 [시작, 다음 시작) 범위로 주어 날짜 컬럼 인덱스를 사용할 수 있게 한다.
+    """
+    month_start, next_month_start = period_bounds(current_year, current_month)
+    year_start = datetime(current_year, 1, 1)
+    next_year_start = datetime(current_year + 1, 1, 1)
+
+    # 기본 통계
+    employees = db.session.query(func.count(Employee.id).label('total_employees')).subquery()
+    departments = db.session.query(func.count(Department.id).label('total_departments')).subquery()
+
+    # 이번 달 출근 통계 (일자/부서별 출퇴근 집계에서)
+    attendance = db.session.query(
+        func.sum(AttendanceDailyStat.record_count).label('total_records'),
+        (func.sum(AttendanceDailyStat.sum_hours) / func.nullif(func.sum(AttendanceDailyStat.hours_count), 0)).label('avg_work_hours'),
+        func.sum(AttendanceDailyStat.late).label('late_count'),
+        func.sum(AttendanceDailyStat.absent).label('absent_count')
+    ).filter(
+        AttendanceDailyStat.date_range(month_start, next_month_start)
+    ).subquery()
+
+    # 연차 사용 통계
+    annual_leave = db.session.query(
+        func.sum(AnnualLeaveUsage.used_days).label('total_used'),
+        func.count(AnnualLeaveUsage.id).label('usage_count')
+    ).filter(
+        AnnualLeaveUsage.usage_date >= year_start.date(),
+        AnnualLeaveUsage.usage_date < next_year_start.date()
+    ).subquery()
+
+    # 평가 진행 상황
+    evaluations = db.session.query(
+        func.count(Evaluation.id).label('total_evaluations'),
+        func.count(case((Evaluation.status.in_(('완료', '마감')), 1))).label('completed_evaluations')
+    ).filter(
+        Evaluation.created_at >= year_start,
+        Evaluation.created_at < next_year_start
+    ).subquery()
+    evaluation_scores = db.session.query(
+        func.avg(EvaluationResult.total_score).label('avg_score')
+    ).join(Evaluation, EvaluationResult.evaluation_id == Evaluation.id).filter(
+        EvaluationResult.completed_condition(),
+        Evaluation.created_at >= year_start,
+        Evaluation.created_at < next_year_start
+    ).subquery()
+
+    # 급여 통계 (이번 달)
+    payroll = db.session.query(
+        func.count(PayrollRecord.id).label('total_payrolls'),
+        func.sum(PayrollRecord.gross_pay).label('total_gross_pay'),
+        func.sum(PayrollRecord.net_pay).label('total_net_pay'),
+        func.avg(PayrollRecord.net_pay).label('avg_net_pay')
+    ).filter(
+        PayrollRecord.period == f'{current_year}-{current_month:02d}'
+    ).subquery()
+
+    # 성과급 통계 (분배 건수는 별도 집계하여 계산 금액이 분배 행 수만큼 중복 합산되지 않게 함)
+    year_calculations = and_(
+        BonusCalculation.created_at >= year_start,
+        BonusCalculation.created_at < next_year_start
+    )
+    bonus = db.session.query(
+        func.count(BonusCalculation.id).label('total_calculations'),
+        func.sum(BonusCalculation.total_amount).label('total_bonus_amount')
+    ).filter(year_calculations).subquery()
+    bonus_distributions = db.session.query(
+        func.count(BonusDistribution.id).label('total_distributions')
+    ).join(BonusCalculation, BonusDistribution.calculation_id == BonusCalculation.id).filter(
+        year_calculations
+    ).subquery()
+
+    # 평가/성과급 테이블이 없는 DB에서는 해당 영역을 빼고 0으로 채운다
+    sections = [employees, departments, attendance, annual_leave, payroll]
+    if tables_exist('evaluations', 'evaluation_results'):
+        sections += [evaluations, evaluation_scores]
+    if tables_exist('bonus_calculations', 'bonus_distributions'):
+        sections += [bonus, bonus_distributions]
+
+    # 한 행짜리 집계끼리의 교차 조인 (ON 1 = 1)
+    query = db.session.query(*sections).select_from(sections[0])
+    for section in sections[1:]:
+        query = query.join(section, true())
+    stats = SimpleNamespace(**{**dict.fromkeys(OPTIONAL_OVERVIEW_COLUMNS), **query.one()._mapping})
+
+    return {
+        'overview': {
+            'total_employees': stats.total_employees,
+            'total_departments': stats.total_departments,
+            'current_period': f"{current_year}년 {current_month}월"
+        },
+        'attendance': {
+            'total_records': stats.total_records or 0,
+            'avg_work_hours': float(stats.avg_work_hours or 0),
+            'late_count': stats.late_count or 0,
+            'absent_count': stats.absent_count or 0,
+            'attendance_rate': round((1 - (stats.absent_count or 0) / max(stats.total_records or 1, 1)) * 100, 1)
+        },
+        'annual_leave': {
+            'total_used': float(stats.total_used or 0),
+            'usage_count': stats.usage_count or 0,
+            'avg_per_employee': round(float(stats.total_used or 0) / max(stats.total_employees, 1), 1)
+        },
+        'evaluation': {
+            'total_evaluations': stats.total_evaluations or 0,
+            'completed_evaluations': stats.completed_evaluations or 0,
+            'completion_rate': round((stats.completed_evaluations or 0) / max(stats.total_evaluations or 1, 1) * 100, 1),
+            'avg_score': round(float(stats.avg_score or 0), 1)
+        },
+        'payroll': {
+            'total_payrolls': stats.total_payrolls or 0,
+            'total_gross_pay': float(stats.total_gross_pay or 0),
+            'total_net_pay': float(stats.total_net_pay or 0),
+            'avg_net_pay': float(stats.avg_net_pay or 0)
+        },
+        'bonus': {
+            'total_calculations': stats.total_calculations or 0,
+            'total_bonus_amount': float(stats.total_bonus_amount or 0),
+            'total_distributions': stats.total_distributions or 0
+        }
+    }
+
 @dashboard_bp.route('/dashboard/charts/attendance-trend', methods=['GET'])
 @jwt_required()
 @admin_required
-def get_attendance_trend():
+@etag_cached(tables=ATTENDANCE_TREND_TABLES)
+def get_attendance_trend(current_user):
     """출근 트렌드 차트 데이터"""
     try:
-        # 최근 12개월 데이터
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=365)
-        
-        # 월별 출근 통계
-        monthly_stats = db.session.query(
-            extract('year', AttendanceRecord.date).label('year'),
-            extract('month', AttendanceRecord.date).label('month'),
-            func.count(AttendanceRecord.id).label('total_records'),
-            func.count(case([(AttendanceRecord.status == '출근', 1)])).label('on_time'),
-            func.count(case([(AttendanceRecord.status == '지각', 1)])).label('late'),
-            func.count(case([(AttendanceRecord.status == '결근', 1)])).label('absent'),
-            func.avg(AttendanceRecord.work_hours).label('avg_hours')
-        ).filter(
-            AttendanceRecord.date >= start_date.date(),
-            AttendanceRecord.date <= end_date.date()
-        ).group_by(
-            extract('year', AttendanceRecord.date),
-            extract('month', AttendanceRecord.date)
-        ).order_by(
-            extract('year', AttendanceRecord.date),
-            extract('month', AttendanceRecord.date)
-        ).all()
-        
-        chart_data = []
-        for stat in monthly_stats:
-            chart_data.append({
-                'period': f"{int(stat.year)}년 {int(stat.month)}월",
-                'year': int(stat.year),
-                'month': int(stat.month),
-                'total_records': stat.total_records,
-                'on_time': stat.on_time,
-                'late': stat.late,
-                'absent': stat.absent,
-                'avg_hours': round(float(stat.avg_hours or 0), 1),
-                'attendance_rate': round((stat.on_time + stat.late) / max(stat.total_records, 1) * 100, 1)
-            })
-        
-        return jsonify({
-            'chart_data': chart_data,
-            'summary': {
-                'total_months': len(chart_data),
-                'avg_attendance_rate': round(sum(item['attendance_rate'] for item in chart_data) / max(len(chart_data), 1), 1),
-                'avg_work_hours': round(sum(item['avg_hours'] for item in chart_data) / max(len(chart_data), 1), 1)
-            }
-        })
+        return jsonify(get_attendance_trend_data())
         
     except Exception as e:
         return jsonify({'error': f'출근 트렌드 데이터를 불러오는데 실패했습니다: {str(e)}'}), 500
 
+def get_attendance_trend_data():
+    """최근 12개월 월별 출근 통계 (일자/부서별 출퇴근 집계에서)"""
+    # 최근 12개월 데이터
+    end_date = datetime.now()
+    start_date = end_date - timedelta(days=365)
+    
+    # 월별 출근 통계 (일자/부서별 출퇴근 집계에서)
+    year = extract('year', AttendanceDailyStat.date)
+    month = extract('month', AttendanceDailyStat.date)
+    monthly_stats = db.session.query(
+        year.label('year'),
+        month.label('month'),
+        func.sum(AttendanceDailyStat.record_count).label('total_records'),
+        func.sum(AttendanceDailyStat.on_time).label('on_time'),
+        func.sum(AttendanceDailyStat.late).label('late'),
+        func.sum(AttendanceDailyStat.absent).label('absent'),
+        (func.sum(AttendanceDailyStat.sum_hours) / func.nullif(func.sum(AttendanceDailyStat.hours_count), 0)).label('avg_hours')
+    ).filter(
+        AttendanceDailyStat.date_range(start_date.date(), end_date.date() + timedelta(days=1))
+    ).group_by(year, month).order_by(year, month).all()
+    
+    chart_data = []
+    for stat in monthly_stats:
+        chart_data.append({
+            'period': f"{int(stat.year)}년 {int(stat.month)}월",
+            'year': int(stat.year),
+            'month': int(stat.month),
+            'total_records': stat.total_records,
+            'on_time': stat.on_time,
+            'late': stat.late,
+            'absent': stat.absent,
+            'avg_hours': round(float(stat.avg_hours or 0), 1),
+            'attendance_rate': round((stat.on_time + stat.late) / max(stat.total_records, 1) * 100, 1)
+        })
+    
+    return {
+        'chart_data': chart_data,
+        'summary': {
+            'total_months': len(chart_data),
+            'avg_attendance_rate': round(sum(item['attendance_rate'] for item in chart_data) / max(len(chart_data), 1), 1),
+            'avg_work_hours': round(sum(item['avg_hours'] for item in chart_data) / max(len(chart_data), 1), 1)
+        }
+    }
+
 @dashboard_bp.route('/dashboard/charts/department-stats', methods=['GET'])
 @jwt_required()
 @admin_required
-def get_department_stats():
+@etag_cached(tables=DEPARTMENT_STATS_TABLES)
+def get_department_stats(current_user):
     """부서별 통계 차트 데이터"""
     try:
-        # 부서별 직원 수
-        dept_employee_stats = db.session.query(
-            Department.name.label('dept_name'),
-            func.count(Employee.id).label('employee_count')
-        ).outerjoin(Employee).group_by(Department.id, Department.name).all()
-        
-        # 부서별 평균 급여 (이번 달)
-        current_year = datetime.now().year
-        current_month = datetime.now().month
-        
-        dept_salary_stats = db.session.query(
-            Department.name.label('dept_name'),
-            func.avg(PayrollRecord.net_pay).label('avg_salary'),
-            func.sum(PayrollRecord.net_pay).label('total_salary')
-        ).join(Employee).join(PayrollRecord).filter(
-            PayrollRecord.year == current_year,
-            PayrollRecord.month == current_month
-        ).group_by(Department.id, Department.name).all()
+        return jsonify(get_department_stats_data())
         
-        # 부서별 연차 사용률
-        dept_leave_stats = db.session.query(
-            Department.name.label('dept_name'),
-            func.sum(AnnualLeaveUsage.used_days).label('total_used_days'),
-            func.count(Employee.id).label('employee_count')
-        ).join(Employee).outerjoin(AnnualLeaveUsage).filter(
-            extract('year', AnnualLeaveUsage.usage_date) == current_year
-        ).group_by(Department.id, Department.name).all()
-        
-        # 데이터 통합
-        dept_data = {}
-        
-        # 직원 수 데이터
-        for stat in dept_employee_stats:
-            dept_data[stat.dept_name] = {
-                'name': stat.dept_name,
-                'employee_count': stat.employee_count,
-                'avg_salary': 0,
-                'total_salary': 0,
-                'avg_leave_days': 0
+    except Exception as e:
+        return jsonify({'error': f'부서별 통계를 불러오는데 실패했습니다: {str(e)}'}), 500
+
+def get_department_stats_data():
+    """부서별 직원 수/이번 달 급여/연차 사용/출근 현황"""
+    # 부서별 직원 수
+    dept_employee_stats = db.session.query(
+        Department.name.label('dept_name'),
+        func.count(Employee.id).label('employee_count')
+    ).outerjoin(Employee, Employee.department_id == Department.id).group_by(Department.id, Department.name).all()
+    
+    # 부서별 평균 급여 (이번 달)
+    current_year = datetime.now().year
+    current_month = datetime.now().month
+    
+    dept_salary_stats = db.session.query(
+        Department.name.label('dept_name'),
+        func.avg(PayrollRecord.net_pay).label('avg_salary'),
+        func.sum(PayrollRecord.net_pay).label('total_salary')
+    ).join(Employee, Employee.department_id == Department.id).join(PayrollRecord).filter(
+        PayrollRecord.period == f'{current_year}-{current_month:02d}'
+    ).group_by(Department.id, Department.name).all()
+    
+    # 부서별 연차 사용률
+    year_start, next_year_start = period_bounds(current_year)
+    dept_leave_stats = db.session.query(
+        Department.name.label('dept_name'),
+        func.sum(AnnualLeaveUsage.used_days).label('total_used_days'),
+        func.count(Employee.id).label('employee_count')
+    ).join(Employee, Employee.department_id == Department.id).outerjoin(AnnualLeaveUsage).filter(
+        AnnualLeaveUsage.usage_date >= year_start,
+        AnnualLeaveUsage.usage_date < next_year_start
+    ).group_by(Department.id, Department.name).all()
+    
+    # 부서별 출근 현황 (이번 달, 일자/부서별 출퇴근 집계에서)
+    month_start, next_month_start = period_bounds(current_year, current_month)
+    dept_attendance_stats = db.session.query(
+        Department.name.label('dept_name'),
+        func.sum(AttendanceDailyStat.record_count).label('total_records'),
+        func.sum(AttendanceDailyStat.late).label('late_count'),
+        func.sum(AttendanceDailyStat.absent).label('absent_count')
+    ).join(AttendanceDailyStat, AttendanceDailyStat.department_id == Department.id).filter(
+        AttendanceDailyStat.date_range(month_start, next_month_start)
+    ).group_by(Department.id, Department.name).all()
+    
+    # 데이터 통합
+    dept_data = {}
+    
+    # 직원 수 데이터
+    for stat in dept_employee_stats:
+        dept_data[stat.dept_name] = {
+            'name': stat.dept_name,
+            'employee_count': stat.employee_count,
+            'avg_salary': 0,
+            'total_salary': 0,
+            'avg_leave_days': 0,
+            'late_count': 0,
+            'attendance_rate': 0
+        }
+    
+    # 급여 데이터 추가
+    for stat in dept_salary_stats:
+        if stat.dept_name in dept_data:
+            dept_data[stat.dept_name]['avg_salary'] = float(stat.avg_salary or 0)
+            dept_data[stat.dept_name]['total_salary'] = float(stat.total_salary or 0)
+    
+    # 연차 데이터 추가
+    for stat in dept_leave_stats:
+        if stat.dept_name in dept_data:
+            dept_data[stat.dept_name]['avg_leave_days'] = round(
+                float(stat.total_used_days or 0) / max(stat.employee_count or 1, 1), 1
+            )
+    
+    # 출근 데이터 추가
+    for stat in dept_attendance_stats:
+        if stat.dept_name in dept_data:
+            dept_data[stat.dept_name]['late_count'] = stat.late_count or 0
+            dept_data[stat.dept_name]['attendance_rate'] = round(
+                (1 - (stat.absent_count or 0) / max(stat.total_records or 1, 1)) * 100, 1
+            )
+    
+    return {
+        'department_stats': list(dept_data.values()),
+        'summary': {
+            'total_departments': len(dept_data),
+            'total_employees': sum(dept['employee_count'] for dept in dept_data.values()),
+            'avg_dept_size': round(sum(dept['employee_count'] for dept in dept_data.values()) / max(len(dept_data), 1), 1)
+        }
+    }
+
+@dashboard_bp.route('/dashboard/charts/department-payroll-rollup', methods=['GET'])
+@jwt_required()
+@admin_required
+def get_department_payroll_rollup(current_user):
+    """부서 계층별 급여 비용 롤업
+
+    부서 -> 하위 부서 전체 매핑을 재귀 CTE로 만들고 급여명세서와 조인하여,
+    부서별 직속(own) 합계와 하위 부서를 포함한(subtree) 합계를 기간별로 한 번의 GROUP BY로 구한다.
+    period(YYYY-MM) 또는 start_period/end_period를 받으며, 없으면 가장 최근 급여 기간을 사용한다.
+    """
+    try:
+        def parse(value):
+            try:
+                parsed = datetime.strptime(value, '%Y-%m')
+            except (TypeError, ValueError):
+                return None
+            return parsed.year, parsed.month
+
+        period = request.args.get('period')
+        start_value = request.args.get('start_period') or period
+        end_value = request.args.get('end_period') or period
+        if start_value or end_value:
+            start, end = parse(start_value or end_value), parse(end_value or start_value)
+            if not start or not end:
+                return jsonify({'error': '기간은 YYYY-MM 형식이어야 합니다.'}), 400
+        else:
+            latest = db.session.query(PayrollRecord.year, PayrollRecord.month).order_by(
+                desc(PayrollRecord.year), desc(PayrollRecord.month)
+            ).first()
+            start = end = (latest.year, latest.month) if latest else (datetime.now().year, datetime.now().month)
+        if start > end:
+            start, end = end, start
+
+        period_filter = tuple_(PayrollRecord.year, PayrollRecord.month).between(start, end)
+        amount_fields = ('gross_pay', 'total_deductions', 'net_pay')
+
+        def empty_totals():
+            return {'employee_count': 0, **{field: 0.0 for field in amount_fields}}
+
+        # 부서별 직속/하위 포함 합계 (기간별)
+        tree = Department.subtree_mapping()
+        is_own = tree.c.ancestor_id == tree.c.descendant_id
+        rollup_rows = db.session.query(
+            tree.c.ancestor_id.label('department_id'),
+            PayrollRecord.period,
+            func.count(case((is_own, PayrollRecord.id))).label('own_employee_count'),
+            *[func.sum(case((is_own, getattr(PayrollRecord, field)), else_=0)).label(f'own_{field}')
+              for field in amount_fields],
+            func.count(PayrollRecord.id).label('subtree_employee_count'),
+            *[func.sum(getattr(PayrollRecord, field)).label(f'subtree_{field}') for field in amount_fields]
+        ).select_from(tree).join(
+            Employee, Employee.department_id == tree.c.descendant_id
+        ).join(
+            PayrollRecord, PayrollRecord.employee_id == Employee.id
+        ).filter(period_filter).group_by(tree.c.ancestor_id, PayrollRecord.period).all()
+
+        # 전체 및 부서 미지정 합계 (기간별)
+        total_rows = db.session.query(
+            PayrollRecord.period,
+            func.count(PayrollRecord.id).label('employee_count'),
+            func.count(case((Employee.department_id.is_(None), PayrollRecord.id))).label('unassigned_employee_count'),
+            *[func.sum(getattr(PayrollRecord, field)).label(field) for field in amount_fields],
+            *[func.sum(case((Employee.department_id.is_(None), getattr(PayrollRecord, field)), else_=0)).label(f'unassigned_{field}')
+              for field in amount_fields]
+        ).join(Employee, PayrollRecord.employee_id == Employee.id).filter(
+            period_filter
+        ).group_by(PayrollRecord.period).all()
+
+        nodes = {
+            department.id: {
+                'id': department.id,
+                'name': department.name,
+                'code': department.code,
+                'parent_id': department.parent_id,
+                'is_active': department.is_active,
+                'own': empty_totals(),
+                'subtree': empty_totals(),
+                'periods': [],
+                'children': []
             }
-        
-        # 급여 데이터 추가
-        for stat in dept_salary_stats:
-            if stat.dept_name in dept_data:
-                dept_data[stat.dept_name]['avg_salary'] = float(stat.avg_salary or 0)
-                dept_data[stat.dept_name]['total_salary'] = float(stat.total_salary or 0)
-        
-        # 연차 데이터 추가
-        for stat in dept_leave_stats:
-            if stat.dept_name in dept_data:
-                dept_data[stat.dept_name]['avg_leave_days'] = round(
-                    float(stat.total_used_days or 0) / max(stat.employee_count or 1, 1), 1
-                )
-        
-        return jsonify({
-            'department_stats': list(dept_data.values()),
-            'summary': {
-                'total_departments': len(dept_data),
-                'total_employees': sum(dept['employee_count'] for dept in dept_data.values()),
-                'avg_dept_size': round(sum(dept['employee_count'] for dept in dept_data.values()) / max(len(dept_data), 1), 1)
+            for department in db.session.query(
+                Department.id, Department.name, Department.code, Department.parent_id, Department.is_active
+            ).order_by(Department.code).all()
+        }
+
+        def totals_of(row, prefix):
+            return {
+                'employee_count': getattr(row, f'{prefix}employee_count'),
+                **{field: float(getattr(row, f'{prefix}{field}') or 0) for field in amount_fields}
             }
+
+        def accumulate(target, values):
+            for key, value in values.items():
+                target[key] += value
+
+        for row in sorted(rollup_rows, key=lambda row: row.period):
+            node = nodes.get(row.department_id)
+            if not node:
+                continue
+            own, subtree = totals_of(row, 'own_'), totals_of(row, 'subtree_')
+            node['periods'].append({'period': row.period, 'own': own, 'subtree': subtree})
+            accumulate(node['own'], own)
+            accumulate(node['subtree'], subtree)
+
+        roots = []
+        for node in nodes.values():
+            parent = nodes.get(node['parent_id'])
+            (parent['children'] if parent else roots).append(node)
+
+        total, unassigned, periods = empty_totals(), empty_totals(), []
+        for row in sorted(total_rows, key=lambda row: row.period):
+            period_total, period_unassigned = totals_of(row, ''), totals_of(row, 'unassigned_')
+            periods.append({'period': row.period, 'total': period_total, 'unassigned': period_unassigned})
+            accumulate(total, period_total)
+            accumulate(unassigned, period_unassigned)
+
+        return jsonify({
+            'start_period': f'{start[0]}-{start[1]:02d}',
+            'end_period': f'{end[0]}-{end[1]:02d}',
+            'departments': roots,
+            'unassigned': unassigned,
+            'total': total,
+            'periods': periods
         })
-        
+
     except Exception as e:
-        return jsonify({'error': f'부서별 통계를 불러오는데 실패했습니다: {str(e)}'}), 500
+        return jsonify({'error': f'부서별 급여 비용 롤업을 불러오는데 실패했습니다: {str(e)}'}), 500
 
 @dashboard_bp.route('/dashboard/charts/payroll-trend', methods=['GET'])
 @jwt_required()
 @admin_required
-def get_payroll_trend():
+@etag_cached(tables=PAYROLL_TREND_TABLES)
+def get_payroll_trend(current_user):
     """급여 트렌드 차트 데이터"""
     try:
-        # 최근 12개월 급여 통계
-        end_date = datetime.now()
-        start_year = end_date.year - 1 if end_date.month <= 12 else end_date.year
+        return jsonify(get_payroll_trend_data())
         
-        monthly_payroll = db.session.query(
-            PayrollRecord.year,
-            PayrollRecord.month,
-            func.count(PayrollRecord.id).label('payroll_count'),
-            func.sum(PayrollRecord.gross_pay).label('total_gross'),
-            func.sum(PayrollRecord.net_pay).label('total_net'),
-            func.avg(PayrollRecord.net_pay).label('avg_net'),
-            func.sum(PayrollRecord.total_deductions).label('total_deductions')
-        ).filter(
-            or_(
-                PayrollRecord.year > start_year,
-                and_(PayrollRecord.year == start_year, PayrollRecord.month >= end_date.month)
+    except Exception as e:
+        return jsonify({'error': f'급여 트렌드 데이터를 불러오는데 실패했습니다: {str(e)}'}), 500
+
+def get_payroll_trend_data():
+    """최근 12개월 월별 급여 통계"""
+    # 최근 12개월 급여 통계 (작년 같은 달부터)
+    end_date = datetime.now()
+    start_period = f'{end_date.year - 1}-{end_date.month:02d}'
+    
+    monthly_payroll = db.session.query(
+        PayrollRecord.year,
+        PayrollRecord.month,
+        func.count(PayrollRecord.id).label('payroll_count'),
+        func.sum(PayrollRecord.gross_pay).label('total_gross'),
+        func.sum(PayrollRecord.net_pay).label('total_net'),
+        func.avg(PayrollRecord.net_pay).label('avg_net'),
+        func.sum(PayrollRecord.total_deductions).label('total_deductions')
+    ).filter(
+        PayrollRecord.period_range(start_period)
+    ).group_by(
+        PayrollRecord.year,
+        PayrollRecord.month
+    ).order_by(
+        PayrollRecord.year,
+        PayrollRecord.month
+    ).all()
+    
+    chart_data = []
+    for stat in monthly_payroll:
+        chart_data.append({
+            'period': f"{stat.year}년 {stat.month}월",
+            'year': stat.year,
+            'month': stat.month,
+            'payroll_count': stat.payroll_count,
+            'total_gross': float(stat.total_gross),
+            'total_net': float(stat.total_net),
+            'avg_net': float(stat.avg_net),
+            'total_deductions': float(stat.total_deductions),
+            'deduction_rate': round(float(stat.total_deductions) / max(float(stat.total_gross), 1) * 100, 1)
+        })
+    
+    return {
+        'chart_data': chart_data,
+        'summary': {
+            'total_months': len(chart_data),
+            'avg_monthly_gross': round(sum(item['total_gross'] for item in chart_data) / max(len(chart_data), 1), 0),
+            'avg_monthly_net': round(sum(item['total_net'] for item in chart_data) / max(len(chart_data), 1), 0),
+            'avg_deduction_rate': round(sum(item['deduction_rate'] for item in chart_data) / max(len(chart_data), 1), 1)
+        }
+    }
+
+# 묶음 조회 영역 -> (데이터 함수, 선택 가능한 항목)
+DASHBOARD_SECTIONS = {
+    'overview': (get_overview_data, (
+        'overview', 'attendance', 'annual_leave', 'evaluation', 'payroll', 'bonus', 'recent_activities'
+    )),
+    'attendance_trend': (lambda fields: get_attendance_trend_data(), ('chart_data', 'summary')),
+    'department_stats': (lambda fields: get_department_stats_data(), ('department_stats', 'summary')),
+    'payroll_trend': (lambda fields: get_payroll_trend_data(), ('chart_data', 'summary')),
+}
+
+def get_bundle_executor():
+    global _bundle_executor
+    with _bundle_executor_lock:
+        if _bundle_executor is None:
+            _bundle_executor = ThreadPoolExecutor(
+                max_workers=DASHBOARD_BUNDLE_WORKERS, thread_name_prefix='dashboard-bundle'
             )
-        ).group_by(
-            PayrollRecord.year,
-            PayrollRecord.month
-        ).order_by(
-            PayrollRecord.year,
-            PayrollRecord.month
-        ).all()
+        return _bundle_executor
+
+def run_dashboard_section(app, name, fields):
+    """영역 하나를 자체 앱 컨텍스트(별도 세션/커넥션)에서 조회 -> (데이터, 오류, 소요 ms)"""
+    started = time.perf_counter()
+    with app.app_context():
+        try:
+            data = DASHBOARD_SECTIONS[name][0](fields)
+            if fields is not None:
+                data = {key: value for key, value in data.items() if key in fields}
+            error = None
+        except Exception as e:
+            data, error = None, str(e)
+    return data, error, round((time.perf_counter() - started) * 1000, 1)
+
+@dashboard_bp.route('/dashboard/bundle', methods=['GET'])
+@jwt_required()
+@admin_required
+@etag_cached(tables=OVERVIEW_TABLES + ATTENDANCE_TREND_TABLES + DEPARTMENT_STATS_TABLES + PAYROLL_TREND_TABLES)
+def get_dashboard_bundle(current_user):
+    """대시보드 화면 데이터 묶음 조회 (개요/출근 트렌드/부서별 통계/급여 트렌드)
+
+    영역별 조회를 스레드 풀에서 동시에 실행하며 각 영역은 자체 앱 컨텍스트와 DB 세션을 쓴다.
+    sections=overview,payroll_trend 로 영역을, <영역>_fields=summary 로 영역 안의 항목을 고른다.
+    한 영역이 실패해도 나머지 영역은 반환하고 실패 내용은 errors에 담는다.
+    """
+    try:
+        sections = request.args.get('sections')
+        names = [name.strip() for name in sections.split(',') if name.strip()] if sections else list(DASHBOARD_SECTIONS)
+        unknown = [name for name in names if name not in DASHBOARD_SECTIONS]
+        if unknown:
+            return jsonify({'error': f'알 수 없는 영역입니다: {", ".join(unknown)}'}), 400
+        
+        section_fields = {}
+        for name in names:
+            value = request.args.get(f'{name}_fields')
+            if value is None:
+                continue
+            fields = {field.strip() for field in value.split(',') if field.strip()}
+            invalid = sorted(fields - set(DASHBOARD_SECTIONS[name][1]))
+            if invalid:
+                return jsonify({'error': f'{name} 영역에 없는 항목입니다: {", ".join(invalid)}'}), 400
+            section_fields[name] = fields
+        
+        started = time.perf_counter()
+        app = current_app._get_current_object()
+        executor = get_bundle_executor()
+        futures = {
+            name: executor.submit(run_dashboard_section, app, name, section_fields.get(name))
+            for name in names
+        }
         
-        chart_data = []
-        for stat in monthly_payroll:
-            chart_data.append({
-                'period': f"{stat.year}년 {stat.month}월",
-                'year': stat.year,
-                'month': stat.month,
-                'payroll_count': stat.payroll_count,
-                'total_gross': float(stat.total_gross),
-                'total_net': float(stat.total_net),
-                'avg_net': float(stat.avg_net),
-                'total_deductions': float(stat.total_deductions),
-                'deduction_rate': round(float(stat.total_deductions) / max(float(stat.total_gross), 1) * 100, 1)
-            })
+        result = {'timings_ms': {}, 'errors': {}}
+        for name, future in futures.items():
+            data, error, elapsed_ms = future.result()
+            result['timings_ms'][name] = elapsed_ms
+            if error is None:
+                result[name] = data
+            else:
+                result['errors'][name] = error
+        result['timings_ms']['total'] = round((time.perf_counter() - started) * 1000, 1)
         
-        return jsonify({
-            'chart_data': chart_data,
-            'summary': {
-                'total_months': len(chart_data),
-                'avg_monthly_gross': round(sum(item['total_gross'] for item in chart_data) / max(len(chart_data), 1), 0),
-                'avg_monthly_net': round(sum(item['total_net'] for item in chart_data) / max(len(chart_data), 1), 0),
-                'avg_deduction_rate': round(sum(item['deduction_rate'] for item in chart_data) / max(len(chart_data), 1), 1)
-            }
-        })
+        return jsonify(result)
         
     except Exception as e:
-        return jsonify({'error': f'급여 트렌드 데이터를 불러오는데 실패했습니다: {str(e)}'}), 500
+        return jsonify({'error': f'대시보드 데이터를 불러오는데 실패했습니다: {str(e)}'}), 500
 
 @dashboard_bp.route('/dashboard/reports/summary', methods=['GET'])
 @jwt_required()
 @admin_required
-def get_summary_report():
+def get_summary_report(current_user):
     """종합 리포트 데이터"""
     try:
         year = request.args.get('year', datetime.now().year, type=int)
         month = request.args.get('month', datetime.now().month, type=int)
         
-        # 기간 설정
-        if month:
-            # 특정 월 데이터
-            period_filter = and_(
-                extract('year', PayrollRecord.created_at) == year,
-                extract('month', PayrollRecord.created_at) == month
-            )
-            period_name = f"{year}년 {month}월"
-        else:
-            # 연간 데이터
-            period_filter = extract('year', PayrollRecord.created_at) == year
-            period_name = f"{year}년"
-        
-        # 직원 현황
-        employee_summary = {
-            'total_employees': Employee.query.count(),
-            'active_employees': Employee.query.filter_by(status='active').count(),
-            'departments': Department.query.count()
-        }
-        
-        # 출근 현황
-        attendance_summary = db.session.query(
-            func.count(AttendanceRecord.id).label('total_days'),
-            func.avg(AttendanceRecord.work_hours).label('avg_hours'),
-            func.count(case([(AttendanceRecord.status == '지각', 1)])).label('late_days'),
-            func.count(case([(AttendanceRecord.status == '결근', 1)])).label('absent_days')
-        ).filter(period_filter.replace(PayrollRecord.created_at, AttendanceRecord.date)).first()
-        
-        # 급여 현황
-        payroll_summary = db.session.query(
-            func.count(PayrollRecord.id).label('total_payrolls'),
-            func.sum(PayrollRecord.gross_pay).label('total_gross'),
-            func.sum(PayrollRecord.net_pay).label('total_net'),
-            func.sum(PayrollRecord.total_deductions).label('total_deductions')
-        ).filter(period_filter).first()
-        
-        # 평가 현황
-        evaluation_summary = db.session.query(
-            func.count(Evaluation.id).label('total_evaluations'),
-            func.count(case([(Evaluation.status == 'completed', 1)])).label('completed'),
-            func.avg(case([(Evaluation.status == 'completed', Evaluation.total_score)])).label('avg_score')
-        ).filter(period_filter.replace(PayrollRecord.created_at, Evaluation.created_at)).first()
+        report_data = get_summary_report_data(year, month)
         
         # 성과급 현황
-        bonus_summary = db.session.query(
-            func.count(BonusCalculation.id).label('total_calculations'),
-            func.sum(BonusCalculation.total_amount).label('total_amount')
-        ).filter(period_filter.replace(PayrollRecord.created_at, BonusCalculation.created_at)).first()
-        
-        return jsonify({
-            'period': period_name,
-            'employee': {
-                'total_employees': employee_summary['total_employees'],
-                'active_employees': employee_summary['active_employees'],
-                'departments': employee_summary['departments']
-            },
-            'attendance': {
-                'total_days': attendance_summary.total_days or 0,
-                'avg_hours': round(float(attendance_summary.avg_hours or 0), 1),
-                'late_days': attendance_summary.late_days or 0,
-                'absent_days': attendance_summary.absent_days or 0,
-                'attendance_rate': round((1 - (attendance_summary.absent_days or 0) / max(attendance_summary.total_days or 1, 1)) * 100, 1)
-            },
-            'payroll': {
-                'total_payrolls': payroll_summary.total_payrolls or 0,
-                'total_gross': float(payroll_summary.total_gross or 0),
-                'total_net': float(payroll_summary.total_net or 0),
-                'total_deductions': float(payroll_summary.total_deductions or 0),
-                'avg_net': round(float(payroll_summary.total_net or 0) / max(payroll_summary.total_payrolls or 1, 1), 0)
-            },
-            'evaluation': {
-                'total_evaluations': evaluation_summary.total_evaluations or 0,
-                'completed': evaluation_summary.completed or 0,
-                'completion_rate': round((evaluation_summary.completed or 0) / max(evaluation_summary.total_evaluations or 1, 1) * 100, 1),
-                'avg_score': round(float(evaluation_summary.avg_score or 0), 1)
-            },
-            'bonus': {
+        report_data['bonus'] = {'total_calculations': 0, 'total_amount': 0.0}
+        if tables_exist('bonus_calculations'):
+            start, end = period_bounds(year, month)
+            bonus_summary = db.session.query(
+                func.count(BonusCalculation.id).label('total_calculations'),
+                func.sum(BonusCalculation.total_amount).label('total_amount')
+            ).filter(
+                BonusCalculation.created_at >= start,
+                BonusCalculation.created_at < end
+            ).first()
+            report_data['bonus'] = {
                 'total_calculations': bonus_summary.total_calculations or 0,
                 'total_amount': float(bonus_summary.total_amount or 0)
             }
-        })
+        return jsonify(report_data)
         
     except Exception as e:
         return jsonify({'error': f'종합 리포트를 불러오는데 실패했습니다: {str(e)}'}), 500
@@ -419,7 +707,7 @@ def get_summary_report():
 @dashboard_bp.route('/dashboard/reports/download', methods=['POST'])
 @jwt_required()
 @admin_required
-def download_report():
+def download_report(current_user):
     """리포트 다운로드"""
     try:
         data = request.get_json()
@@ -431,17 +719,12 @@ def download_report():
         # 기간 설정
         if month and month > 0:
             period_name = f"{year}년 {month}월"
-            period_filter = and_(
-                extract('year', PayrollRecord.created_at) == year,
-                extract('month', PayrollRecord.created_at) == month
-            )
         else:
             period_name = f"{year}년"
-            period_filter = extract('year', PayrollRecord.created_at) == year
         
         # 리포트 데이터 수집
         if report_type == 'summary':
-            report_data = get_summary_report_data(period_filter, period_name)
+            report_data = get_summary_report_data(year, month if month and month > 0 else None)
         else:
             # 다른 리포트 타입들은 향후 확장
             report_data = {}
@@ -456,11 +739,7 @@ def download_report():
                 filename += f"_{month:02d}"
             filename += ".csv"
             
-            from flask import make_response
-            response = make_response(content)
-            response.headers['Content-Type'] = 'text/csv; charset=utf-8'
-            response.headers['Content-Disposition'] = f'attachment; filename="{filename}"'
-            return response
+            return send_download(content.encode('utf-8'), filename, 'text/csv; charset=utf-8')
             
         elif format_type == 'pdf':
             buffer = generator.generate_pdf_report(report_data, report_type, period_name)
@@ -469,11 +748,7 @@ def download_report():
                 filename += f"_{month:02d}"
             filename += ".pdf"
             
-            from flask import make_response
-            response = make_response(buffer.getvalue())
-            response.headers['Content-Type'] = 'application/pdf'
-            response.headers['Content-Disposition'] = f'attachment; filename="{filename}"'
-            return response
+            return send_download(buffer, filename, 'application/pdf')
         
         else:
             return jsonify({'error': '지원하지 않는 파일 형식입니다.'}), 400
@@ -481,8 +756,15 @@ def download_report():
     except Exception as e:
         return jsonify({'error': f'리포트 다운로드에 실패했습니다: {str(e)}'}), 500
 
-def get_summary_report_data(period_filter, period_name):
-    """종합 리포트 데이터 수집"""
+def get_summary_report_data(year, month=None):
+    """종합 리포트 데이터 수집 (month가 없으면 연간)
+
+    기간 조건은 날짜 컬럼의 [시작, 다음 시작) 범위와 급여 기간 코드(YYYY-MM) 범위로 준다.
+    """
+    start, end = period_bounds(year, month)
+    start_period, end_period = period_codes(year, month)
+    period_name = f"{year}년 {month}월" if month else f"{year}년"
+    
     # 직원 현황
     employee_summary = {
         'total_employees': Employee.query.count(),
@@ -494,24 +776,40 @@ def get_summary_report_data(period_filter, period_name):
     attendance_summary = db.session.query(
         func.count(AttendanceRecord.id).label('total_days'),
         func.avg(AttendanceRecord.work_hours).label('avg_hours'),
-        func.count(case([(AttendanceRecord.status == '지각', 1)])).label('late_days'),
-        func.count(case([(AttendanceRecord.status == '결근', 1)])).label('absent_days')
-    ).filter(period_filter.replace(PayrollRecord.created_at, AttendanceRecord.date)).first()
+        func.count(case((AttendanceRecord.status == '지각', 1))).label('late_days'),
+        func.count(case((AttendanceRecord.status == '결근', 1))).label('absent_days')
+    ).filter(
+        AttendanceRecord.date_range(start, end)
+    ).first()
     
-    # 급여 현황
+    # 급여 현황 (급여 지급 기간 기준)
     payroll_summary = db.session.query(
         func.count(PayrollRecord.id).label('total_payrolls'),
         func.sum(PayrollRecord.gross_pay).label('total_gross'),
         func.sum(PayrollRecord.net_pay).label('total_net'),
         func.sum(PayrollRecord.total_deductions).label('total_deductions')
-    ).filter(period_filter).first()
+    ).filter(
+        PayrollRecord.period_range(start_period, end_period)
+    ).first()
     
-    # 평가 현황
-    evaluation_summary = db.session.query(
-        func.count(Evaluation.id).label('total_evaluations'),
-        func.count(case([(Evaluation.status == 'completed', 1)])).label('completed'),
-        func.avg(case([(Evaluation.status == 'completed', Evaluation.total_score)])).label('avg_score')
-    ).filter(period_filter.replace(PayrollRecord.created_at, Evaluation.created_at)).first()
+    # 평가 현황 (평균 점수는 완료/승인된 평가 결과, 평가 테이블이 없으면 0)
+    evaluation_summary = SimpleNamespace(total_evaluations=0, completed=0)
+    avg_score = None
+    if tables_exist('evaluations', 'evaluation_results'):
+        evaluation_summary = db.session.query(
+            func.count(Evaluation.id).label('total_evaluations'),
+            func.count(case((Evaluation.status.in_(('완료', '마감')), 1))).label('completed')
+        ).filter(
+            Evaluation.created_at >= start,
+            Evaluation.created_at < end
+        ).first()
+        avg_score = db.session.query(
+            func.avg(EvaluationResult.total_score)
+        ).join(Evaluation, EvaluationResult.evaluation_id == Evaluation.id).filter(
+            EvaluationResult.completed_condition(),
+            Evaluation.created_at >= start,
+            Evaluation.created_at < end
+        ).scalar()
     
     return {
         'period': period_name,
@@ -538,7 +836,6 @@ def get_summary_report_data(period_filter, period_name):
             'total_evaluations': evaluation_summary.total_evaluations or 0,
             'completed': evaluation_summary.completed or 0,
             'completion_rate': round((evaluation_summary.completed or 0) / max(evaluation_summary.total_evaluations or 1, 1) * 100, 1),
-            'avg_score': round(float(evaluation_summary.avg_score or 0), 1)
+            'avg_score': round(float(avg_score or 0), 1)
         }
     }
-
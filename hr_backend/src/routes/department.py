@@ -5,6 +5,7 @@ from src.models.user import db, User
 from src.models.employee import Employee
 from src.models.department import Department
 from src.models.audit_log import AuditLog
+from src.utils.change_tracking import etag_cached
 
 department_bp = Blueprint('department', __name__)
 
@@ -17,6 +18,7 @@ def require_admin():
 
 @department_bp.route('/departments', methods=['GET'])
 @jwt_required()
+@etag_cached(tables=('departments', 'employees'))
 def get_departments():
     """부서 목록 조회"""
     try:
@@ -5,6 +5,7 @@ from src.models.user import db, User
 from src.models.employee import Employee
 from src.models.department import Department
 from src.models.audit_log import AuditLog
+from src.utils.change_tracking import etag_cached
 
 employee_bp = Blueprint('employee', __name__)
 
@@ -17,6 +18,7 @@ def require_admin():
 
 @employee_bp.route('/employees', methods=['GET'])
 @jwt_required()
+@etag_cached(tables=('employees', 'departments', 'users'))
 def get_employees():
     """직원 목록 조회"""
     try:
@@ -158,6 +160,9 @@ def create_employee():
             birth_date=datetime.strptime(data['birth_date'], '%Y-%m-%d').date() if data.get('birth_date') else None,
             address=data.get('address'),
             salary_grade=data.get('salary_grade'),
+            bank_name=data.get('bank_name'),
+            bank_account_number=data.get('bank_account_number'),
+            account_holder=data.get('account_holder'),
             status=data.get('status', 'active')
         )
         
@@ -217,7 +222,8 @@ def update_employee(employee_id):
         # 필드 업데이트
         updatable_fields = [
             'name', 'email', 'phone', 'position', 'department_id',
-            'birth_date', 'address', 'salary_grade', 'status'
+            'birth_date', 'address', 'salary_grade', 'status',
+            'bank_name', 'bank_account_number', 'account_holder'
         ]
         
         for field in updatable_fields:
@@ -9,11 +9,13 @@ from src.models.annual_leave_grant import AnnualLeaveGrant
 from src.models.employee import Employee
 from src.utils.auth import admin_required
 from src.utils.audit import log_action
+from src.utils.change_tracking import etag_cached
 
 leave_request_bp = Blueprint('leave_request', __name__)
 
 @leave_request_bp.route('/leave-requests', methods=['GET'])
 @jwt_required()
+@etag_cached(tables=('leave_requests', 'employees', 'departments', 'users'))
 def get_leave_requests():
     """휴가 신청 목록 조회"""
     try:
@@ -147,21 +149,13 @@ def create_leave_request():
         # 연차인 경우 잔여일수 확인
         if data['type'] == '연차':
             year = start_date.year
-            grant = AnnualLeaveGrant.query.filter_by(
-                employee_id=employee_id,
-                year=year
-            ).first()
+            grant = AnnualLeaveGrant.for_employee_year(employee_id, year).first()
             
             if not grant:
                 return jsonify({'error': f'{year}년도 연차가 부여되지 않았습니다.'}), 400
             
             # 사용한 연차 조회
-            from sqlalchemy import func
-            used_query = db.session.query(func.sum(AnnualLeaveUsage.used_days)).filter(
-                AnnualLeaveUsage.employee_id == employee_id,
-                func.extract('year', AnnualLeaveUsage.usage_date) == year
-            )
-            total_used = used_query.scalar() or 0
+            total_used = AnnualLeaveUsage.used_days_in_year(employee_id, year)
             
             # 잔여 연차 확인
             remaining = grant.total_days - total_used
@@ -272,18 +266,10 @@ def update_leave_request(request_id):
         # 연차인 경우 잔여일수 재확인
         if leave_request.type == '연차':
             year = leave_request.start_date.year
-            grant = AnnualLeaveGrant.query.filter_by(
-                employee_id=leave_request.employee_id,
-                year=year
-            ).first()
+            grant = AnnualLeaveGrant.for_employee_year(leave_request.employee_id, year).first()
             
             if grant:
-                from sqlalchemy import func
-                used_query = db.session.query(func.sum(AnnualLeaveUsage.used_days)).filter(
-                    AnnualLeaveUsage.employee_id == leave_request.employee_id,
-                    func.extract('year', AnnualLeaveUsage.usage_date) == year
-                )
-                total_used = used_query.scalar() or 0
+                total_used = AnnualLeaveUsage.used_days_in_year(leave_request.employee_id, year)
                 
                 remaining = grant.total_days - total_used
                 if leave_request.days_requested > remaining:
@@ -1,37 +1,93 @@
-from flask import Blueprint, request, jsonify, send_file
+from flask import Blueprint, request, jsonify, Response, current_app, stream_with_context, url_for
 from flask_jwt_extended import jwt_required, get_jwt_identity
-from sqlalchemy import and_, or_, desc, func
+from sqlalchemy import and_, or_, desc, func, insert, update, select, case
+from sqlalchemy.orm import contains_eager, joinedload
 from datetime import datetime, timedelta
 import calendar
-import tempfile
-import os
+import csv
+import base64
+import json
+import uuid
 
 from ..models.user import db, User
 from ..models.employee import Employee
 from ..models.department import Department
 from ..models.payroll_record import PayrollRecord
-from ..utils.pdf_generator import PayrollPDFGenerator
+from ..models.payroll_period_summary import PayrollPeriodSummary
+from ..models.payroll_recalc_job import PayrollRecalcJob
+from ..models.payroll_year_settlement import PayrollYearSettlement
+from ..utils.pdf_generator import get_payroll_pdf_generator
+from ..utils.payroll_work_fields import WORK_FIELDS, collect_work_fields
+from ..utils.pdf_cache import get_payslip_cache
+from ..utils.payroll_recalc_runner import submit_recalculation
+from ..utils.download import send_download
+from ..utils.payroll_import import (
+    IMPORT_AMOUNT_FIELDS, IMPORT_HOUR_FIELDS, IMPORT_INTEGER_FIELDS, read_import_rows, chunked, parse_import_row
+)
+from ..utils.payroll_data_export import EXPORT_BATCH_SIZE, EXPORT_FORMATS, iter_csv, iter_ndjson
+from ..utils.bank_transfer import TRANSFER_BATCH_SIZE, TRANSFER_FORMATS, iter_transfer_file
+from ..utils.payslip_export import (
+    snapshot_payroll_record, register_export, get_export_progress, stream_payslip_zip
+)
 from ..models.audit_log import AuditLog
 from ..utils.auth import admin_required, get_current_user
+from ..utils import tax_engine
 
 payroll_bp = Blueprint('payroll', __name__)
 
+# 급여명세서 입력 금액 항목 (총액, 세금, 보험료는 계산으로 채움)
+PAYROLL_AMOUNT_FIELDS = (
+    ('basic_salary',) + PayrollRecord.ALLOWANCE_FIELDS + PayrollRecord.BONUS_FIELDS +
+    PayrollRecord.MANUAL_DEDUCTION_FIELDS
+)
+
+# 전월 대비 변동 비교 항목 (기본급, 수당, 보너스, 공제, 총 지급액, 실지급액)
+VARIANCE_FIELDS = (
+    'basic_salary', 'total_allowances', 'total_bonus', 'total_deductions', 'gross_pay', 'net_pay'
+)
+
+def parse_period(period):
+    """'YYYY-MM' 형식의 기간을 (year, month)로 변환 (형식 오류 시 None)"""
+    try:
+        parsed = datetime.strptime(period, '%Y-%m')
+    except (TypeError, ValueError):
+        return None
+    return parsed.year, parsed.month
+
+def encode_cursor(position):
+    """키셋 페이지네이션 위치 (year, month, name, id)를 cursor 문자열로 변환"""
+    raw = json.dumps(list(position), ensure_ascii=False).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii')
+
+def decode_cursor(cursor):
+    """cursor 문자열을 (year, month, name, id)로 변환 (형식 오류 시 None)"""
+    try:
+        year, month, name, record_id = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+        return int(year), int(month), str(name), int(record_id)
+    except (ValueError, TypeError, UnicodeError):
+        return None
+
 @payroll_bp.route('/payroll-records', methods=['GET'])
 @jwt_required()
 @admin_required
-def get_payroll_records():
-    """급여명세서 목록 조회 (관리자 전용)"""
+def get_payroll_records(current_user):
+    """급여명세서 목록 조회 (관리자 전용)
+
+    기본은 page/per_page 기반 페이지네이션이며, cursor 파라미터가 있으면
+    (year, month, name, id) 키셋 페이지네이션으로 동작한다. 빈 cursor는 첫 페이지.
+    """
     try:
         # 쿼리 파라미터
-        page = request.args.get('page', 1, type=int)
-        per_page = request.args.get('per_page', 10, type=int)
+        page = max(request.args.get('page', 1, type=int), 1)
+        per_page = min(max(request.args.get('per_page', 10, type=int), 1), 100)
         search = request.args.get('search', '').strip()
         period = request.args.get('period', '').strip()
         department_id = request.args.get('department_id', type=int)
         status = request.args.get('status', '').strip()
+        cursor = request.args.get('cursor')
         
         # 기본 쿼리
-        query = PayrollRecord.query.join(Employee).join(Department)
+        query = PayrollRecord.query.join(Employee).join(Department, Employee.department_id == Department.id)
         
         # 검색 조건
         if search:
@@ -52,27 +108,59 @@ def get_payroll_records():
         if status:
             query = query.filter(PayrollRecord.status == status)
         
-        # 정렬 및 페이지네이션
-        query = query.order_by(desc(PayrollRecord.year), desc(PayrollRecord.month), Employee.name)
-        paginated = query.paginate(page=page, per_page=per_page, error_out=False)
-        
-        # 통계 정보
-        total_records = query.count()
-        total_gross_pay = db.session.query(func.sum(PayrollRecord.gross_pay)).filter(
-            PayrollRecord.id.in_([r.id for r in query.all()])
-        ).scalar() or 0
-        total_net_pay = db.session.query(func.sum(PayrollRecord.net_pay)).filter(
-            PayrollRecord.id.in_([r.id for r in query.all()])
-        ).scalar() or 0
+        # 통계 정보 (필터링된 쿼리에 대한 단일 집계)
+        stats = query.with_entities(
+            func.count(PayrollRecord.id).label('total_records'),
+            func.coalesce(func.sum(PayrollRecord.gross_pay), 0).label('total_gross_pay'),
+            func.coalesce(func.sum(PayrollRecord.net_pay), 0).label('total_net_pay')
+        ).order_by(None).one()
+        total_records = stats.total_records
+        total_gross_pay = stats.total_gross_pay
+        total_net_pay = stats.total_net_pay
         
-        return jsonify({
-            'payroll_records': [record.to_dict() for record in paginated.items],
-            'pagination': {
+        # 정렬 및 페이지네이션
+        query = query.options(
+            contains_eager(PayrollRecord.employee).contains_eager(Employee.department)
+        ).order_by(desc(PayrollRecord.year), desc(PayrollRecord.month), Employee.name, PayrollRecord.id)
+        
+        if cursor is not None:
+            if cursor:
+                position = decode_cursor(cursor)
+                if not position:
+                    return jsonify({'error': '유효하지 않은 cursor입니다.'}), 400
+                year, month, name, record_id = position
+                query = query.filter(or_(
+                    PayrollRecord.year < year,
+                    and_(PayrollRecord.year == year, PayrollRecord.month < month),
+                    and_(PayrollRecord.year == year, PayrollRecord.month == month, Employee.name > name),
+                    and_(PayrollRecord.year == year, PayrollRecord.month == month,
+                         Employee.name == name, PayrollRecord.id > record_id)
+                ))
+            
+            records = query.limit(per_page + 1).all()
+            has_next = len(records) > per_page
+            records = records[:per_page]
+            last = records[-1] if records else None
+            pagination = {
+                'per_page': per_page,
+                'total': total_records,
+                'has_next': has_next,
+                'next_cursor': encode_cursor(
+                    (last.year, last.month, last.employee.name, last.id)
+                ) if has_next else None
+            }
+        else:
+            records = query.limit(per_page).offset((page - 1) * per_page).all()
+            pagination = {
                 'page': page,
-                'pages': paginated.pages,
+                'pages': (total_records + per_page - 1) // per_page,
                 'per_page': per_page,
-                'total': paginated.total
-            },
+                'total': total_records
+            }
+        
+        return jsonify({
+            'payroll_records': [record.to_dict() for record in records],
+            'pagination': pagination,
             'statistics': {
                 'total_records': total_records,
                 'total_gross_pay': total_gross_pay,
@@ -88,10 +176,9 @@ def get_payroll_records():
 @payroll_bp.route('/payroll-records', methods=['POST'])
 @jwt_required()
 @admin_required
-def create_payroll_record():
+def create_payroll_record(current_user):
     """급여명세서 생성 (관리자 전용)"""
     try:
-        current_user = get_current_user()
         data = request.get_json()
         
         # 필수 필드 검증
@@ -145,6 +232,13 @@ def create_payroll_record():
         payroll_record.calculate_totals()
         
         db.session.add(payroll_record)
+        PayrollPeriodSummary.apply_delta(
+            payroll_record.period,
+            employee_count=1,
+            gross_pay=payroll_record.gross_pay,
+            net_pay=payroll_record.net_pay
+        )
+        PayrollYearSettlement.refresh(payroll_record.year, [payroll_record.employee_id])
         db.session.commit()
         
         # 감사 로그
@@ -165,6 +259,35 @@ def create_payroll_record():
         db.session.rollback()
         return jsonify({'error': f'급여명세서 생성 실패: {str(e)}'}), 500
 
+@payroll_bp.route('/payroll-preview', methods=['POST'])
+@jwt_required()
+def preview_payroll():
+    """급여 계산 미리보기 (저장 없이 총액, 4대보험, 세금, 실지급액 계산)
+
+    편집 화면에서 입력할 때마다 호출하므로 DB와 세션을 사용하지 않는다.
+    period(YYYY-MM)를 주면 해당 연도의 요율표를 적용한다.
+    """
+    try:
+        data = request.get_json(silent=True) or {}
+
+        year = None
+        if data.get('period'):
+            year_month = parse_period(data['period'])
+            if not year_month:
+                return jsonify({'error': 'period는 YYYY-MM 형식이어야 합니다.'}), 400
+            year = year_month[0]
+
+        try:
+            result = tax_engine.preview(data, year)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+
+        del result['year']
+        return jsonify({'preview': result}), 200
+
+    except Exception as e:
+        return jsonify({'error': f'급여 계산 미리보기 실패: {str(e)}'}), 500
+
 @payroll_bp.route('/payroll-records/<int:record_id>', methods=['GET'])
 @jwt_required()
 def get_payroll_record(record_id):
@@ -188,10 +311,9 @@ def get_payroll_record(record_id):
 @payroll_bp.route('/payroll-records/<int:record_id>', methods=['PUT'])
 @jwt_required()
 @admin_required
-def update_payroll_record(record_id):
+def update_payroll_record(current_user, record_id):
     """급여명세서 수정 (관리자 전용)"""
     try:
-        current_user = get_current_user()
         data = request.get_json()
         
         payroll_record = PayrollRecord.query.get_or_404(record_id)
@@ -209,6 +331,9 @@ def update_payroll_record(record_id):
             'holiday_hours', 'annual_leave_used', 'annual_leave_remaining', 'memo'
         ]
         
+        previous_gross_pay = payroll_record.gross_pay
+        previous_net_pay = payroll_record.net_pay
+        
         # 필드 업데이트
         for field in updatable_fields:
             if field in data:
@@ -223,7 +348,14 @@ def update_payroll_record(record_id):
         payroll_record.updated_by = current_user.id
         payroll_record.updated_at = datetime.utcnow()
         
+        PayrollPeriodSummary.apply_delta(
+            payroll_record.period,
+            gross_pay=payroll_record.gross_pay - previous_gross_pay,
+            net_pay=payroll_record.net_pay - previous_net_pay
+        )
+        PayrollYearSettlement.refresh(payroll_record.year, [payroll_record.employee_id])
         db.session.commit()
+        get_payslip_cache().invalidate(payroll_record.id)
         
         # 감사 로그
         AuditLog.log_action(
@@ -246,10 +378,9 @@ def update_payroll_record(record_id):
 @payroll_bp.route('/payroll-records/<int:record_id>/finalize', methods=['POST'])
 @jwt_required()
 @admin_required
-def finalize_payroll_record(record_id):
+def finalize_payroll_record(current_user, record_id):
     """급여명세서 확정 (관리자 전용)"""
     try:
-        current_user = get_current_user()
         
         payroll_record = PayrollRecord.query.get_or_404(record_id)
         
@@ -261,6 +392,8 @@ def finalize_payroll_record(record_id):
         payroll_record.updated_by = current_user.id
         payroll_record.updated_at = datetime.utcnow()
         
+        PayrollPeriodSummary.apply_delta(payroll_record.period, finalized_count=1)
+        PayrollYearSettlement.refresh(payroll_record.year, [payroll_record.employee_id])
         db.session.commit()
         
         # 감사 로그
@@ -284,10 +417,9 @@ def finalize_payroll_record(record_id):
 @payroll_bp.route('/payroll-records/<int:record_id>', methods=['DELETE'])
 @jwt_required()
 @admin_required
-def delete_payroll_record(record_id):
+def delete_payroll_record(current_user, record_id):
     """급여명세서 삭제 (관리자 전용)"""
     try:
-        current_user = get_current_user()
         
         payroll_record = PayrollRecord.query.get_or_404(record_id)
         
@@ -298,8 +430,16 @@ def delete_payroll_record(record_id):
         employee_name = payroll_record.employee.name
         period = payroll_record.period
         
+        PayrollPeriodSummary.apply_delta(
+            period,
+            employee_count=-1,
+            gross_pay=-payroll_record.gross_pay,
+            net_pay=-payroll_record.net_pay
+        )
         db.session.delete(payroll_record)
+        PayrollYearSettlement.refresh(payroll_record.year, [payroll_record.employee_id])
         db.session.commit()
+        get_payslip_cache().invalidate(record_id)
         
         # 감사 로그
         AuditLog.log_action(
@@ -319,7 +459,11 @@ def delete_payroll_record(record_id):
 @payroll_bp.route('/my-payroll-records', methods=['GET'])
 @jwt_required()
 def get_my_payroll_records():
-    """내 급여명세서 목록 조회 (사용자)"""
+    """내 급여명세서 목록 조회 (사용자)
+
+    yearly_stats는 올해 합계이며, stats_years(기본 1, 최대 10)를 주면 최근 N년의 연도별 합계를
+    yearly_breakdown으로 함께 반환한다.
+    """
     try:
         current_user = get_current_user()
         
@@ -343,20 +487,36 @@ def get_my_payroll_records():
         query = query.order_by(desc(PayrollRecord.year), desc(PayrollRecord.month))
         paginated = query.paginate(page=page, per_page=per_page, error_out=False)
         
-        # 연간 통계 (현재 연도)
+        # 연간 통계 (현재 연도 포함 최근 stats_years년, 연도별 집계 한 번의 쿼리)
         current_year = datetime.now().year
-        yearly_records = PayrollRecord.query.filter_by(
-            employee_id=employee.id,
-            year=current_year
-        ).all()
-        
-        yearly_stats = {
-            'total_gross_pay': sum(r.gross_pay for r in yearly_records),
-            'total_net_pay': sum(r.net_pay for r in yearly_records),
-            'total_deductions': sum(r.total_deductions for r in yearly_records),
-            'average_gross_pay': sum(r.gross_pay for r in yearly_records) / len(yearly_records) if yearly_records else 0,
-            'records_count': len(yearly_records)
-        }
+        stats_years = min(max(request.args.get('stats_years', 1, type=int), 1), 10)
+        yearly_rows = db.session.query(
+            PayrollRecord.year,
+            func.count(PayrollRecord.id).label('records_count'),
+            func.coalesce(func.sum(PayrollRecord.gross_pay), 0).label('total_gross_pay'),
+            func.coalesce(func.sum(PayrollRecord.net_pay), 0).label('total_net_pay'),
+            func.coalesce(func.sum(PayrollRecord.total_deductions), 0).label('total_deductions')
+        ).filter(
+            PayrollRecord.employee_id == employee.id,
+            PayrollRecord.year > current_year - stats_years,
+            PayrollRecord.year <= current_year
+        ).group_by(PayrollRecord.year).all()
+        yearly_totals = {row.year: row for row in yearly_rows}
+        
+        yearly_breakdown = []
+        for stats_year in range(current_year, current_year - stats_years, -1):
+            row = yearly_totals.get(stats_year)
+            records_count = row.records_count if row else 0
+            total_gross_pay = row.total_gross_pay if row else 0
+            yearly_breakdown.append({
+                'year': stats_year,
+                'total_gross_pay': total_gross_pay,
+                'total_net_pay': row.total_net_pay if row else 0,
+                'total_deductions': row.total_deductions if row else 0,
+                'average_gross_pay': total_gross_pay / records_count if records_count else 0,
+                'records_count': records_count
+            })
+        yearly_stats = {key: value for key, value in yearly_breakdown[0].items() if key != 'year'}
         
         return jsonify({
             'payroll_records': [record.to_dict() for record in paginated.items],
@@ -367,6 +527,7 @@ def get_my_payroll_records():
                 'total': paginated.total
             },
             'yearly_stats': yearly_stats,
+            'yearly_breakdown': yearly_breakdown,
             'employee': {
                 'id': employee.id,
                 'name': employee.name,
@@ -385,67 +546,653 @@ def get_my_payroll_records():
 @payroll_bp.route('/payroll-periods', methods=['GET'])
 @jwt_required()
 @admin_required
-def get_payroll_periods():
+def get_payroll_periods(current_user):
     """급여 지급 기간 목록 조회 (관리자 전용)"""
     try:
-        # 모든 급여 기간 조회
-        periods = db.session.query(PayrollRecord.period).distinct().order_by(desc(PayrollRecord.period)).all()
-        period_list = [period[0] for period in periods]
-        
-        # 각 기간별 통계
-        period_stats = []
-        for period in period_list:
-            records = PayrollRecord.query.filter_by(period=period).all()
-            stats = {
-                'period': period,
-                'employee_count': len(records),
-                'total_gross_pay': sum(r.gross_pay for r in records),
-                'total_net_pay': sum(r.net_pay for r in records),
-                'average_gross_pay': sum(r.gross_pay for r in records) / len(records) if records else 0,
-                'finalized_count': len([r for r in records if r.is_final])
-            }
-            period_stats.append(stats)
+        # 기간별 집계 테이블에서 조회
+        summaries = PayrollPeriodSummary.query.filter(
+            PayrollPeriodSummary.employee_count > 0
+        ).order_by(desc(PayrollPeriodSummary.period)).all()
         
         return jsonify({
-            'periods': period_list,
-            'period_statistics': period_stats
+            'periods': [summary.period for summary in summaries],
+            'period_statistics': [summary.to_dict() for summary in summaries]
         }), 200
         
     except Exception as e:
         return jsonify({'error': f'급여 기간 조회 실패: {str(e)}'}), 500
 
+@payroll_bp.route('/payroll-periods/<period>/finalize', methods=['POST'])
+@jwt_required()
+@admin_required
+def finalize_payroll_period(current_user, period):
+    """기간 급여명세서 일괄 확정 (관리자 전용)
+
+    기간(및 선택한 부서)의 미확정 급여명세서를 UPDATE 한 번으로 확정한다.
+    기본급 또는 총 지급액이 0 이하인 미완성 급여명세서가 있으면 확정하지 않고 목록을 반환한다.
+    """
+    try:
+        data = request.get_json(silent=True) or {}
+
+        year_month = parse_period(period)
+        if not year_month:
+            return jsonify({'error': 'period는 YYYY-MM 형식이어야 합니다.'}), 400
+        period = f'{year_month[0]}-{year_month[1]:02d}'
+
+        department_id = data.get('department_id') or request.args.get('department_id', type=int)
+        if department_id and not Department.query.get(department_id):
+            return jsonify({'error': '존재하지 않는 부서입니다.'}), 404
+
+        conditions = [PayrollRecord.period == period, PayrollRecord.is_final.is_(False)]
+        if department_id:
+            conditions.append(PayrollRecord.employee_id.in_(
+                select(Employee.id).where(Employee.department_id == department_id)
+            ))
+
+        # 미완성 급여명세서 확인
+        incomplete = db.session.query(
+            PayrollRecord.id, Employee.employee_number, Employee.name
+        ).join(Employee, PayrollRecord.employee_id == Employee.id).filter(
+            *conditions,
+            or_(PayrollRecord.basic_salary <= 0, PayrollRecord.gross_pay <= 0)
+        ).order_by(Employee.employee_number).limit(100).all()
+        if incomplete:
+            return jsonify({
+                'error': '기본급 또는 총 지급액이 입력되지 않은 급여명세서가 있어 확정할 수 없습니다.',
+                'incomplete_records': [
+                    {'id': row.id, 'employee_number': row.employee_number, 'employee_name': row.name}
+                    for row in incomplete
+                ]
+            }), 400
+
+        totals = db.session.query(
+            func.count(PayrollRecord.id).label('count'),
+            func.coalesce(func.sum(PayrollRecord.gross_pay), 0).label('total_gross_pay'),
+            func.coalesce(func.sum(PayrollRecord.total_deductions), 0).label('total_deductions'),
+            func.coalesce(func.sum(PayrollRecord.net_pay), 0).label('total_net_pay')
+        ).filter(*conditions).one()
+        if not totals.count:
+            return jsonify({'error': '확정할 급여명세서가 없습니다.'}), 400
+
+        result = db.session.execute(
+            update(PayrollRecord).where(*conditions).values(
+                is_final=True,
+                status='확정',
+                updated_by=current_user.id,
+                updated_at=datetime.utcnow()
+            ).execution_options(synchronize_session=False)
+        )
+        finalized_count = result.rowcount
+        PayrollPeriodSummary.apply_delta(period, finalized_count=finalized_count)
+        PayrollYearSettlement.refresh(year_month[0])
+
+        summary = {
+            'period': period,
+            'department_id': department_id,
+            'finalized_count': finalized_count,
+            'total_gross_pay': totals.total_gross_pay,
+            'total_deductions': totals.total_deductions,
+            'total_net_pay': totals.total_net_pay
+        }
+
+        AuditLog.log_action(
+            user_id=current_user.id,
+            action_type='UPDATE',
+            entity_type='payroll_period',
+            entity_id=None,
+            message=f'급여명세서 일괄 확정: {period} ({finalized_count}건)',
+            new_values=summary
+        )
+
+        db.session.commit()
+
+        return jsonify({
+            'message': f'{finalized_count}건의 급여명세서가 확정되었습니다.',
+            'summary': summary
+        }), 200
+
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': f'급여명세서 일괄 확정 실패: {str(e)}'}), 500
+
+@payroll_bp.route('/payroll-periods/<period>/variance', methods=['GET'])
+@jwt_required()
+@admin_required
+def get_payroll_variance(current_user, period):
+    """전월 대비 급여 변동 보고서 (관리자 전용)
+
+    직원별로 LAG() OVER (PARTITION BY employee_id ORDER BY year, month)로 전월 급여명세서 값을 붙여
+    항목군별 증감액/증감률을 계산하고, 가장 큰 증감률(variance_score) 순으로 페이지네이션한다.
+    증감률이 threshold(%) 이상이면 flagged로 표시한다 (전월 0원에서 생긴 항목은 100%로 본다).
+    전체 건수와 flagged 건수도 윈도 함수로 같은 쿼리에서 구한다.
+    """
+    try:
+        year_month = parse_period(period)
+        if not year_month:
+            return jsonify({'error': 'period는 YYYY-MM 형식이어야 합니다.'}), 400
+        year, month = year_month
+        prev_year, prev_month = (year - 1, 12) if month == 1 else (year, month - 1)
+
+        threshold = request.args.get('threshold', 10, type=float)
+        flagged_only = request.args.get('flagged_only', 'false').lower() == 'true'
+        department_id = request.args.get('department_id', type=int)
+        page = max(request.args.get('page', 1, type=int), 1)
+        per_page = min(max(request.args.get('per_page', 50, type=int), 1), 500)
+
+        # 해당 월과 전월 급여명세서에 직원별 전월 값(LAG) 부착
+        window = {
+            'partition_by': PayrollRecord.employee_id,
+            'order_by': (PayrollRecord.year, PayrollRecord.month)
+        }
+        lagged = select(
+            PayrollRecord.id,
+            PayrollRecord.employee_id,
+            PayrollRecord.year,
+            PayrollRecord.month,
+            func.lag(PayrollRecord.id).over(**window).label('previous_id'),
+            *[getattr(PayrollRecord, field) for field in VARIANCE_FIELDS],
+            *[func.lag(getattr(PayrollRecord, field)).over(**window).label(f'previous_{field}')
+              for field in VARIANCE_FIELDS]
+        ).where(
+            or_(
+                and_(PayrollRecord.year == year, PayrollRecord.month == month),
+                and_(PayrollRecord.year == prev_year, PayrollRecord.month == prev_month)
+            )
+        ).subquery()
+
+        def change_score(field):
+            current = lagged.c[field]
+            previous = lagged.c[f'previous_{field}']
+            return case(
+                (previous.is_(None), 0),
+                (previous == 0, case((current == 0, 0), else_=100.0)),
+                else_=func.abs(current - previous) * 100.0 / func.abs(previous)
+            )
+
+        # SQLite의 다중 인자 max()는 가장 큰 값을 반환 (GREATEST)
+        variance_score = func.max(*[change_score(field) for field in VARIANCE_FIELDS]).label('variance_score')
+
+        conditions = [lagged.c.year == year, lagged.c.month == month]
+        if department_id:
+            conditions.append(Employee.department_id == department_id)
+        if flagged_only:
+            conditions.append(variance_score >= threshold)
+
+        rows = db.session.query(
+            lagged,
+            Employee.employee_number,
+            Employee.name.label('employee_name'),
+            Department.name.label('department_name'),
+            variance_score,
+            func.count().over().label('total_count'),
+            func.sum(case((variance_score >= threshold, 1), else_=0)).over().label('flagged_count')
+        ).join(
+            Employee, lagged.c.employee_id == Employee.id
+        ).outerjoin(
+            Department, Employee.department_id == Department.id
+        ).filter(*conditions).order_by(
+            desc('variance_score'), Employee.employee_number
+        ).limit(per_page).offset((page - 1) * per_page).all()
+
+        total = rows[0].total_count if rows else 0
+        records = []
+        for row in rows:
+            changes = {}
+            for field in VARIANCE_FIELDS:
+                current = getattr(row, field)
+                previous = getattr(row, f'previous_{field}')
+                changes[field] = {
+                    'current': current,
+                    'previous': previous,
+                    'delta': current - previous if previous is not None else None,
+                    'percent': round((current - previous) * 100 / previous, 2) if previous else None
+                }
+            records.append({
+                'record_id': row.id,
+                'previous_record_id': row.previous_id,
+                'employee_id': row.employee_id,
+                'employee_number': row.employee_number,
+                'employee_name': row.employee_name,
+                'department_name': row.department_name,
+                'has_previous': row.previous_id is not None,
+                'variance_score': round(row.variance_score, 2),
+                'flagged': row.variance_score >= threshold,
+                'changes': changes
+            })
+
+        return jsonify({
+            'period': f'{year}-{month:02d}',
+            'previous_period': f'{prev_year}-{prev_month:02d}',
+            'threshold': threshold,
+            'flagged_count': rows[0].flagged_count if rows else 0,
+            'records': records,
+            'pagination': {
+                'page': page,
+                'pages': (total + per_page - 1) // per_page,
+                'per_page': per_page,
+                'total': total
+            }
+        }), 200
+
+    except Exception as e:
+        return jsonify({'error': f'급여 변동 보고서 조회 실패: {str(e)}'}), 500
+
 @payroll_bp.route('/payroll-templates', methods=['GET'])
 @jwt_required()
 @admin_required
-def get_payroll_templates():
-    """급여 템플릿 조회 (관리자 전용)"""
+def get_payroll_templates(current_user):
+    """급여 템플릿 조회 (관리자 전용)
+
+    재직 중인 직원마다 가장 최근 급여명세서의 반복 항목을 반환한다 (월 급여 일괄 생성의 기본값).
+    period=YYYY-MM을 주면 그 기간 이전의 급여명세서를 기준으로 하고, department_id로 부서를 제한한다.
+    """
     try:
-        # 최근 급여명세서를 기반으로 템플릿 생성
-        recent_records = PayrollRecord.query.order_by(desc(PayrollRecord.created_at)).limit(10).all()
-        
+        period = request.args.get('period')
+        department_id = request.args.get('department_id', type=int)
+
+        before = None
+        if period:
+            before = parse_period(period)
+            if not before:
+                return jsonify({'error': 'period는 YYYY-MM 형식이어야 합니다.'}), 400
+
+        employee_ids = select(Employee.id).where(Employee.status == 'active')
+        if department_id:
+            employee_ids = employee_ids.where(Employee.department_id == department_id)
+
+        latest = PayrollRecord.latest_per_employee(before=before, employee_ids=employee_ids)
+        rows = db.session.query(
+            PayrollRecord.id,
+            PayrollRecord.period,
+            PayrollRecord.employee_id,
+            Employee.name,
+            Employee.employee_number,
+            PayrollRecord.work_days,
+            *[getattr(PayrollRecord, field) for field in PayrollRecord.RECURRING_FIELDS]
+        ).join(
+            latest, latest.c.id == PayrollRecord.id
+        ).join(
+            Employee, PayrollRecord.employee_id == Employee.id
+        ).order_by(Employee.employee_number).all()
+
         templates = []
-        for record in recent_records:
+        for row in rows:
             template = {
-                'employee_id': record.employee_id,
-                'employee_name': record.employee.name,
-                'basic_salary': record.basic_salary,
-                'position_allowance': record.position_allowance,
-                'meal_allowance': record.meal_allowance,
-                'transport_allowance': record.transport_allowance,
-                'family_allowance': record.family_allowance,
-                'union_fee': record.union_fee,
-                'work_days': record.work_days
+                'record_id': row.id,
+                'period': row.period,
+                'employee_id': row.employee_id,
+                'employee_name': row.name,
+                'employee_number': row.employee_number,
+                'work_days': row.work_days
             }
+            template.update({field: getattr(row, field) for field in PayrollRecord.RECURRING_FIELDS})
             templates.append(template)
-        
+
         return jsonify({
             'templates': templates
         }), 200
-        
+
     except Exception as e:
         return jsonify({'error': f'급여 템플릿 조회 실패: {str(e)}'}), 500
 
+@payroll_bp.route('/payroll-runs', methods=['POST'])
+@jwt_required()
+@admin_required
+def create_payroll_run(current_user):
+    """월 급여 일괄 생성 (관리자 전용)
+
+    재직 중인 직원 전체(또는 특정 부서)의 초안 급여명세서를 한 트랜잭션에서 생성한다.
+    반복 항목은 직원별 가장 최근 급여명세서(/payroll-templates와 같은 기준)에서 복사하고,
+    근무일수/연장·야간·휴일 근무시간/연차는 출퇴근·연차 기록의 그룹 집계로 채우며(fill_work_fields),
+    세금/보험료는 일괄 계산 후 벌크 insert 한다.
+    """
+    try:
+        data = request.get_json() or {}
+
+        period = (data.get('period') or '').strip()
+        year_month = parse_period(period)
+        if not year_month:
+            return jsonify({'error': 'period는 YYYY-MM 형식이어야 합니다.'}), 400
+        year, month = year_month
+        period = f'{year}-{month:02d}'
 
+        department_id = data.get('department_id')
+        if department_id and not Department.query.get(department_id):
+            return jsonify({'error': '존재하지 않는 부서입니다.'}), 404
+
+        defaults = data.get('defaults') or {}
+        copy_previous = data.get('copy_previous', True)
+        fill_work_fields = data.get('fill_work_fields', True)
+
+        # 대상 직원
+        employee_query = db.session.query(Employee.id).filter(Employee.status == 'active')
+        if department_id:
+            employee_query = employee_query.filter(Employee.department_id == department_id)
+        employee_ids = [row.id for row in employee_query.all()]
+
+        # 이미 해당 기간 급여명세서가 있는 직원은 건너뜀
+        existing_ids = {
+            row.employee_id for row in db.session.query(PayrollRecord.employee_id).filter(
+                PayrollRecord.period == period,
+                PayrollRecord.employee_id.in_(employee_ids)
+            ).all()
+        } if employee_ids else set()
+        target_ids = [employee_id for employee_id in employee_ids if employee_id not in existing_ids]
+
+        # 직원별 가장 최근(해당 기간 이전) 급여명세서의 반복 항목
+        previous_values = {}
+        if copy_previous and target_ids:
+            latest = PayrollRecord.latest_per_employee(before=(year, month), employee_ids=target_ids)
+            previous_rows = db.session.query(
+                PayrollRecord.employee_id,
+                *[getattr(PayrollRecord, field) for field in PayrollRecord.RECURRING_FIELDS]
+            ).join(latest, latest.c.id == PayrollRecord.id).all()
+            previous_values = {row.employee_id: row._asdict() for row in previous_rows}
+
+        # 출퇴근/연차 기록 기반 근무 정보
+        work_values = collect_work_fields(target_ids, year, month) if fill_work_fields and target_ids else {}
+
+        now = datetime.utcnow()
+        rows = []
+        for employee_id in target_ids:
+            row = {field: float(defaults.get(field, 0) or 0) for field in PAYROLL_AMOUNT_FIELDS}
+            previous = previous_values.get(employee_id)
+            if previous:
+                for field in PayrollRecord.RECURRING_FIELDS:
+                    if field not in defaults:
+                        row[field] = previous[field]
+            if fill_work_fields:
+                row.update(work_values.get(employee_id) or dict.fromkeys(WORK_FIELDS, 0))
+            row.update({
+                'employee_id': employee_id,
+                'period': period,
+                'year': year,
+                'month': month,
+                'status': '초안',
+                'is_final': False,
+                'created_by': current_user.id,
+                'created_at': now
+            })
+            rows.append(row)
+
+        # 세금 및 보험료, 총액 일괄 계산 후 벌크 insert
+        PayrollRecord.calculate_batch(rows)
+        if rows:
+            db.session.execute(insert(PayrollRecord), rows)
+            PayrollPeriodSummary.apply_delta(
+                period,
+                employee_count=len(rows),
+                gross_pay=sum(row['gross_pay'] for row in rows),
+                net_pay=sum(row['net_pay'] for row in rows)
+            )
+            PayrollYearSettlement.refresh(year, target_ids)
+
+        summary = {
+            'period': period,
+            'department_id': department_id,
+            'target_employees': len(employee_ids),
+            'created_count': len(rows),
+            'skipped_count': len(existing_ids),
+            'copied_from_previous': len(previous_values),
+            'work_fields_filled': len(work_values),
+            'total_gross_pay': sum(row['gross_pay'] for row in rows),
+            'total_deductions': sum(row['total_deductions'] for row in rows),
+            'total_net_pay': sum(row['net_pay'] for row in rows)
+        }
+
+        AuditLog.log_action(
+            user_id=current_user.id,
+            action_type='CREATE',
+            entity_type='payroll_run',
+            entity_id=None,
+            message=f'급여 일괄 생성: {period} ({len(rows)}건 생성, {len(existing_ids)}건 건너뜀)',
+            new_values=summary
+        )
+
+        db.session.commit()
+
+        return jsonify({
+            'message': f'{len(rows)}건의 급여명세서가 생성되었습니다.',
+            'summary': summary
+        }), 201
+
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': f'급여 일괄 생성 실패: {str(e)}'}), 500
+
+@payroll_bp.route('/payroll-imports', methods=['POST'])
+@jwt_required()
+@admin_required
+def import_payroll_records(current_user):
+    """급여 항목 파일 가져오기 (관리자 전용)
+
+    업로드한 CSV/XLSX 파일(file)의 행마다 (직원, 기간) 급여명세서를 생성하거나 수정한다.
+    파일은 스트림으로 읽어 IMPORT_CHUNK_SIZE 행씩 미리 읽어 둔 사번 -> 직원 id 맵으로 검증하고,
+    묶음 단위로 세금/보험료를 일괄 계산한 뒤 벌크 insert/update 한다.
+    잘못된 행은 행 번호와 함께 오류 목록에 담고 나머지 행은 계속 처리한다.
+    파일에 period 열이 없으면 폼 필드 period를 사용한다.
+    """
+    upload = request.files.get('file')
+    if not upload or not upload.filename:
+        return jsonify({'error': '가져올 파일(file)이 필요합니다.'}), 400
+    default_period = request.form.get('period')
+
+    try:
+        employee_ids = dict(db.session.query(Employee.employee_number, Employee.id).all())
+        # 생성 시 채울 값 / 수정 시 기존 값을 읽을 항목 (행마다 같은 키를 가져야 executemany로 묶임)
+        work_fields = IMPORT_HOUR_FIELDS + IMPORT_INTEGER_FIELDS
+        input_fields = IMPORT_AMOUNT_FIELDS + work_fields + ('memo',)
+        now = datetime.utcnow()
+
+        result = {'total_rows': 0, 'created_count': 0, 'updated_count': 0, 'failed_count': 0, 'errors': []}
+        period_deltas = {}
+        settlement_keys = set()
+        seen_keys = set()
+
+        def add_error(row_number, employee_number, errors):
+            result['errors'].append({'row': row_number, 'employee_number': employee_number, 'errors': errors})
+
+        def add_delta(period, employee_count, gross_pay, net_pay):
+            delta = period_deltas.setdefault(period, {'employee_count': 0, 'gross_pay': 0, 'net_pay': 0})
+            delta['employee_count'] += employee_count
+            delta['gross_pay'] += gross_pay
+            delta['net_pay'] += net_pay
+
+        for chunk in chunked(read_import_rows(upload)):
+            # 행 검증
+            valid_rows = []
+            for row_number, raw in chunk:
+                result['total_rows'] += 1
+                values, errors = parse_import_row(raw, default_period)
+                employee_number = values.pop('employee_number')
+                employee_id = employee_ids.get(employee_number)
+                if employee_number and employee_id is None:
+                    errors.append(f'존재하지 않는 사번입니다: {employee_number}')
+                key = (employee_id, values.get('period'))
+                if not errors and key in seen_keys:
+                    errors.append('파일 안에 같은 직원/기간 행이 이미 있습니다.')
+                if errors:
+                    add_error(row_number, employee_number, errors)
+                    continue
+                seen_keys.add(key)
+                values['employee_id'] = employee_id
+                valid_rows.append((row_number, employee_number, values))
+
+            if not valid_rows:
+                continue
+
+            # 묶음에 해당하는 기존 급여명세서 조회
+            existing_rows = db.session.query(
+                PayrollRecord.id, PayrollRecord.employee_id, PayrollRecord.period, PayrollRecord.is_final,
+                PayrollRecord.gross_pay, PayrollRecord.net_pay,
+                *[getattr(PayrollRecord, field) for field in input_fields]
+            ).filter(
+                PayrollRecord.employee_id.in_({values['employee_id'] for _, _, values in valid_rows}),
+                PayrollRecord.period.in_({values['period'] for _, _, values in valid_rows})
+            ).all()
+            existing = {(row.employee_id, row.period): row for row in existing_rows}
+
+            inserts = []
+            updates = []
+            previous_totals = {}
+            for row_number, employee_number, values in valid_rows:
+                record = existing.get((values['employee_id'], values['period']))
+                if record is None:
+                    row = {field: 0 for field in input_fields}
+                    row['memo'] = None
+                    row.update(values)
+                    row.update({'status': '초안', 'is_final': False, 'created_by': current_user.id, 'created_at': now})
+                    inserts.append(row)
+                    settlement_keys.add((values['year'], values['employee_id']))
+                elif record.is_final:
+                    add_error(row_number, employee_number, ['확정된 급여명세서는 수정할 수 없습니다.'])
+                else:
+                    row = {field: getattr(record, field) for field in input_fields}
+                    row.update({field: value for field, value in values.items() if field in input_fields})
+                    row.update({'id': record.id, 'updated_by': current_user.id, 'updated_at': now})
+                    previous_totals[record.id] = (record.period, record.gross_pay, record.net_pay)
+                    updates.append(row)
+                    settlement_keys.add((values['year'], values['employee_id']))
+
+            # 세금 및 보험료, 총액 일괄 계산 후 벌크 insert/update
+            PayrollRecord.calculate_batch(inserts + updates)
+            if inserts:
+                db.session.execute(insert(PayrollRecord), inserts)
+            if updates:
+                db.session.execute(update(PayrollRecord), updates)
+
+            for row in inserts:
+                add_delta(row['period'], 1, row['gross_pay'], row['net_pay'])
+            for row in updates:
+                period, gross_pay, net_pay = previous_totals[row['id']]
+                add_delta(period, 0, row['gross_pay'] - gross_pay, row['net_pay'] - net_pay)
+            result['created_count'] += len(inserts)
+            result['updated_count'] += len(updates)
+
+        for period, delta in period_deltas.items():
+            PayrollPeriodSummary.apply_delta(period, **delta)
+        PayrollYearSettlement.refresh_many(settlement_keys)
+
+        result['failed_count'] = len(result['errors'])
+
+        AuditLog.log_action(
+            user_id=current_user.id,
+            action_type='CREATE',
+            entity_type='payroll_import',
+            entity_id=None,
+            message=f'급여 항목 가져오기: {upload.filename} '
+                    f'({result["created_count"]}건 생성, {result["updated_count"]}건 수정, {result["failed_count"]}건 오류)',
+            new_values={key: value for key, value in result.items() if key != 'errors'}
+        )
+
+        db.session.commit()
+
+        return jsonify({
+            'message': f'{result["created_count"] + result["updated_count"]}건의 급여명세서를 가져왔습니다.',
+            'summary': result
+        }), 200
+
+    except (ValueError, csv.Error) as e:
+        db.session.rollback()
+        return jsonify({'error': f'파일을 읽을 수 없습니다: {str(e)}'}), 400
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': f'급여 항목 가져오기 실패: {str(e)}'}), 500
+
+@payroll_bp.route('/payroll-recalculations', methods=['POST'])
+@jwt_required()
+@admin_required
+def create_payroll_recalculation(current_user):
+    """초안 급여명세서 일괄 재계산 등록 (관리자 전용)
+
+    start_period ~ end_period 범위의 초안 급여명세서를 현재 요율표로 다시 계산하는 작업을 만들어
+    백그라운드에서 실행하고 202로 바로 응답한다. 진행 상황은 /payroll-recalculations/<job_id>로 조회하며,
+    chunk_size건씩 커밋하므로 중단된 작업은 /payroll-recalculations/<job_id>/resume 으로 이어서 실행한다.
+    """
+    try:
+        data = request.get_json() or {}
+
+        start = parse_period(data.get('start_period'))
+        end = parse_period(data.get('end_period') or data.get('start_period'))
+        if not start or not end:
+            return jsonify({'error': 'start_period, end_period는 YYYY-MM 형식이어야 합니다.'}), 400
+        if start > end:
+            return jsonify({'error': 'start_period가 end_period보다 늦을 수 없습니다.'}), 400
+
+        chunk_size = data.get('chunk_size', 500)
+        if not isinstance(chunk_size, int) or not 1 <= chunk_size <= 5000:
+            return jsonify({'error': 'chunk_size는 1~5000 사이의 정수여야 합니다.'}), 400
+
+        job = PayrollRecalcJob(
+            start_period=f'{start[0]}-{start[1]:02d}',
+            end_period=f'{end[0]}-{end[1]:02d}',
+            chunk_size=chunk_size,
+            status='queued',
+            created_by=current_user.id
+        )
+        job.total_count = job.count_targets()
+        db.session.add(job)
+        db.session.commit()
+
+        return start_payroll_recalculation(job, current_user)
+
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': f'급여 일괄 재계산 실패: {str(e)}'}), 500
+
+@payroll_bp.route('/payroll-recalculations/<int:job_id>/resume', methods=['POST'])
+@jwt_required()
+@admin_required
+def resume_payroll_recalculation(current_user, job_id):
+    """중단된 급여 일괄 재계산 이어서 실행 (관리자 전용)
+
+    failed 작업과, running이지만 heartbeat가 끊긴(실행하던 워커가 죽은) 작업을 다시 점유한다.
+    """
+    try:
+        job = PayrollRecalcJob.query.get_or_404(job_id)
+        if job.status == 'completed':
+            return jsonify({'error': '이미 완료된 재계산 작업입니다.'}), 400
+
+        return start_payroll_recalculation(job, current_user)
+
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': f'급여 일괄 재계산 재개 실패: {str(e)}'}), 500
+
+@payroll_bp.route('/payroll-recalculations', methods=['GET'])
+@jwt_required()
+@admin_required
+def get_payroll_recalculations(current_user):
+    """급여 일괄 재계산 작업 목록 (관리자 전용, 최근 20건)"""
+    try:
+        jobs = PayrollRecalcJob.query.order_by(desc(PayrollRecalcJob.id)).limit(20).all()
+        return jsonify({'jobs': [job.to_dict() for job in jobs]}), 200
+
+    except Exception as e:
+        return jsonify({'error': f'급여 일괄 재계산 작업 조회 실패: {str(e)}'}), 500
+
+@payroll_bp.route('/payroll-recalculations/<int:job_id>', methods=['GET'])
+@jwt_required()
+@admin_required
+def get_payroll_recalculation(current_user, job_id):
+    """급여 일괄 재계산 진행 상황 조회 (관리자 전용)"""
+    job = PayrollRecalcJob.query.get_or_404(job_id)
+    return jsonify({'job': job.to_dict()}), 200
+
+def start_payroll_recalculation(job, current_user):
+    """재계산 작업을 점유하여 백그라운드 실행에 등록 후 202 응답 (다른 워커가 실행 중이면 409)"""
+    if not submit_recalculation(job, current_user.id):
+        return jsonify({'error': '이미 실행 중인 재계산 작업입니다.', 'job': job.to_dict()}), 409
+
+    status_url = url_for('payroll.get_payroll_recalculation', job_id=job.id)
+    response = jsonify({
+        'message': f'{job.total_count}건의 초안 급여명세서 재계산을 시작했습니다.',
+        'job': job.to_dict(),
+        'status_url': status_url
+    })
+    response.status_code = 202
+    response.headers['Location'] = status_url
+    return response
 
 @payroll_bp.route('/payroll-records/<int:payroll_id>/pdf', methods=['GET'])
 @jwt_required()
@@ -466,15 +1213,6 @@ def download_payroll_pdf(payroll_id):
         if current_user.role != 'admin' and payroll.employee.user_id != current_user.id:
             return jsonify({'error': '권한이 없습니다.'}), 403
         
-        # PDF 생성
-        pdf_generator = PayrollPDFGenerator()
-        pdf_buffer = pdf_generator.generate_payroll_pdf(payroll)
-        
-        # 임시 파일로 저장
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp_file:
-            tmp_file.write(pdf_buffer.getvalue())
-            tmp_file_path = tmp_file.name
-        
         # 파일명 생성
         filename = f"급여명세서_{payroll.employee.name}_{payroll.year}년{payroll.month:02d}월.pdf"
         
@@ -487,22 +1225,10 @@ def download_payroll_pdf(payroll_id):
             message=f"급여명세서 PDF 다운로드: {payroll.employee.name} ({payroll.year}년 {payroll.month}월)"
         )
         
-        return send_file(
-            tmp_file_path,
-            as_attachment=True,
-            download_name=filename,
-            mimetype='application/pdf'
-        )
+        return send_payroll_pdf(payroll, filename)
         
     except Exception as e:
         return jsonify({'error': f'PDF 생성 중 오류가 발생했습니다: {str(e)}'}), 500
-    finally:
-        # 임시 파일 정리
-        try:
-            if 'tmp_file_path' in locals():
-                os.unlink(tmp_file_path)
-        except:
-            pass
 
 @payroll_bp.route('/my-payroll-records/<int:payroll_id>/pdf', methods=['GET'])
 @jwt_required()
@@ -524,15 +1250,6 @@ def download_my_payroll_pdf(payroll_id):
         if not payroll:
             return jsonify({'error': '급여명세서를 찾을 수 없습니다.'}), 404
         
-        # PDF 생성
-        pdf_generator = PayrollPDFGenerator()
-        pdf_buffer = pdf_generator.generate_payroll_pdf(payroll)
-        
-        # 임시 파일로 저장
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp_file:
-            tmp_file.write(pdf_buffer.getvalue())
-            tmp_file_path = tmp_file.name
-        
         # 파일명 생성
         filename = f"급여명세서_{payroll.year}년{payroll.month:02d}월.pdf"
         
@@ -545,22 +1262,409 @@ def download_my_payroll_pdf(payroll_id):
             message=f"내 급여명세서 PDF 다운로드: {payroll.year}년 {payroll.month}월"
         )
         
-        return send_file(
-            tmp_file_path,
-            as_attachment=True,
-            download_name=filename,
-            mimetype='application/pdf'
-        )
+        return send_payroll_pdf(payroll, filename)
         
     except Exception as e:
         return jsonify({'error': f'PDF 생성 중 오류가 발생했습니다: {str(e)}'}), 500
-    finally:
-        # 임시 파일 정리
-        try:
-            if 'tmp_file_path' in locals():
-                os.unlink(tmp_file_path)
-        except:
-            pass
+
+@payroll_bp.route('/payroll-periods/<period>/payslips.zip', methods=['GET'])
+@jwt_required()
+@admin_required
+def export_payroll_pdfs(current_user, period):
+    """기간별 급여명세서 PDF 일괄 다운로드 (관리자 전용)
+
+    급여명세서를 프로세스 풀에서 병렬로 렌더링하여 완료되는 순서대로 ZIP 응답에 스트리밍한다.
+    진행 상황은 X-Export-Id 헤더의 ID로 /payroll-exports/<export_id>에서 조회할 수 있다.
+    """
+    try:
+        department_id = request.args.get('department_id', type=int)
+        export_id = request.args.get('export_id') or uuid.uuid4().hex
+        
+        if get_export_progress(export_id):
+            return jsonify({'error': '이미 사용 중인 export_id입니다.'}), 400
+        
+        query = PayrollRecord.query.join(Employee).options(
+            contains_eager(PayrollRecord.employee).joinedload(Employee.department)
+        ).filter(PayrollRecord.period == period)
+        
+        if department_id:
+            query = query.filter(Employee.department_id == department_id)
+        
+        records = query.order_by(Employee.employee_number).all()
+        if not records:
+            return jsonify({'error': '해당 기간의 급여명세서가 없습니다.'}), 404
+        
+        snapshots = [snapshot_payroll_record(record) for record in records]
+        progress = register_export(export_id, period, len(snapshots))
+        
+        AuditLog.log_action(
+            user_id=current_user.id,
+            action_type='DOWNLOAD',
+            entity_type='payroll_pdf',
+            entity_id=None,
+            message=f'급여명세서 PDF 일괄 다운로드: {period} ({len(snapshots)}건)'
+        )
+        db.session.commit()
+        
+        response = Response(
+            stream_payslip_zip(
+                snapshots,
+                progress,
+                max_workers=current_app.config.get('PAYSLIP_EXPORT_WORKERS'),
+                cache=get_payslip_cache()
+            ),
+            mimetype='application/zip'
+        )
+        response.headers['Content-Disposition'] = f'attachment; filename="payslips_{period}.zip"'
+        response.headers['X-Export-Id'] = export_id
+        response.headers['X-Export-Total'] = str(len(snapshots))
+        return response
+        
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': f'급여명세서 일괄 다운로드 실패: {str(e)}'}), 500
+
+@payroll_bp.route('/payroll-exports/<export_id>', methods=['GET'])
+@jwt_required()
+@admin_required
+def get_payroll_export_progress(current_user, export_id):
+    """급여명세서 일괄 다운로드 진행 상황 조회 (관리자 전용)"""
+    progress = get_export_progress(export_id)
+    if not progress:
+        return jsonify({'error': '내보내기 작업을 찾을 수 없습니다.'}), 404
+    
+    return jsonify({'export': progress.to_dict()}), 200
+
+@payroll_bp.route('/payroll-records/export', methods=['GET'])
+@jwt_required()
+@admin_required
+def export_payroll_records(current_user):
+    """급여 데이터 내보내기 (관리자 전용)
+
+    기간(period=YYYY-MM) 또는 연도(year) 단위의 급여명세서를 CSV/NDJSON(format)으로 스트리밍한다.
+    직원/부서 정보를 조인한 평면 컬럼만 조회하고 yield_per로 EXPORT_BATCH_SIZE 행씩 읽으면서
+    바로 응답에 쓰므로 행 수와 관계없이 메모리 사용량이 일정하다.
+    """
+    try:
+        export_format = request.args.get('format', 'csv').lower()
+        if export_format not in EXPORT_FORMATS:
+            return jsonify({'error': 'format은 csv 또는 ndjson이어야 합니다.'}), 400
+
+        period = request.args.get('period')
+        year = request.args.get('year', type=int)
+        department_id = request.args.get('department_id', type=int)
+
+        conditions = []
+        if period:
+            year_month = parse_period(period)
+            if not year_month:
+                return jsonify({'error': 'period는 YYYY-MM 형식이어야 합니다.'}), 400
+            conditions += [PayrollRecord.year == year_month[0], PayrollRecord.month == year_month[1]]
+            scope = f'{year_month[0]}-{year_month[1]:02d}'
+        elif year:
+            conditions.append(PayrollRecord.year == year)
+            scope = str(year)
+        else:
+            return jsonify({'error': 'period 또는 year가 필요합니다.'}), 400
+        if department_id:
+            conditions.append(Employee.department_id == department_id)
+
+        export_columns = [
+            PayrollRecord.id,
+            Employee.employee_number,
+            Employee.name.label('employee_name'),
+            Department.name.label('department_name'),
+            PayrollRecord.period,
+            PayrollRecord.year,
+            PayrollRecord.month,
+            *[getattr(PayrollRecord, field) for field in PAYROLL_AMOUNT_FIELDS],
+            PayrollRecord.total_allowances,
+            PayrollRecord.total_bonus,
+            PayrollRecord.gross_pay,
+            PayrollRecord.national_pension,
+            PayrollRecord.health_insurance,
+            PayrollRecord.employment_insurance,
+            PayrollRecord.long_term_care,
+            PayrollRecord.income_tax,
+            PayrollRecord.local_tax,
+            PayrollRecord.total_deductions,
+            PayrollRecord.net_pay,
+            PayrollRecord.work_days,
+            PayrollRecord.overtime_hours,
+            PayrollRecord.night_hours,
+            PayrollRecord.holiday_hours,
+            PayrollRecord.annual_leave_used,
+            PayrollRecord.annual_leave_remaining,
+            PayrollRecord.status,
+            PayrollRecord.is_final,
+            PayrollRecord.created_at,
+            PayrollRecord.updated_at
+        ]
+        statement = select(*export_columns).select_from(PayrollRecord).join(
+            Employee, PayrollRecord.employee_id == Employee.id
+        ).outerjoin(
+            Department, Employee.department_id == Department.id
+        ).where(*conditions).order_by(
+            PayrollRecord.year, PayrollRecord.month, Employee.employee_number, PayrollRecord.id
+        ).execution_options(yield_per=EXPORT_BATCH_SIZE)
+        column_names = [column.key for column in export_columns]
+
+        AuditLog.log_action(
+            user_id=current_user.id,
+            action_type='DOWNLOAD',
+            entity_type='payroll_export',
+            entity_id=None,
+            message=f'급여 데이터 내보내기: {scope} ({export_format})'
+        )
+        db.session.commit()
+
+        write_rows = iter_csv if export_format == 'csv' else iter_ndjson
+
+        def generate():
+            result = db.session.execute(statement)
+            try:
+                yield from write_rows(column_names, result)
+            finally:
+                result.close()
+
+        content_type, extension = EXPORT_FORMATS[export_format]
+        response = Response(stream_with_context(generate()), content_type=content_type)
+        response.headers['Content-Disposition'] = f'attachment; filename="payroll_{scope}.{extension}"'
+        return response
+
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': f'급여 데이터 내보내기 실패: {str(e)}'}), 500
+
+@payroll_bp.route('/payroll-periods/<period>/bank-transfer', methods=['GET'])
+@jwt_required()
+@admin_required
+def export_bank_transfer_file(current_user, period):
+    """급여 이체 파일 생성 (관리자 전용)
+
+    기간의 확정된 급여명세서를 사번 순으로 yield_per 커서로 읽어 헤더/데이터/트레일러 형식의
+    CSV 또는 고정 길이(format=fixed) 파일로 바로 스트리밍한다 (ORM 객체를 만들지 않음).
+    계좌 정보가 없는 직원이 있으면 파일을 만들지 않고 목록을 반환한다.
+    """
+    try:
+        file_format = request.args.get('format', 'csv').lower()
+        if file_format not in TRANSFER_FORMATS:
+            return jsonify({'error': 'format은 csv 또는 fixed이어야 합니다.'}), 400
+
+        year_month = parse_period(period)
+        if not year_month:
+            return jsonify({'error': 'period는 YYYY-MM 형식이어야 합니다.'}), 400
+        year, month = year_month
+        period = f'{year}-{month:02d}'
+
+        conditions = [PayrollRecord.year == year, PayrollRecord.month == month, PayrollRecord.is_final.is_(True)]
+
+        # 계좌 정보 누락 확인
+        missing_account = or_(
+            func.coalesce(Employee.bank_name, '') == '',
+            func.coalesce(Employee.bank_account_number, '') == ''
+        )
+        missing = db.session.query(
+            PayrollRecord.id, Employee.employee_number, Employee.name
+        ).join(Employee, PayrollRecord.employee_id == Employee.id).filter(
+            *conditions, missing_account
+        ).order_by(Employee.employee_number).limit(100).all()
+        if missing:
+            return jsonify({
+                'error': '계좌 정보가 등록되지 않은 직원이 있어 이체 파일을 만들 수 없습니다.',
+                'missing_accounts': [
+                    {'id': row.id, 'employee_number': row.employee_number, 'employee_name': row.name}
+                    for row in missing
+                ]
+            }), 400
+
+        record_count = db.session.query(func.count(PayrollRecord.id)).filter(*conditions).scalar()
+        if not record_count:
+            return jsonify({'error': '해당 기간에 확정된 급여명세서가 없습니다.'}), 400
+
+        statement = select(
+            Employee.employee_number,
+            func.coalesce(Employee.account_holder, Employee.name),
+            Employee.bank_name,
+            Employee.bank_account_number,
+            PayrollRecord.net_pay
+        ).select_from(PayrollRecord).join(
+            Employee, PayrollRecord.employee_id == Employee.id
+        ).where(*conditions).order_by(
+            Employee.employee_number, PayrollRecord.id
+        ).execution_options(yield_per=TRANSFER_BATCH_SIZE)
+
+        AuditLog.log_action(
+            user_id=current_user.id,
+            action_type='DOWNLOAD',
+            entity_type='payroll_bank_transfer',
+            entity_id=None,
+            message=f'급여 이체 파일 생성: {period} ({record_count}건, {file_format})'
+        )
+        db.session.commit()
+
+        def generate():
+            result = db.session.execute(statement)
+            try:
+                yield from iter_transfer_file(period, result, file_format)
+            finally:
+                result.close()
+
+        content_type, extension = TRANSFER_FORMATS[file_format]
+        response = Response(stream_with_context(generate()), content_type=content_type)
+        response.headers['Content-Disposition'] = f'attachment; filename="bank_transfer_{period}.{extension}"'
+        return response
+
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': f'급여 이체 파일 생성 실패: {str(e)}'}), 500
+
+@payroll_bp.route('/payroll-settlements/<int:year>', methods=['GET'])
+@jwt_required()
+@admin_required
+def get_payroll_settlements(current_user, year):
+    """연말정산용 직원별 연간 급여 합계 조회 (관리자 전용)
+
+    payroll_year_settlements 롤업 테이블을 사번 순으로 페이지 조회하거나,
+    format=csv|ndjson이면 전체를 스트리밍으로 내보낸다.
+    """
+    try:
+        export_format = request.args.get('format')
+        if export_format and export_format.lower() not in EXPORT_FORMATS:
+            return jsonify({'error': 'format은 csv 또는 ndjson이어야 합니다.'}), 400
+        department_id = request.args.get('department_id', type=int)
+
+        columns = [
+            Employee.employee_number,
+            Employee.name.label('employee_name'),
+            Department.name.label('department_name'),
+            PayrollYearSettlement.employee_id,
+            PayrollYearSettlement.year,
+            PayrollYearSettlement.record_count,
+            PayrollYearSettlement.finalized_count,
+            *[getattr(PayrollYearSettlement, field) for field in PayrollYearSettlement.AMOUNT_FIELDS],
+            PayrollYearSettlement.updated_at
+        ]
+        statement = select(*columns).select_from(PayrollYearSettlement).join(
+            Employee, PayrollYearSettlement.employee_id == Employee.id
+        ).outerjoin(
+            Department, Employee.department_id == Department.id
+        ).where(PayrollYearSettlement.year == year)
+        if department_id:
+            statement = statement.where(Employee.department_id == department_id)
+        statement = statement.order_by(Employee.employee_number, PayrollYearSettlement.employee_id)
+        column_names = [column.key for column in columns]
+
+        if export_format:
+            export_format = export_format.lower()
+            AuditLog.log_action(
+                user_id=current_user.id,
+                action_type='DOWNLOAD',
+                entity_type='payroll_settlement',
+                entity_id=None,
+                message=f'연말정산 급여 합계 내보내기: {year} ({export_format})'
+            )
+            db.session.commit()
+
+            write_rows = iter_csv if export_format == 'csv' else iter_ndjson
+            streamed = statement.execution_options(yield_per=EXPORT_BATCH_SIZE)
+
+            def generate():
+                result = db.session.execute(streamed)
+                try:
+                    yield from write_rows(column_names, result)
+                finally:
+                    result.close()
+
+            content_type, extension = EXPORT_FORMATS[export_format]
+            response = Response(stream_with_context(generate()), content_type=content_type)
+            response.headers['Content-Disposition'] = f'attachment; filename="payroll_settlement_{year}.{extension}"'
+            return response
+
+        page = max(request.args.get('page', 1, type=int), 1)
+        per_page = min(max(request.args.get('per_page', 100, type=int), 1), 1000)
+
+        count_statement = select(func.count()).select_from(PayrollYearSettlement).where(
+            PayrollYearSettlement.year == year
+        )
+        if department_id:
+            count_statement = count_statement.join(
+                Employee, PayrollYearSettlement.employee_id == Employee.id
+            ).where(Employee.department_id == department_id)
+        total = db.session.execute(count_statement).scalar()
+
+        rows = db.session.execute(statement.limit(per_page).offset((page - 1) * per_page)).all()
+
+        return jsonify({
+            'year': year,
+            'settlements': [
+                {
+                    **row._asdict(),
+                    'updated_at': row.updated_at.isoformat() if row.updated_at else None
+                }
+                for row in rows
+            ],
+            'pagination': {
+                'page': page,
+                'pages': (total + per_page - 1) // per_page,
+                'per_page': per_page,
+                'total': total
+            }
+        }), 200
+
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': f'연말정산 급여 합계 조회 실패: {str(e)}'}), 500
+
+@payroll_bp.route('/payroll-settlements/<int:year>/rebuild', methods=['POST'])
+@jwt_required()
+@admin_required
+def rebuild_payroll_settlements(current_user, year):
+    """연도 전체 직원의 연간 급여 합계 재집계 (관리자 전용)
+
+    GROUP BY employee_id 한 번으로 해당 연도의 롤업 행을 모두 다시 만든다.
+    """
+    try:
+        employee_count = PayrollYearSettlement.refresh(year)
+
+        AuditLog.log_action(
+            user_id=current_user.id,
+            action_type='UPDATE',
+            entity_type='payroll_settlement',
+            entity_id=None,
+            message=f'연말정산 급여 합계 재집계: {year} ({employee_count}명)'
+        )
+        db.session.commit()
+
+        return jsonify({
+            'message': f'{employee_count}명의 {year}년 급여 합계를 재집계했습니다.',
+            'year': year,
+            'employee_count': employee_count
+        }), 200
+
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': f'연말정산 급여 합계 재집계 실패: {str(e)}'}), 500
+
+def send_payroll_pdf(payroll, filename):
+    """급여명세서 PDF 응답 (확정된 급여명세서는 캐시된 파일을 그대로 전송)"""
+    if payroll.is_final:
+        cache = get_payslip_cache()
+        pdf_path = cache.get(payroll)
+        if not pdf_path:
+            pdf_buffer = get_payroll_pdf_generator().generate_payroll_pdf(payroll)
+            pdf_path = cache.put(payroll, pdf_buffer.getvalue())
+        
+        return send_download(
+            pdf_path,
+            filename,
+            'application/pdf',
+            etag=cache.key_for(payroll),
+            last_modified=payroll.updated_at or payroll.created_at
+        )
+    
+    pdf_buffer = get_payroll_pdf_generator().generate_payroll_pdf(payroll)
+    return send_download(pdf_buffer, filename, 'application/pdf')
 
 def log_action(user_id, action_type, entity_type, entity_id, message):
     """감사 로그 기록 헬퍼 함수"""
@@ -0,0 +1,85 @@
+import io
+import csv
+from datetime import datetime
+
+# 한 번에 응답으로 내보내는 행 수 (DB에서도 이 단위로 가져옴)
+TRANSFER_BATCH_SIZE = 1000
+
+# 이체 파일 형식 -> (Content-Type, 확장자)
+TRANSFER_FORMATS = {
+    'csv': ('text/csv; charset=utf-8', 'csv'),
+    'fixed': ('text/plain; charset=utf-8', 'txt'),
+}
+
+# 고정 길이 형식의 데이터 레코드 필드 폭 (문자 수 기준)
+FIXED_WIDTHS = {
+    'sequence': 7,
+    'bank_name': 20,
+    'bank_account_number': 20,
+    'account_holder': 20,
+    'amount': 15,
+    'employee_number': 20,
+}
+FIXED_RECORD_LENGTH = 1 + sum(FIXED_WIDTHS.values())
+
+
+def transfer_amount(net_pay):
+    """실지급액을 원 단위 정수 이체 금액으로"""
+    return int(round(net_pay or 0))
+
+
+def _fit(value, width):
+    return str(value or '')[:width].ljust(width)
+
+
+def _fixed_line(record_type, body):
+    return (record_type + body).ljust(FIXED_RECORD_LENGTH) + '\r\n'
+
+
+def iter_transfer_file(period, rows, file_format='csv', batch_size=TRANSFER_BATCH_SIZE):
+    """급여 이체 파일을 텍스트 청크로 생성 (헤더 - 데이터 - 트레일러)
+
+    rows는 (employee_number, account_holder, bank_name, bank_account_number, net_pay) 행 iterable이다.
+    데이터 레코드를 쓰는 같은 순회에서 건수와 금액 합계를 누적하여 트레일러(통제 합계)에 기록한다.
+    """
+    created_at = datetime.now().strftime('%Y%m%d%H%M%S')
+    period_code = period.replace('-', '')
+    buffer = io.StringIO()
+
+    if file_format == 'fixed':
+        writer = None
+        buffer.write(_fixed_line('H', period_code.ljust(8) + created_at))
+    else:
+        writer = csv.writer(buffer, lineterminator='\r\n')
+        buffer.write('\ufeff')
+        writer.writerow(['H', period_code, created_at])
+
+    count = 0
+    total = 0
+    for employee_number, account_holder, bank_name, bank_account_number, net_pay in rows:
+        amount = transfer_amount(net_pay)
+        count += 1
+        total += amount
+
+        if writer is None:
+            buffer.write(_fixed_line('D', ''.join((
+                str(count).zfill(FIXED_WIDTHS['sequence']),
+                _fit(bank_name, FIXED_WIDTHS['bank_name']),
+                _fit(bank_account_number, FIXED_WIDTHS['bank_account_number']),
+                _fit(account_holder, FIXED_WIDTHS['account_holder']),
+                str(amount).zfill(FIXED_WIDTHS['amount']),
+                _fit(employee_number, FIXED_WIDTHS['employee_number'])
+            ))))
+        else:
+            writer.writerow(['D', count, bank_name, bank_account_number, account_holder, amount, employee_number])
+
+        if count % batch_size == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+
+    if writer is None:
+        buffer.write(_fixed_line('T', str(count).zfill(FIXED_WIDTHS['sequence']) + str(total).zfill(18)))
+    else:
+        writer.writerow(['T', count, total])
+    yield buffer.getvalue()
@@ -0,0 +1,72 @@
+import threading
+
+from flask import current_app
+
+
+class VersionedCache:
+    """프로세스 단위 조회 결과 캐시 (네임스페이스별 버전)
+
+    값은 (네임스페이스, 키)로 저장하며 저장 시점의 버전을 함께 기록한다.
+    버전은 호출하는 쪽이 넘긴 값(예: 데이터베이스의 테이블 변경 카운터)을 쓰고, 넘기지 않으면
+    네임스페이스 버전을 쓴다. 네임스페이스 버전은 이 프로세스의 bump()로만 바뀌므로, 다른 프로세스의
+    쓰기까지 반영해야 하는 값은 공유되는 버전을 넘겨야 한다.
+    """
+
+    def __init__(self):
+        self._versions = {}
+        self._entries = {}
+        self._hits = {}
+        self._misses = {}
+        self._lock = threading.Lock()
+
+    def version(self, namespace):
+        return self._versions.get(namespace, 0)
+
+    def get_or_compute(self, namespace, key, compute, version=None):
+        """캐시된 값 반환 (없거나 버전이 바뀌었으면 compute()로 계산 후 같은 키에 덮어씀)"""
+        with self._lock:
+            if version is None:
+                version = self.version(namespace)
+            entry = self._entries.get((namespace, key))
+            if entry is not None and entry[0] == version:
+                self._hits[namespace] = self._hits.get(namespace, 0) + 1
+                return entry[1]
+            self._misses[namespace] = self._misses.get(namespace, 0) + 1
+
+        value = compute()
+
+        with self._lock:
+            # 계산하는 동안 버전이 바뀌었으면 이전 버전 값으로 저장되므로 다음 조회에서 다시 계산된다
+            self._entries[(namespace, key)] = (version, value)
+        return value
+
+    def bump(self, *namespaces):
+        """네임스페이스 버전을 올려 저장된 값 무효화"""
+        with self._lock:
+            for namespace in namespaces:
+                self._versions[namespace] = self.version(namespace) + 1
+                for entry_key in [entry_key for entry_key in self._entries if entry_key[0] == namespace]:
+                    del self._entries[entry_key]
+
+    def stats(self):
+        with self._lock:
+            namespaces = set(self._versions) | set(self._hits) | set(self._misses)
+            return {
+                namespace: {
+                    'version': self.version(namespace),
+                    'hits': self._hits.get(namespace, 0),
+                    'misses': self._misses.get(namespace, 0),
+                    'entries': sum(1 for entry_key in self._entries if entry_key[0] == namespace)
+                }
+                for namespace in sorted(namespaces)
+            }
+
+
+def get_query_cache():
+    """현재 앱의 조회 결과 캐시"""
+    cache = current_app.extensions.get('query_cache')
+    if cache is None:
+        cache = VersionedCache()
+        current_app.extensions['query_cache'] = cache
+    return cache
+
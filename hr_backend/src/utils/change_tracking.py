@@ -0,0 +1,123 @@
+import hashlib
+import hmac
+from datetime import date
+from functools import wraps
+
+from flask import current_app, request, make_response
+from flask_jwt_extended import get_jwt, get_jwt_identity
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from ..models.table_version import TableVersion
+
+# 세션에서 아직 커밋되지 않은 변경 테이블을 모아 두는 session.info 키
+_PENDING_KEY = 'changed_tables'
+
+
+def table_versions(tables):
+    """테이블 이름 목록의 현재 변경 카운터 -> (테이블, 버전) 튜플"""
+    versions = TableVersion.current(tables)
+    return tuple((table, versions.get(table, 0)) for table in tables)
+
+
+def bump_tables(engine, tables):
+    """테이블 변경 카운터 증가 (마이그레이션처럼 세션 밖에서 데이터를 바꾼 경우 직접 호출)"""
+    tables = [table for table in tables if table != TableVersion.__tablename__]
+    if tables:
+        with engine.begin() as connection:
+            TableVersion.bump(connection, tables)
+
+
+def version_snapshot():
+    return TableVersion.current()
+
+
+def _pending(session):
+    return session.info.setdefault(_PENDING_KEY, set())
+
+
+def _collect_flushed_tables(session, flush_context):
+    pending = _pending(session)
+    for instance in (*session.new, *session.dirty, *session.deleted):
+        pending.update(table.name for table in inspect(instance).mapper.tables)
+    pending.discard(TableVersion.__tablename__)
+
+
+def _collect_executed_tables(orm_execute_state):
+    # query.update()/delete()와 session.execute(insert/update/delete)는 flush를 거치지 않는다
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        table = getattr(orm_execute_state.statement, 'table', None)
+        name = getattr(table, 'name', None)
+        if name and name != TableVersion.__tablename__:
+            _pending(orm_execute_state.session).add(name)
+
+
+def _bump_changed_tables(session):
+    # 남은 변경을 먼저 flush해야 이번 커밋에 들어갈 테이블이 모두 모인다
+    session.flush()
+    tables = session.info.pop(_PENDING_KEY, None)
+    if tables:
+        TableVersion.bump(session, tables)
+
+
+def _discard_pending_tables(session):
+    session.info.pop(_PENDING_KEY, None)
+
+
+def register_change_tracking():
+    """모든 SQLAlchemy 세션의 쓰기를 테이블별 변경 카운터(table_versions)에 반영하도록 이벤트 등록
+
+    flush(after_flush)와 DML 실행(do_orm_execute)에서 바뀐 테이블을 모았다가 커밋 직전(before_commit)에
+    같은 트랜잭션 안에서 카운터를 올리고, 롤백되면 버린다. 카운터가 데이터베이스에 있으므로
+    여러 워커 프로세스가 떠 있어도 다른 프로세스의 쓰기가 ETag에 반영된다.
+    """
+    for name, listener in (
+        ('after_flush', _collect_flushed_tables),
+        ('do_orm_execute', _collect_executed_tables),
+        ('before_commit', _bump_changed_tables),
+        ('after_rollback', _discard_pending_tables),
+    ):
+        if not event.contains(Session, name, listener):
+            event.listen(Session, name, listener)
+
+
+def _request_etag(tables):
+    """요청 경로/쿼리 인자, 사용자, 날짜, 테이블 버전으로 만든 ETag 값"""
+    parts = [
+        request.full_path,
+        str(get_jwt_identity()),
+        str(get_jwt().get('role')),
+        date.today().isoformat(),
+        repr(table_versions(tables)),
+    ]
+    secret = str(current_app.config.get('JWT_SECRET_KEY') or current_app.config.get('SECRET_KEY') or '')
+    return hmac.new(secret.encode('utf-8'), '\n'.join(parts).encode('utf-8'), hashlib.sha256).hexdigest()[:32]
+
+
+def etag_cached(tables):
+    """GET 응답에 테이블 변경 카운터 기반 ETag를 붙이고 If-None-Match가 같으면 304 반환
+
+    @jwt_required()와 관리자 확인(@admin_required) 아래에 두어 권한 확인을 통과한 요청에만
+    304를 돌려준다. tables에는 뷰가 읽는 테이블 이름을 모두 준다.
+    """
+    tables = tuple(sorted(set(tables)))
+
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            if request.method != 'GET':
+                return f(*args, **kwargs)
+
+            etag = _request_etag(tables)
+            if request.if_none_match.contains(etag):
+                response = make_response('', 304)
+            else:
+                response = make_response(f(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+            response.set_etag(etag)
+            response.headers['Cache-Control'] = 'private, no-cache'
+            return response
+
+        return decorated_function
+    return decorator
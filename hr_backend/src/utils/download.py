@@ -0,0 +1,30 @@
+import io
+import hashlib
+
+from flask import send_file
+
+
+def send_download(source, download_name, mimetype, etag=None, last_modified=None):
+    """첨부 파일 다운로드 응답 생성
+
+    임시 파일을 만들지 않고 메모리 버퍼(bytes/BytesIO) 또는 기존 파일 경로를 바로 전송한다.
+    Content-Length가 항상 설정되며 Range 요청과 조건부 요청(If-None-Match, If-Modified-Since)을 지원한다.
+    etag를 주지 않으면 메모리 버퍼는 내용 해시로, 파일은 경로/크기/수정 시각으로 ETag를 만든다.
+    """
+    if isinstance(source, (bytes, bytearray)):
+        source = io.BytesIO(source)
+
+    if isinstance(source, io.BytesIO):
+        source.seek(0)
+        if etag is None:
+            etag = hashlib.sha256(source.getbuffer()).hexdigest()[:32]
+
+    return send_file(
+        source,
+        mimetype=mimetype,
+        as_attachment=True,
+        download_name=download_name,
+        conditional=True,
+        etag=etag if etag is not None else True,
+        last_modified=last_modified
+    )
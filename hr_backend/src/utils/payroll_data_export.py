@@ -0,0 +1,55 @@
+import io
+import csv
+import json
+
+# 한 번에 응답으로 내보내는 행 수 (DB에서도 이 단위로 가져옴)
+EXPORT_BATCH_SIZE = 1000
+
+# 내보내기 형식 -> (Content-Type, 확장자)
+EXPORT_FORMATS = {
+    'csv': ('text/csv; charset=utf-8', 'csv'),
+    'ndjson': ('application/x-ndjson; charset=utf-8', 'ndjson'),
+}
+
+
+def _export_value(value):
+    # 날짜/시각은 ISO 형식 문자열로
+    return value.isoformat() if hasattr(value, 'isoformat') else value
+
+
+def iter_csv(columns, rows, batch_size=EXPORT_BATCH_SIZE):
+    """행 iterable을 CSV 텍스트 청크로 변환 (batch_size 행마다 한 청크)
+
+    엑셀에서 한글이 깨지지 않도록 UTF-8 BOM으로 시작한다.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    buffer.write('\ufeff')
+    writer.writerow(columns)
+
+    count = 0
+    for row in rows:
+        writer.writerow([_export_value(value) for value in row])
+        count += 1
+        if count % batch_size == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+
+    yield buffer.getvalue()
+
+
+def iter_ndjson(columns, rows, batch_size=EXPORT_BATCH_SIZE):
+    """행 iterable을 NDJSON(한 줄에 JSON 객체 하나) 텍스트 청크로 변환"""
+    lines = []
+    for row in rows:
+        lines.append(json.dumps(
+            {column: _export_value(value) for column, value in zip(columns, row)},
+            ensure_ascii=False
+        ))
+        if len(lines) >= batch_size:
+            yield '\n'.join(lines) + '\n'
+            lines.clear()
+
+    if lines:
+        yield '\n'.join(lines) + '\n'
@@ -0,0 +1,144 @@
+import io
+import csv
+import math
+from datetime import datetime
+from itertools import islice
+
+try:
+    import openpyxl
+except ImportError:  # XLSX 가져오기는 openpyxl이 설치된 경우에만 지원
+    openpyxl = None
+
+# 한 번에 검증/저장하는 행 수
+IMPORT_CHUNK_SIZE = 500
+
+# 가져오기 파일에서 읽는 금액 항목 (총액, 세금, 보험료는 계산으로 채움)
+IMPORT_AMOUNT_FIELDS = (
+    'basic_salary', 'position_allowance', 'meal_allowance', 'transport_allowance',
+    'family_allowance', 'overtime_allowance', 'night_allowance', 'holiday_allowance',
+    'other_allowances', 'performance_bonus', 'annual_bonus', 'special_bonus',
+    'union_fee', 'other_deductions'
+)
+
+# 근무 정보 항목 (정수 / 실수)
+IMPORT_INTEGER_FIELDS = ('work_days', 'annual_leave_used', 'annual_leave_remaining')
+IMPORT_HOUR_FIELDS = ('overtime_hours', 'night_hours', 'holiday_hours')
+
+
+def read_import_rows(file_storage):
+    """업로드된 CSV/XLSX 파일에서 (행 번호, {열 이름: 값}) 을 차례로 생성
+
+    CSV는 업로드 스트림을 그대로 읽으며, XLSX는 openpyxl 읽기 전용 모드로 행 단위로 읽는다.
+    첫 행은 열 이름(employee_number, period, basic_salary ...)이어야 한다.
+    """
+    filename = (file_storage.filename or '').lower()
+
+    if filename.endswith('.csv'):
+        stream = io.TextIOWrapper(file_storage.stream, encoding='utf-8-sig', newline='')
+        reader = csv.reader(stream)
+        header = next(reader, None)
+        if not header:
+            return
+        header = [column.strip() for column in header]
+        for row_number, values in enumerate(reader, start=2):
+            if not any(value.strip() for value in values):
+                continue
+            yield row_number, dict(zip(header, values))
+
+    elif filename.endswith('.xlsx'):
+        if openpyxl is None:
+            raise ValueError('XLSX 파일을 가져오려면 openpyxl 패키지가 필요합니다. CSV 파일을 사용해주세요.')
+        workbook = openpyxl.load_workbook(file_storage.stream, read_only=True, data_only=True)
+        try:
+            rows = workbook.active.iter_rows(values_only=True)
+            header = next(rows, None)
+            if not header:
+                return
+            header = [str(column).strip() if column is not None else '' for column in header]
+            for row_number, values in enumerate(rows, start=2):
+                if all(value is None or str(value).strip() == '' for value in values):
+                    continue
+                yield row_number, dict(zip(header, values))
+        finally:
+            workbook.close()
+
+    else:
+        raise ValueError('CSV(.csv) 또는 엑셀(.xlsx) 파일만 가져올 수 있습니다.')
+
+
+def chunked(iterable, size=IMPORT_CHUNK_SIZE):
+    """iterable을 size개씩 묶은 리스트로 생성"""
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _parse_number(value, integer=False):
+    """'1,234,000' 같은 숫자 문자열 변환 (빈 값은 None)"""
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        number = value
+    else:
+        text = str(value).strip().replace(',', '')
+        if not text:
+            return None
+        try:
+            number = float(text)
+        except ValueError:
+            raise ValueError('숫자가 아닙니다')
+    if not math.isfinite(number):
+        raise ValueError('숫자가 아닙니다')
+    if number < 0:
+        raise ValueError('음수는 입력할 수 없습니다')
+    if integer:
+        if number != int(number):
+            raise ValueError('정수여야 합니다')
+        return int(number)
+    return float(number)
+
+
+def parse_import_row(raw, default_period=None):
+    """가져오기 행 검증 및 변환 -> (값 dict, 오류 목록)
+
+    값 dict에는 employee_number, period, year, month와 파일에 값이 있는 항목만 담긴다.
+    (비어 있는 항목은 기존 급여명세서의 값을 유지하고, 신규 생성 시에는 0으로 채운다.)
+    """
+    errors = []
+    values = {}
+
+    employee_number = str(raw.get('employee_number') or '').strip()
+    if not employee_number:
+        errors.append('employee_number는 필수 항목입니다.')
+    values['employee_number'] = employee_number
+
+    period = raw.get('period')
+    if isinstance(period, datetime):
+        period = period.strftime('%Y-%m')
+    period = str(period or default_period or '').strip()
+    try:
+        parsed = datetime.strptime(period, '%Y-%m')
+        values.update({'period': f'{parsed.year}-{parsed.month:02d}', 'year': parsed.year, 'month': parsed.month})
+    except ValueError:
+        errors.append('period는 YYYY-MM 형식이어야 합니다.')
+
+    for fields, integer in ((IMPORT_AMOUNT_FIELDS, False), (IMPORT_HOUR_FIELDS, False), (IMPORT_INTEGER_FIELDS, True)):
+        for field in fields:
+            if field not in raw:
+                continue
+            try:
+                number = _parse_number(raw[field], integer=integer)
+            except ValueError as e:
+                errors.append(f'{field}: {e} ({raw[field]})')
+                continue
+            if number is not None:
+                values[field] = number
+
+    memo = raw.get('memo')
+    if memo is not None and str(memo).strip():
+        values['memo'] = str(memo).strip()
+
+    return values, errors
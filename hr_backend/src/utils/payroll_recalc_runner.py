@@ -0,0 +1,62 @@
+import os
+import socket
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from flask import current_app
+
+from ..models.user import db
+from ..models.payroll_recalc_job import PayrollRecalcJob, ClaimLost
+
+# 재계산 작업 스레드 수 (기본 1개: 작업을 등록 순서대로 하나씩 실행하여 SQLite 쓰기 경합을 줄임)
+PAYROLL_RECALC_WORKERS = 1
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor():
+    """재계산용 스레드 풀 반환 (최초 사용 시 PAYROLL_RECALC_WORKERS 설정으로 생성)"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=current_app.config.get('PAYROLL_RECALC_WORKERS', PAYROLL_RECALC_WORKERS),
+                thread_name_prefix='payroll-recalc'
+            )
+        return _executor
+
+
+def new_owner():
+    """작업 점유자 식별자 (호스트:프로세스:실행마다 새 토큰)"""
+    return f'{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}'
+
+
+def submit_recalculation(job, user_id):
+    """재계산 작업을 데이터베이스에서 점유한 뒤 백그라운드 스레드에 등록 (다른 워커가 실행 중이면 False)
+
+    작업은 자체 앱 컨텍스트(별도 세션)에서 job.run()으로 실행되며, 진행 상황과 결과는
+    payroll_recalc_jobs 행에 묶음마다 커밋되므로 상태 조회 API로 확인한다.
+    """
+    owner = new_owner()
+    if not PayrollRecalcJob.claim(job.id, owner):
+        return False
+
+    try:
+        get_executor().submit(_run_job, current_app._get_current_object(), job.id, user_id, owner)
+    except Exception as e:
+        PayrollRecalcJob.release(job.id, owner, str(e))
+        raise
+    return True
+
+
+def _run_job(app, job_id, user_id, owner):
+    with app.app_context():
+        try:
+            db.session.get(PayrollRecalcJob, job_id).run(user_id, owner)
+        except ClaimLost as e:
+            app.logger.warning(str(e))
+        except Exception as e:
+            # run()이 작업을 failed 상태와 오류 메시지로 남기므로 여기서는 기록만 한다
+            app.logger.error(f"급여 일괄 재계산 작업 {job_id} 실패: {str(e)}")
@@ -0,0 +1,113 @@
+import math
+from datetime import date, time
+from sqlalchemy import Integer, and_, case, cast, func
+from ..models.user import db
+from ..models.attendance_record import AttendanceRecord
+from ..models.annual_leave_grant import AnnualLeaveGrant
+from ..models.annual_leave_usage import AnnualLeaveUsage
+
+# 출퇴근/연차 기록으로 채우는 급여명세서 근무 정보 항목
+WORK_FIELDS = (
+    'work_days', 'overtime_hours', 'night_hours', 'holiday_hours',
+    'annual_leave_used', 'annual_leave_remaining'
+)
+
+STANDARD_WORK_HOURS = 8  # 1일 소정 근로시간 (초과분은 연장근무)
+NIGHT_START = time(22, 0)  # 야간근무 시작 시각
+NIGHT_END_HOUR = 6  # 야간근무 종료 시각 (다음날 06시)
+
+
+def _hours_of_day(column):
+    """'HH:MM:SS' 시각 컬럼을 0~24 실수 시간으로"""
+    return cast(func.substr(column, 1, 2), Integer) + cast(func.substr(column, 4, 2), Integer) / 60.0
+
+
+def _days(value):
+    # 근무 정보 연차 컬럼은 정수(일) 단위이므로 반일은 반올림
+    return math.floor(value + 0.5)
+
+
+def collect_work_fields(employee_ids, year, month):
+    """직원별 해당 월 근무 정보 집계 -> {employee_id: {WORK_FIELDS 값}}
+
+    직원 수와 관계없이 그룹 집계 쿼리 3번(출퇴근, 연차 사용, 연차 부여)으로 계산한다.
+    - work_days: 출근 기록(check_in)이 있는 날 수
+    - overtime_hours: 평일 하루 8시간을 넘긴 근무 시간 합계
+    - night_hours: 22시 이후 퇴근분 (자정을 넘긴 경우 다음날 06시까지)
+    - holiday_hours: 토/일요일 근무 시간 합계
+    - annual_leave_used / annual_leave_remaining: 해당 연도 1월 1일부터 이번 달 말일까지의 사용 연차와
+      연도 부여 연차에서 이를 뺀 잔여 연차
+    employee_ids는 목록 또는 서브쿼리를 받는다. 기록이 없는 직원은 결과에 없다.
+    """
+    month_start = date(year, month, 1)
+    next_month_start = date(year + 1, 1, 1) if month == 12 else date(year, month + 1, 1)
+    year_start = date(year, 1, 1)
+
+    # 출퇴근 기록 집계 (해당 월, 반열린 구간)
+    work_hours = func.coalesce(AttendanceRecord.work_hours, 0)
+    is_weekend = func.strftime('%w', AttendanceRecord.date).in_(('0', '6'))
+    check_out_hour = _hours_of_day(AttendanceRecord.check_out)
+    night_hours = case(
+        (AttendanceRecord.check_out.is_(None), 0),
+        (AttendanceRecord.check_out < AttendanceRecord.check_in,
+         (24 - NIGHT_START.hour) + func.min(check_out_hour, NIGHT_END_HOUR)),
+        (AttendanceRecord.check_out > NIGHT_START, check_out_hour - NIGHT_START.hour),
+        else_=0
+    )
+    attendance_rows = db.session.query(
+        AttendanceRecord.employee_id,
+        func.count(func.distinct(case((AttendanceRecord.check_in.isnot(None), AttendanceRecord.date)))).label('work_days'),
+        func.sum(case(
+            (and_(~is_weekend, work_hours > STANDARD_WORK_HOURS), work_hours - STANDARD_WORK_HOURS),
+            else_=0
+        )).label('overtime_hours'),
+        func.sum(night_hours).label('night_hours'),
+        func.sum(case((is_weekend, work_hours), else_=0)).label('holiday_hours')
+    ).filter(
+        AttendanceRecord.employee_id.in_(employee_ids),
+        AttendanceRecord.date_range(month_start, next_month_start)
+    ).group_by(AttendanceRecord.employee_id).all()
+
+    # 연차 사용 (연초 ~ 이번 달 말일)
+    used_rows = db.session.query(
+        AnnualLeaveUsage.employee_id,
+        func.sum(AnnualLeaveUsage.used_days).label('used_days')
+    ).filter(
+        AnnualLeaveUsage.employee_id.in_(employee_ids),
+        AnnualLeaveUsage.usage_date >= year_start,
+        AnnualLeaveUsage.usage_date < next_month_start
+    ).group_by(AnnualLeaveUsage.employee_id).all()
+
+    # 연차 부여 (해당 연도)
+    granted_rows = db.session.query(
+        AnnualLeaveGrant.employee_id,
+        func.sum(AnnualLeaveGrant.total_days).label('total_days')
+    ).filter(
+        AnnualLeaveGrant.employee_id.in_(employee_ids),
+        AnnualLeaveGrant.year == year
+    ).group_by(AnnualLeaveGrant.employee_id).all()
+
+    results = {}
+
+    def entry(employee_id):
+        if employee_id not in results:
+            results[employee_id] = {field: 0 for field in WORK_FIELDS}
+        return results[employee_id]
+
+    for row in attendance_rows:
+        entry(row.employee_id).update({
+            'work_days': row.work_days,
+            'overtime_hours': round(row.overtime_hours or 0, 2),
+            'night_hours': round(row.night_hours or 0, 2),
+            'holiday_hours': round(row.holiday_hours or 0, 2)
+        })
+
+    used = {row.employee_id: row.used_days or 0 for row in used_rows}
+    granted = {row.employee_id: row.total_days or 0 for row in granted_rows}
+    for employee_id in set(used) | set(granted):
+        entry(employee_id).update({
+            'annual_leave_used': _days(used.get(employee_id, 0)),
+            'annual_leave_remaining': _days(granted.get(employee_id, 0) - used.get(employee_id, 0))
+        })
+
+    return results
@@ -0,0 +1,220 @@
+import os
+import threading
+import zipfile
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+from types import SimpleNamespace
+
+from .pdf_generator import get_payroll_pdf_generator
+
+# 프로세스 풀 (요청 간 공유, 최초 사용 시 생성)
+_executor = None
+_executor_lock = threading.Lock()
+
+# 내보내기 진행 상황 (export_id -> ExportProgress)
+_progress = {}
+_progress_lock = threading.Lock()
+MAX_TRACKED_EXPORTS = 100
+
+
+class ExportProgress:
+    """급여명세서 일괄 내보내기 진행 상황"""
+
+    def __init__(self, export_id, period, total):
+        self.export_id = export_id
+        self.period = period
+        self.total = total
+        self.completed = 0
+        self.failed = 0
+        self.status = 'running'  # running, completed, cancelled
+        self.started_at = datetime.utcnow()
+        self.finished_at = None
+
+    def finish(self, status):
+        self.status = status
+        self.finished_at = datetime.utcnow()
+
+    def to_dict(self):
+        return {
+            'export_id': self.export_id,
+            'period': self.period,
+            'total': self.total,
+            'completed': self.completed,
+            'failed': self.failed,
+            'progress': round((self.completed + self.failed) / self.total * 100, 1) if self.total else 100.0,
+            'status': self.status,
+            'started_at': self.started_at.isoformat(),
+            'finished_at': self.finished_at.isoformat() if self.finished_at else None
+        }
+
+
+class ZipStreamBuffer:
+    """zipfile이 쓰는 바이트를 모아 두었다가 응답으로 흘려보내는 쓰기 전용 버퍼
+
+    seek/tell을 지원하지 않으므로 zipfile은 스트리밍 모드(data descriptor)로 기록한다.
+    """
+
+    def __init__(self):
+        self._chunks = []
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        data = b''.join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def register_export(export_id, period, total):
+    """진행 상황 등록 (오래된 완료 항목은 정리)"""
+    progress = ExportProgress(export_id, period, total)
+    with _progress_lock:
+        if len(_progress) >= MAX_TRACKED_EXPORTS:
+            finished = sorted(
+                (item for item in _progress.values() if item.status != 'running'),
+                key=lambda item: item.finished_at
+            )
+            for item in finished[:len(_progress) - MAX_TRACKED_EXPORTS + 1]:
+                del _progress[item.export_id]
+        _progress[export_id] = progress
+    return progress
+
+
+def get_export_progress(export_id):
+    """진행 상황 조회"""
+    with _progress_lock:
+        return _progress.get(export_id)
+
+
+def get_executor(max_workers=None):
+    """PDF 렌더링용 프로세스 풀 반환
+
+    요청 처리 스레드를 fork하지 않도록 spawn 컨텍스트를 사용한다.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(
+                max_workers=max_workers or os.cpu_count(),
+                mp_context=multiprocessing.get_context('spawn')
+            )
+        return _executor
+
+
+def discard_executor(executor):
+    """비정상 종료된 프로세스 풀을 버려 다음 요청에서 새로 생성되게 함"""
+    global _executor
+    with _executor_lock:
+        if _executor is executor:
+            _executor = None
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
+def snapshot_payroll_record(payroll_record):
+    """워커 프로세스로 넘길 수 있는 급여명세서 스냅샷 생성
+
+    PayrollPDFGenerator가 사용하는 속성만 담은 SimpleNamespace로, ORM 세션 없이 pickle 가능하다.
+    """
+    employee = payroll_record.employee
+    department = employee.department if employee else None
+    values = {column.name: getattr(payroll_record, column.name) for column in payroll_record.__table__.columns}
+    values['employee'] = SimpleNamespace(
+        name=employee.name,
+        employee_number=employee.employee_number,
+        position=employee.position,
+        department=SimpleNamespace(name=department.name) if department else None
+    ) if employee else None
+    return SimpleNamespace(**values)
+
+
+def payslip_filename(snapshot):
+    """ZIP 안의 급여명세서 파일명"""
+    return f"급여명세서_{snapshot.period}_{snapshot.employee.employee_number}_{snapshot.employee.name}.pdf"
+
+
+def render_payslip(snapshot):
+    """워커 프로세스에서 급여명세서 한 건 렌더링 -> (파일명, PDF bytes)"""
+    buffer = get_payroll_pdf_generator().generate_payroll_pdf(snapshot)
+    return payslip_filename(snapshot), buffer.getvalue()
+
+
+def stream_payslip_zip(snapshots, progress, max_workers=None, cache=None):
+    """급여명세서를 프로세스 풀에서 병렬 렌더링하며 완료 순서대로 ZIP 청크를 생성
+
+    동시에 대기하는 작업 수를 워커 수의 2배로 제한하여 렌더링된 PDF가 메모리에 쌓이지 않게 한다.
+    cache가 주어지면 확정된 급여명세서는 캐시된 PDF를 그대로 쓰고, 새로 렌더링한 것은 캐시에 저장한다.
+    """
+    executor = get_executor(max_workers)
+    window = (max_workers or os.cpu_count() or 1) * 2
+    buffer = ZipStreamBuffer()
+    to_render = []
+    pending = {}
+    errors = []
+
+    def submit_next():
+        for snapshot in remaining:
+            pending[executor.submit(render_payslip, snapshot)] = snapshot
+            if len(pending) >= window:
+                break
+
+    try:
+        with zipfile.ZipFile(buffer, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+            # 캐시에 있는 확정 급여명세서는 바로 기록하고 나머지만 렌더링
+            for snapshot in snapshots:
+                cached_path = cache.get(snapshot) if cache and snapshot.is_final else None
+                data = None
+                if cached_path:
+                    try:
+                        with open(cached_path, 'rb') as cached_file:
+                            data = cached_file.read()
+                    except FileNotFoundError:
+                        pass
+                if data is None:
+                    to_render.append(snapshot)
+                    continue
+
+                archive.writestr(payslip_filename(snapshot), data)
+                progress.completed += 1
+                yield buffer.drain()
+
+            remaining = iter(to_render)
+            submit_next()
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    snapshot = pending.pop(future)
+                    try:
+                        filename, data = future.result()
+                    except Exception as e:
+                        progress.failed += 1
+                        errors.append(f"{snapshot.employee.employee_number} ({snapshot.id}): {e}")
+                        continue
+
+                    archive.writestr(filename, data)
+                    if cache and snapshot.is_final:
+                        cache.put(snapshot, data)
+                    progress.completed += 1
+                    yield buffer.drain()
+                submit_next()
+
+            if errors:
+                archive.writestr('errors.txt', '\n'.join(errors))
+
+        yield buffer.drain()
+        progress.finish('completed')
+    except BrokenProcessPool:
+        discard_executor(executor)
+        raise
+    finally:
+        # 클라이언트 연결이 끊긴 경우 남은 작업 취소
+        if progress.status == 'running':
+            for future in pending:
+                future.cancel()
+            progress.finish('cancelled')
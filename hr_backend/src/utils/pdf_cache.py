@@ -0,0 +1,152 @@
+import os
+import hashlib
+import tempfile
+import threading
+
+from flask import current_app
+
+# 렌더링 결과에 영향을 주는 생성기 버전 (레이아웃 변경 시 올리면 기존 캐시가 모두 무효화됨)
+PAYSLIP_LAYOUT_VERSION = 1
+
+# 한도를 넘으면 max_bytes의 이 비율까지 줄여 두어, 가득 찬 뒤에도 저장할 때마다 정리하지 않게 함
+EVICT_TARGET_RATIO = 0.9
+
+
+class PayslipPDFCache:
+    """확정된 급여명세서 PDF 디스크 캐시
+
+    파일명은 '<record_id>-<내용 키>.pdf'이며, 내용 키는 레코드 id와 수정 시각으로 만든 해시이다.
+    레코드가 바뀌면 키가 달라지므로 이전 파일은 더 이상 조회되지 않고, 전체 크기가 max_bytes를
+    넘으면 가장 오래 사용되지 않은(mtime 기준) 파일부터 max_bytes * EVICT_TARGET_RATIO까지 삭제한다.
+    전체 크기는 처음 저장할 때 디렉터리를 한 번 읽어 구한 뒤 저장/삭제마다 누적하므로, 디렉터리를
+    다시 읽는 것은 한도를 넘어 정리할 때뿐이다.
+    """
+
+    def __init__(self, directory, max_bytes):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._total_size = None  # 캐시 파일 크기 합계 (처음 저장할 때 계산)
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def key_for(self, payroll_record):
+        """레코드 내용 키 (id + 수정 시각 + 상태 + 레이아웃 버전)"""
+        changed_at = payroll_record.updated_at or payroll_record.created_at
+        raw = f"{payroll_record.id}:{changed_at.isoformat() if changed_at else ''}:" \
+              f"{payroll_record.status}:{PAYSLIP_LAYOUT_VERSION}"
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()[:32]
+
+    def path_for(self, payroll_record):
+        return os.path.join(self.directory, f"{payroll_record.id}-{self.key_for(payroll_record)}.pdf")
+
+    def get(self, payroll_record):
+        """캐시된 PDF 경로 반환 (없으면 None). 조회 시 mtime을 갱신하여 LRU 순서를 유지한다."""
+        path = self.path_for(payroll_record)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return path
+
+    def put(self, payroll_record, data):
+        """PDF bytes 저장 후 경로 반환"""
+        path = self.path_for(payroll_record)
+        previous_size = self._file_size(path)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as tmp_file:
+                tmp_file.write(data)
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+        with self._lock:
+            if self._total_size is None:
+                self._total_size = sum(size for _, size, _ in self._scan())
+            else:
+                self._total_size += len(data) - previous_size
+            over_limit = self._total_size > self.max_bytes
+
+        if over_limit:
+            self.evict()
+        return path
+
+    def invalidate(self, record_id):
+        """레코드의 캐시 파일 모두 삭제"""
+        prefix = f"{record_id}-"
+        for entry in os.scandir(self.directory):
+            if entry.name.startswith(prefix) and entry.name.endswith('.pdf'):
+                size = self._file_size(entry.path)
+                try:
+                    os.unlink(entry.path)
+                except FileNotFoundError:
+                    continue
+                with self._lock:
+                    if self._total_size is not None:
+                        self._total_size -= size
+
+    @staticmethod
+    def _file_size(path):
+        try:
+            return os.stat(path).st_size
+        except FileNotFoundError:
+            return 0
+
+    def _scan(self):
+        """캐시 파일 (mtime, 크기, 경로) 목록"""
+        entries = []
+        for entry in os.scandir(self.directory):
+            if not entry.name.endswith('.pdf'):
+                continue
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return entries
+
+    def evict(self):
+        """전체 크기가 max_bytes를 넘으면 목표 크기 이하가 될 때까지 가장 오래 사용되지 않은 파일 삭제"""
+        with self._lock:
+            entries = self._scan()
+            total_size = sum(size for _, size, _ in entries)
+            self._total_size = total_size
+            if total_size <= self.max_bytes:
+                return
+
+            target_size = self.max_bytes * EVICT_TARGET_RATIO
+
+            for _, size, path in sorted(entries):
+                try:
+                    os.unlink(path)
+                except FileNotFoundError:
+                    pass
+                total_size -= size
+                self._total_size = total_size
+                if total_size <= target_size:
+                    break
+
+    def stats(self):
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'size_bytes': self._total_size,
+                    'directory': self.directory, 'max_bytes': self.max_bytes}
+
+
+def get_payslip_cache():
+    """현재 앱의 급여명세서 PDF 캐시 (PAYSLIP_CACHE_DIR, PAYSLIP_CACHE_MAX_BYTES 설정 사용)"""
+    cache = current_app.extensions.get('payslip_pdf_cache')
+    if cache is None:
+        cache = PayslipPDFCache(
+            current_app.config['PAYSLIP_CACHE_DIR'],
+            current_app.config.get('PAYSLIP_CACHE_MAX_BYTES', 512 * 1024 * 1024)
+        )
+        current_app.extensions['payslip_pdf_cache'] = cache
+    return cache
@@ -1,6 +1,9 @@
 import io
 import os
+import threading
+import time
 from datetime import datetime
+from types import SimpleNamespace
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import A4, letter
 from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Image
@@ -9,6 +12,11 @@ from reportlab.lib.units import inch, cm
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
+from reportlab.pdfgen.canvas import Canvas
+
+# 프로세스별 공용 생성기 (스타일 설정을 한 번만 수행)
+_shared_generator = None
+_shared_generator_lock = threading.Lock()
 
 class PayrollPDFGenerator:
     """급여명세서 PDF 생성기"""
@@ -16,6 +24,8 @@ class PayrollPDFGenerator:
     def __init__(self):
         self.styles = getSampleStyleSheet()
         self.setup_styles()
+        # 스레드별 미리 배치된 템플릿 (미리 만든 문단 객체를 그리므로 스레드 간 공유하지 않음)
+        self._templates = threading.local()
     
     def setup_styles(self):
         """PDF 스타일 설정"""
@@ -57,18 +67,29 @@ class PayrollPDFGenerator:
         )
     
     def generate_payroll_pdf(self, payroll_record):
-        """급여명세서 PDF 생성"""
+        """급여명세서 PDF 생성
+
+        배치가 고정된 일반 명세서는 미리 배치된 템플릿(PayslipTemplate)으로 값만 그린다.
+        메모가 있으면 길이에 따라 배치가 달라지므로 전체 레이아웃(generate_flow_pdf)을 수행한다.
+        """
+        if payroll_record.memo:
+            return self.generate_flow_pdf(payroll_record)
+        return self.get_template().render(payroll_record)
+    
+    def get_template(self):
+        """현재 스레드의 급여명세서 템플릿 (최초 사용 시 배치 계산)"""
+        template = getattr(self._templates, 'template', None)
+        if template is None:
+            template = PayslipTemplate(self)
+            self._templates.template = template
+        return template
+    
+    def generate_flow_pdf(self, payroll_record):
+        """급여명세서 PDF 생성 (platypus 전체 레이아웃)"""
         buffer = io.BytesIO()
         
         # PDF 문서 생성
-        doc = SimpleDocTemplate(
-            buffer,
-            pagesize=A4,
-            rightMargin=72,
-            leftMargin=72,
-            topMargin=72,
-            bottomMargin=18
-        )
+        doc = self._create_document(buffer)
         
         # 문서 내용 구성
         story = []
@@ -121,17 +142,8 @@ class PayrollPDFGenerator:
         """직원 정보 테이블 생성"""
         elements = []
         
-        # 직원 정보 데이터
-        employee_data = [
-            ['직원 정보', '', '', ''],
-            ['성명', payroll_record.employee.name, '사번', payroll_record.employee.employee_number],
-            ['부서', payroll_record.employee.department.name if payroll_record.employee.department else '-', 
-             '직급', payroll_record.employee.position],
-            ['근무일수', f"{payroll_record.work_days}일", '발행일', datetime.now().strftime('%Y년 %m월 %d일')]
-        ]
-        
         # 테이블 생성
-        employee_table = Table(employee_data, colWidths=[2*cm, 4*cm, 2*cm, 4*cm])
+        employee_table = Table(self._employee_rows(payroll_record), colWidths=[2*cm, 4*cm, 2*cm, 4*cm])
         employee_table.setStyle(TableStyle([
             # 헤더 스타일
             ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
@@ -159,40 +171,8 @@ class PayrollPDFGenerator:
         """급여 내역 테이블 생성"""
         elements = []
         
-        # 지급 내역 데이터
-        income_data = [
-            ['지급 내역', '금액(원)'],
-            ['기본급', f"{payroll_record.basic_salary:,.0f}"],
-            ['직책수당', f"{payroll_record.position_allowance:,.0f}"],
-            ['식대', f"{payroll_record.meal_allowance:,.0f}"],
-            ['교통비', f"{payroll_record.transport_allowance:,.0f}"],
-            ['가족수당', f"{payroll_record.family_allowance:,.0f}"],
-            ['연장근무수당', f"{payroll_record.overtime_allowance:,.0f}"],
-            ['야간근무수당', f"{payroll_record.night_allowance:,.0f}"],
-            ['휴일근무수당', f"{payroll_record.holiday_allowance:,.0f}"],
-            ['기타수당', f"{payroll_record.other_allowances:,.0f}"],
-            ['성과급', f"{payroll_record.performance_bonus:,.0f}"],
-            ['연말보너스', f"{payroll_record.annual_bonus:,.0f}"],
-            ['특별보너스', f"{payroll_record.special_bonus:,.0f}"],
-            ['총 지급액', f"{payroll_record.gross_pay:,.0f}"]
-        ]
-        
-        # 공제 내역 데이터
-        deduction_data = [
-            ['공제 내역', '금액(원)'],
-            ['국민연금', f"{payroll_record.national_pension:,.0f}"],
-            ['건강보험', f"{payroll_record.health_insurance:,.0f}"],
-            ['고용보험', f"{payroll_record.employment_insurance:,.0f}"],
-            ['장기요양보험', f"{payroll_record.long_term_care:,.0f}"],
-            ['소득세', f"{payroll_record.income_tax:,.0f}"],
-            ['지방소득세', f"{payroll_record.local_tax:,.0f}"],
-            ['조합비', f"{payroll_record.union_fee:,.0f}"],
-            ['기타공제', f"{payroll_record.other_deductions:,.0f}"],
-            ['총 공제액', f"{payroll_record.total_deductions:,.0f}"]
-        ]
-        
         # 지급 테이블 생성
-        income_table = Table(income_data, colWidths=[6*cm, 3*cm])
+        income_table = Table(self._income_rows(payroll_record), colWidths=[6*cm, 3*cm])
         income_table.setStyle(TableStyle([
             # 헤더 스타일
             ('BACKGROUND', (0, 0), (-1, 0), colors.lightblue),
@@ -216,7 +196,7 @@ class PayrollPDFGenerator:
         ]))
         
         # 공제 테이블 생성
-        deduction_table = Table(deduction_data, colWidths=[6*cm, 3*cm])
+        deduction_table = Table(self._deduction_rows(payroll_record), colWidths=[6*cm, 3*cm])
         deduction_table.setStyle(TableStyle([
             # 헤더 스타일
             ('BACKGROUND', (0, 0), (-1, 0), colors.lightcoral),
@@ -257,15 +237,7 @@ class PayrollPDFGenerator:
         """급여 요약 정보 생성"""
         elements = []
         
-        # 실지급액 계산 정보
-        summary_data = [
-            ['급여 계산 요약', '', ''],
-            ['총 지급액', f"{payroll_record.gross_pay:,.0f}원", '(A)'],
-            ['총 공제액', f"{payroll_record.total_deductions:,.0f}원", '(B)'],
-            ['실지급액', f"{payroll_record.net_pay:,.0f}원", '(A-B)']
-        ]
-        
-        summary_table = Table(summary_data, colWidths=[6*cm, 4*cm, 2*cm])
+        summary_table = Table(self._summary_rows(payroll_record), colWidths=[6*cm, 4*cm, 2*cm])
         summary_table.setStyle(TableStyle([
             # 헤더 스타일
             ('BACKGROUND', (0, 0), (-1, 0), colors.darkgreen),
@@ -298,18 +270,7 @@ class PayrollPDFGenerator:
         """근무 정보 생성"""
         elements = []
         
-        # 근무 정보 데이터
-        work_data = [
-            ['근무 정보', ''],
-            ['근무일수', f"{payroll_record.work_days}일"],
-            ['연장근무시간', f"{payroll_record.overtime_hours}시간"],
-            ['야간근무시간', f"{payroll_record.night_hours}시간"],
-            ['휴일근무시간', f"{payroll_record.holiday_hours}시간"],
-            ['사용 연차', f"{payroll_record.annual_leave_used}일"],
-            ['잔여 연차', f"{payroll_record.annual_leave_remaining}일"]
-        ]
-        
-        work_table = Table(work_data, colWidths=[6*cm, 6*cm])
+        work_table = Table(self._work_rows(payroll_record), colWidths=[6*cm, 6*cm])
         work_table.setStyle(TableStyle([
             # 헤더 스타일
             ('BACKGROUND', (0, 0), (-1, 0), colors.lightyellow),
@@ -344,13 +305,7 @@ class PayrollPDFGenerator:
             elements.append(Spacer(1, 10))
         
         # 발행 정보
-        issue_info = [
-            f"발행일: {datetime.now().strftime('%Y년 %m월 %d일')}",
-            f"발행처: HR 통합 관리 시스템",
-            f"상태: {'확정' if payroll_record.is_final else '임시'}",
-        ]
-        
-        for info in issue_info:
+        for info in self._issue_lines(payroll_record):
             info_text = Paragraph(info, self.right_style)
             elements.append(info_text)
         
@@ -368,6 +323,90 @@ class PayrollPDFGenerator:
         
         return elements
     
+    def _employee_rows(self, payroll_record):
+        """직원 정보 테이블 데이터"""
+        return [
+            ['직원 정보', '', '', ''],
+            ['성명', payroll_record.employee.name, '사번', payroll_record.employee.employee_number],
+            ['부서', payroll_record.employee.department.name if payroll_record.employee.department else '-', 
+             '직급', payroll_record.employee.position or '-'],
+            ['근무일수', f"{payroll_record.work_days}일", '발행일', datetime.now().strftime('%Y년 %m월 %d일')]
+        ]
+    
+    def _income_rows(self, payroll_record):
+        """지급 내역 테이블 데이터"""
+        return [
+            ['지급 내역', '금액(원)'],
+            ['기본급', f"{payroll_record.basic_salary:,.0f}"],
+            ['직책수당', f"{payroll_record.position_allowance:,.0f}"],
+            ['식대', f"{payroll_record.meal_allowance:,.0f}"],
+            ['교통비', f"{payroll_record.transport_allowance:,.0f}"],
+            ['가족수당', f"{payroll_record.family_allowance:,.0f}"],
+            ['연장근무수당', f"{payroll_record.overtime_allowance:,.0f}"],
+            ['야간근무수당', f"{payroll_record.night_allowance:,.0f}"],
+            ['휴일근무수당', f"{payroll_record.holiday_allowance:,.0f}"],
+            ['기타수당', f"{payroll_record.other_allowances:,.0f}"],
+            ['성과급', f"{payroll_record.performance_bonus:,.0f}"],
+            ['연말보너스', f"{payroll_record.annual_bonus:,.0f}"],
+            ['특별보너스', f"{payroll_record.special_bonus:,.0f}"],
+            ['총 지급액', f"{payroll_record.gross_pay:,.0f}"]
+        ]
+    
+    def _deduction_rows(self, payroll_record):
+        """공제 내역 테이블 데이터"""
+        return [
+            ['공제 내역', '금액(원)'],
+            ['국민연금', f"{payroll_record.national_pension:,.0f}"],
+            ['건강보험', f"{payroll_record.health_insurance:,.0f}"],
+            ['고용보험', f"{payroll_record.employment_insurance:,.0f}"],
+            ['장기요양보험', f"{payroll_record.long_term_care:,.0f}"],
+            ['소득세', f"{payroll_record.income_tax:,.0f}"],
+            ['지방소득세', f"{payroll_record.local_tax:,.0f}"],
+            ['조합비', f"{payroll_record.union_fee:,.0f}"],
+            ['기타공제', f"{payroll_record.other_deductions:,.0f}"],
+            ['총 공제액', f"{payroll_record.total_deductions:,.0f}"]
+        ]
+    
+    def _summary_rows(self, payroll_record):
+        """급여 계산 요약 테이블 데이터"""
+        return [
+            ['급여 계산 요약', '', ''],
+            ['총 지급액', f"{payroll_record.gross_pay:,.0f}원", '(A)'],
+            ['총 공제액', f"{payroll_record.total_deductions:,.0f}원", '(B)'],
+            ['실지급액', f"{payroll_record.net_pay:,.0f}원", '(A-B)']
+        ]
+    
+    def _work_rows(self, payroll_record):
+        """근무 정보 테이블 데이터"""
+        return [
+            ['근무 정보', ''],
+            ['근무일수', f"{payroll_record.work_days}일"],
+            ['연장근무시간', f"{payroll_record.overtime_hours}시간"],
+            ['야간근무시간', f"{payroll_record.night_hours}시간"],
+            ['휴일근무시간', f"{payroll_record.holiday_hours}시간"],
+            ['사용 연차', f"{payroll_record.annual_leave_used}일"],
+            ['잔여 연차', f"{payroll_record.annual_leave_remaining}일"]
+        ]
+    
+    def _issue_lines(self, payroll_record):
+        """발행 정보 문구"""
+        return [
+            f"발행일: {datetime.now().strftime('%Y년 %m월 %d일')}",
+            f"발행처: HR 통합 관리 시스템",
+            f"상태: {'확정' if payroll_record.is_final else '임시'}",
+        ]
+    
+    def _create_document(self, buffer):
+        """급여명세서 문서 템플릿"""
+        return SimpleDocTemplate(
+            buffer,
+            pagesize=A4,
+            rightMargin=72,
+            leftMargin=72,
+            topMargin=72,
+            bottomMargin=18
+        )
+    
     def save_pdf_to_file(self, payroll_record, file_path):
         """PDF를 파일로 저장"""
         buffer = self.generate_payroll_pdf(payroll_record)
@@ -380,3 +419,245 @@ class PayrollPDFGenerator:
         
         return file_path
 
+
+class _CellPositionRecorder(Canvas):
+    """표의 값 셀이 그려지는 절대 좌표와 글꼴을 기록하는 캔버스 (템플릿 배치 계산용)"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cell_positions = {}
+
+    def _record(self, method, x, y, text):
+        a, b, c, d, e, f = self._currentMatrix
+        self.cell_positions[text] = (
+            self.getPageNumber(), method, a * x + c * y + e, b * x + d * y + f,
+            self._fontname, self._fontsize, self._leading, self._fillColorObj
+        )
+
+    def drawString(self, x, y, text, *args, **kwargs):
+        self._record('drawString', x, y, text)
+
+    def drawRightString(self, x, y, text, *args, **kwargs):
+        self._record('drawRightString', x, y, text)
+
+    def drawCentredString(self, x, y, text, *args, **kwargs):
+        self._record('drawCentredString', x, y, text)
+
+
+class PayslipTemplate:
+    """미리 배치된 급여명세서 템플릿
+
+    표본 레코드로 전체 레이아웃을 한 번 수행하여 각 요소가 그려질 페이지와 좌표를 기록하고,
+    배경색/격자/항목명/고정 문단만 그린 페이지 배경을 PDF 명령열로 만들어 둔다.
+    레코드마다 배경 명령열을 그대로 넣은 뒤 값 셀 문자열과 가변 문단(급여 기간, 발행일, 상태)만
+    기록된 좌표에 그리므로 스타일 설정, 행 높이/열 너비 계산, 페이지 분할을 다시 하지 않는다.
+    모든 셀이 한 줄 문자열이라 값이 바뀌어도 배치는 전체 레이아웃 결과와 같다.
+    """
+
+    def __init__(self, generator):
+        record = _sample_payroll_record()
+
+        header = generator._create_header(record)
+        employee = generator._create_employee_info(record)
+        payroll = generator._create_payroll_table(record)
+        summary = generator._create_summary(record)
+        work = generator._create_work_info(record)
+        footer = generator._create_footer(record)
+
+        income_table, deduction_table = payroll[0]._cellvalues[0]
+        self.period_text = header[2]
+        self.issue_date_text = footer[0]
+        self.status_text = footer[2]
+        variable_paragraphs = (self.period_text, self.issue_date_text, self.status_text)
+
+        # (표, 행 데이터 함수, 값이 들어가는 열) - 0행은 제목 행
+        tables = [
+            (employee[0], generator._employee_rows, (1, 3)),
+            (income_table, generator._income_rows, (1,)),
+            (deduction_table, generator._deduction_rows, (1,)),
+            (summary[0], generator._summary_rows, (1,)),
+            (work[0], generator._work_rows, (1,)),
+        ]
+        self.table_rows = [rows for _, rows, _ in tables]
+        self.issue_lines = generator._issue_lines
+
+        # 전체 레이아웃을 한 번 수행하며 요소별 (페이지, x, y, 여백 폭) 기록
+        placements = []
+        story = header + employee + payroll + summary + work + footer
+        flowables = [flowable for flowable in story if not isinstance(flowable, Spacer)]
+        for flowable in flowables:
+            flowable.drawOn = self._recording_draw_on(flowable, placements)
+        generator._create_document(io.BytesIO()).build(story)
+        for flowable in flowables:
+            del flowable.drawOn
+        page_count = max(page for page, *_ in placements)
+        self.paragraph_placements = [
+            placement for placement in placements if placement[1] in variable_paragraphs
+        ]
+
+        # 값 셀에 위치 표식을 넣고 그려서 셀별 절대 좌표/글꼴 기록
+        markers = {}
+        for table_index, (table, rows, value_columns) in enumerate(tables):
+            table._cellvalues = [
+                [self._marker(markers, table_index, row_index, column)
+                 if row_index > 0 and column in value_columns else ''
+                 for column in range(len(row))]
+                for row_index, row in enumerate(rows(record))
+            ]
+        recorder = _CellPositionRecorder(io.BytesIO(), pagesize=A4)
+        self._draw_placements(recorder, placements, page_count, skip=variable_paragraphs)
+        self.cells = [(markers[marker],) + position for marker, position in recorder.cell_positions.items()
+                      if marker in markers]
+
+        # 페이지 배경: 값 셀을 비운 표와 고정 문단을 그린 PDF 명령열
+        for table, rows, value_columns in tables:
+            table._cellvalues = [
+                ['' if row_index > 0 and column in value_columns else cell for column, cell in enumerate(row)]
+                for row_index, row in enumerate(rows(record))
+            ]
+        background = Canvas(io.BytesIO(), pagesize=A4)
+        self.page_backgrounds = self._draw_placements(background, placements, page_count, skip=variable_paragraphs)
+        # 배경 명령열이 참조하는 글꼴 (문서마다 같은 순서로 등록해야 글꼴 이름(/F1, /F2 ...)이 일치)
+        self.font_names = list(background._doc.fontMapping)
+
+        # 상태 문단은 두 가지뿐이므로 미리 만들어 둠
+        self.status_texts = {
+            is_final: self._paragraph(f"상태: {'확정' if is_final else '임시'}", self.status_text)
+            for is_final in (True, False)
+        }
+
+    @staticmethod
+    def _recording_draw_on(flowable, placements):
+        draw_on = type(flowable).drawOn
+
+        def recording_draw_on(canvas, x, y, _sW=0):
+            placements.append((canvas.getPageNumber(), flowable, x, y, _sW))
+            draw_on(flowable, canvas, x, y, _sW)
+
+        return recording_draw_on
+
+    @staticmethod
+    def _marker(markers, table_index, row_index, column):
+        marker = f"#{table_index}:{row_index}:{column}#"
+        markers[marker] = (table_index, row_index, column)
+        return marker
+
+    @staticmethod
+    def _draw_placements(canvas, placements, page_count, skip):
+        """기록된 좌표에 요소를 그리고 페이지별 PDF 명령열 반환"""
+        pages = []
+        for page in range(1, page_count + 1):
+            for page_number, flowable, x, y, space_width in placements:
+                if page_number == page and flowable not in skip:
+                    flowable.drawOn(canvas, x, y, space_width)
+            pages.append('\n'.join(canvas._code))
+            canvas.showPage()
+        return pages
+
+    @staticmethod
+    def _paragraph(text, template_paragraph):
+        """템플릿 문단과 같은 스타일/폭으로 배치된 문단"""
+        paragraph = Paragraph(text, template_paragraph.style)
+        paragraph.wrap(template_paragraph.width, template_paragraph.height)
+        return paragraph
+
+    def render(self, payroll_record):
+        """급여명세서 PDF 생성 (배경 위에 값만 그림)"""
+        table_values = [rows(payroll_record) for rows in self.table_rows]
+        paragraphs = {
+            id(self.period_text): self._paragraph(f"급여 지급 기간: {payroll_record.period}", self.period_text),
+            id(self.issue_date_text): self._paragraph(self.issue_lines(payroll_record)[0], self.issue_date_text),
+            id(self.status_text): self.status_texts[bool(payroll_record.is_final)],
+        }
+
+        buffer = io.BytesIO()
+        canvas = Canvas(buffer, pagesize=A4)
+        canvas.setTitle('untitled')
+        canvas.setAuthor('anonymous')
+        canvas.setSubject('unspecified')
+
+        canvas.saveState()
+        for font_name in self.font_names:
+            canvas.setFont(font_name, 10)
+        canvas.restoreState()
+
+        for page, background in enumerate(self.page_backgrounds, start=1):
+            canvas.addLiteral(background)
+
+            canvas.saveState()
+            current_style = None
+            for (table_index, row_index, column), page_number, method, x, y, font_name, font_size, leading, color \
+                    in self.cells:
+                if page_number != page:
+                    continue
+                if current_style != (font_name, font_size, leading, color):
+                    canvas.setFont(font_name, font_size, leading)
+                    canvas.setFillColor(color)
+                    current_style = (font_name, font_size, leading, color)
+                value = table_values[table_index][row_index][column]
+                # 캔버스는 문자열만 그리므로 비어 있는 값(None)은 빈 칸으로 둔다
+                getattr(canvas, method)(x, y, '' if value is None else str(value))
+            canvas.restoreState()
+
+            for page_number, flowable, x, y, space_width in self.paragraph_placements:
+                if page_number == page:
+                    paragraphs[id(flowable)].drawOn(canvas, x, y, space_width)
+            canvas.showPage()
+        canvas.save()
+
+        buffer.seek(0)
+        return buffer
+
+
+def _sample_payroll_record():
+    """템플릿 배치 계산과 벤치마크에 쓰는 표본 급여 레코드"""
+    amounts = {
+        'basic_salary': 3500000, 'position_allowance': 200000, 'meal_allowance': 200000,
+        'transport_allowance': 100000, 'family_allowance': 100000, 'overtime_allowance': 150000,
+        'night_allowance': 0, 'holiday_allowance': 0, 'other_allowances': 0,
+        'performance_bonus': 300000, 'annual_bonus': 0, 'special_bonus': 0, 'gross_pay': 4550000,
+        'national_pension': 204750, 'health_insurance': 161297, 'employment_insurance': 40950,
+        'long_term_care': 20888, 'income_tax': 336000, 'local_tax': 33600, 'union_fee': 10000,
+        'other_deductions': 0, 'total_deductions': 807485, 'net_pay': 3742515,
+    }
+    return SimpleNamespace(
+        period='2024-01',
+        employee=SimpleNamespace(
+            name='홍길동', employee_number='EMP0001', position='대리',
+            department=SimpleNamespace(name='인사팀')
+        ),
+        work_days=22, overtime_hours=10, night_hours=0, holiday_hours=0,
+        annual_leave_used=1, annual_leave_remaining=14,
+        memo=None, is_final=True, **amounts
+    )
+
+
+def get_payroll_pdf_generator():
+    """프로세스 공용 급여명세서 PDF 생성기"""
+    global _shared_generator
+    with _shared_generator_lock:
+        if _shared_generator is None:
+            _shared_generator = PayrollPDFGenerator()
+        return _shared_generator
+
+
+def benchmark_payslip_render(count=200):
+    """급여명세서 한 건당 렌더링 시간(ms) 측정: 전체 레이아웃 vs 미리 배치된 템플릿"""
+    record = _sample_payroll_record()
+    generator = PayrollPDFGenerator()
+
+    started = time.perf_counter()
+    template = generator.get_template()
+    template_setup_ms = (time.perf_counter() - started) * 1000
+
+    results = {'count': count, 'template_setup_ms': round(template_setup_ms, 2)}
+    for name, render in (('flow_layout', lambda: PayrollPDFGenerator().generate_flow_pdf(record)),
+                         ('template', lambda: template.render(record))):
+        render()
+        started = time.perf_counter()
+        for _ in range(count):
+            render()
+        results[f"{name}_ms"] = round((time.perf_counter() - started) * 1000 / count, 3)
+
+    results['speedup'] = round(results['flow_layout_ms'] / results['template_ms'], 1)
+    return results
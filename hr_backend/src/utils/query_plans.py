@@ -0,0 +1,69 @@
+import re
+from datetime import date
+from sqlalchemy import func, inspect, select
+from ..models.user import db
+from ..models.attendance_record import AttendanceRecord
+from ..models.attendance_daily_stat import AttendanceDailyStat
+from ..models.annual_leave_grant import AnnualLeaveGrant
+from ..models.annual_leave_usage import AnnualLeaveUsage
+from ..models.evaluation_simple import EvaluationResult
+from ..models.payroll_record import PayrollRecord
+from ..models.audit_log import AuditLog
+
+# EXPLAIN QUERY PLAN에서 인덱스 없이 테이블 전체를 읽는 단계 ("SCAN 테이블", USING INDEX 없음)
+FULL_SCAN = re.compile(r'^SCAN (?:TABLE )?(?P<table>\w+)$')
+
+
+def hot_queries():
+    """자주 쓰는 조회의 (이름, SELECT) 목록 (파라미터는 예시 값)
+
+    조건은 라우트가 쓰는 모델 조회/조건 헬퍼로 만들어, 라우트의 조회가 바뀌면 점검 대상도 함께 바뀐다.
+    """
+    month_start, next_month_start = date(2025, 1, 1), date(2025, 2, 1)
+    return [
+        ('출퇴근 기록 중복 확인 (직원, 일자)', AttendanceRecord.for_employee_on(1, month_start).statement),
+        ('월 출퇴근 기록 (종합 리포트)', select(func.count(AttendanceRecord.id)).where(
+            AttendanceRecord.date_range(month_start, next_month_start))),
+        ('일자/부서별 출퇴근 집계 기간 조회', select(func.sum(AttendanceDailyStat.record_count)).where(
+            AttendanceDailyStat.date_range(month_start, next_month_start))),
+        ('직원 급여명세서 중복 확인 (직원, 기간)', PayrollRecord.by_employee_and_period(1, '2025-01').statement),
+        ('급여 기간 범위 집계 (종합 리포트)', select(func.sum(PayrollRecord.net_pay)).where(
+            PayrollRecord.period_range('2025-01', '2025-02'))),
+        ('급여 기간 이후 집계 (급여 트렌드)', select(
+            PayrollRecord.period, func.sum(PayrollRecord.net_pay)
+        ).where(PayrollRecord.period_range('2024-02')).group_by(PayrollRecord.period)),
+        ('직원 연간 사용 연차', AnnualLeaveUsage.used_days_in_year_query(1, 2025).statement),
+        ('직원 연도 부여 연차', AnnualLeaveGrant.for_employee_year(1, 2025).statement),
+        ('직원 완료/승인 평가 결과', select(EvaluationResult.id).where(EvaluationResult.completed_condition(1))),
+        ('최근 감사 로그', AuditLog.recent_first().limit(20).statement),
+        ('사용자별 최근 감사 로그', AuditLog.recent_first(1).limit(20).statement),
+    ]
+
+
+def explain_query_plan(connection, statement):
+    """SQLite EXPLAIN QUERY PLAN 결과의 단계 설명(detail) 목록"""
+    # IN (...) 같은 확장 파라미터도 자리표시자로 펼쳐서 컴파일
+    compiled = statement.compile(dialect=connection.dialect, compile_kwargs={'render_postcompile': True})
+    params = compiled.construct_params()
+    parameters = tuple(params[name] for name in compiled.positiontup or ())
+    rows = connection.exec_driver_sql(f'EXPLAIN QUERY PLAN {compiled}', parameters).fetchall()
+    return [row[-1] for row in rows]
+
+
+def check_query_plans():
+    """자주 쓰는 조회의 실행 계획 점검 -> [{'name', 'status', 'plan'}]
+
+    status는 ok, full_scan(테이블 전체 읽기), skipped(테이블 없음) 중 하나다.
+    """
+    results = []
+    with db.engine.connect() as connection:
+        inspector = inspect(connection)
+        for name, statement in hot_queries():
+            tables = [table.name for table in statement.get_final_froms()]
+            if not all(inspector.has_table(table) for table in tables):
+                results.append({'name': name, 'status': 'skipped', 'plan': []})
+                continue
+            plan = explain_query_plan(connection, statement)
+            full_scan = any(match and match['table'] in tables for match in map(FULL_SCAN.match, plan))
+            results.append({'name': name, 'status': 'full_scan' if full_scan else 'ok', 'plan': plan})
+    return results
@@ -0,0 +1,134 @@
+from sqlalchemy import Index, inspect, text
+
+
+def ensure_indexes(db):
+    """모델에 선언된 인덱스 중 기존 데이터베이스에 없는 인덱스 생성
+
+    db.create_all()은 이미 존재하는 테이블에 새로 선언된 인덱스를 추가하지 않으므로
+    앱 시작 시 한 번 호출하여 보완한다. 생성한 인덱스 이름 목록을 반환한다.
+    """
+    inspector = inspect(db.engine)
+    created = []
+    for table in db.metadata.tables.values():
+        if not table.indexes or not inspector.has_table(table.name):
+            continue
+        existing = {index['name'] for index in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name not in existing:
+                index.create(db.engine)
+                created.append(index.name)
+    return created
+
+
+def ensure_columns(db):
+    """모델에 새로 선언된 컬럼 중 기존 테이블에 없는 컬럼을 ALTER TABLE ADD COLUMN으로 추가
+
+    db.create_all()은 기존 테이블의 컬럼을 바꾸지 않으므로 앱 시작 시 한 번 호출한다.
+    NULL 허용 컬럼만 추가하며(기존 행은 NULL), 추가한 "테이블.컬럼" 목록을 반환한다.
+    """
+    inspector = inspect(db.engine)
+    added = []
+    with db.engine.begin() as connection:
+        for table in db.metadata.tables.values():
+            if not inspector.has_table(table.name):
+                continue
+            existing = {column['name'] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing or not column.nullable:
+                    continue
+                column_type = column.type.compile(dialect=db.engine.dialect)
+                connection.execute(text(f'ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}'))
+                added.append(f'{table.name}.{column.name}')
+    return added
+
+
+def declared_indexes(*model_bases):
+    """모델 __table_args__에 선언된 인덱스 -> (이름, 테이블, 컬럼, 유일 여부) 목록
+
+    model_bases는 SQLAlchemy 인스턴스의 db.Model이며, 각 레지스트리에 매핑된(import된) 모델을 모두 본다.
+    """
+    indexes = []
+    for base in model_bases:
+        for mapper in base.registry.mappers:
+            table_args = getattr(mapper.class_, '__table_args__', ())
+            if not isinstance(table_args, tuple):
+                continue
+            for index in table_args:
+                if isinstance(index, Index):
+                    indexes.append((index.name, index.table.name,
+                                    tuple(column.name for column in index.columns), bool(index.unique)))
+    return sorted(set(indexes))
+
+
+def lookup_indexes():
+    """조회 경로용 복합/유일 인덱스 (평가 결과처럼 별도 SQLAlchemy 인스턴스의 모델 포함)"""
+    from ..models.user import db
+    from ..models.evaluation_simple import db as evaluation_db
+    return declared_indexes(db.Model, evaluation_db.Model)
+
+
+def _add_lookup_indexes(connection):
+    """1: 조회 경로 복합 인덱스와 (직원, 일자)/(기간, 직원) 유일 인덱스 추가
+
+    유일 인덱스 대상 테이블에 중복 행이 있으면 인덱스를 만들지 않고 중단한다.
+    """
+    inspector = inspect(connection)
+    for name, table, columns, unique in lookup_indexes():
+        if not inspector.has_table(table):
+            continue
+        column_list = ', '.join(columns)
+        if unique:
+            duplicate = connection.execute(text(
+                f'SELECT {column_list} FROM {table} GROUP BY {column_list} HAVING COUNT(*) > 1 LIMIT 1'
+            )).first()
+            if duplicate is not None:
+                raise RuntimeError(
+                    f'{table}에 ({column_list}) 중복 행이 있어 유일 인덱스 {name}을 만들 수 없습니다: {tuple(duplicate)}'
+                )
+        connection.execute(text(
+            f'CREATE {"UNIQUE " if unique else ""}INDEX IF NOT EXISTS {name} ON {table} ({column_list})'
+        ))
+
+
+def _backfill_attendance_departments(connection):
+    """2: 출퇴근 기록에 기록 당시 부서(department_id)를 채우고 일자/부서별 집계를 비움
+
+    기존 기록은 현재 소속 부서로 채우며, 비운 집계는 앱 시작 시 기록으로부터 다시 만들어진다.
+    """
+    inspector = inspect(connection)
+    if not inspector.has_table('attendance_records'):
+        return
+    connection.execute(text(
+        'UPDATE attendance_records SET department_id = COALESCE('
+        '(SELECT employees.department_id FROM employees WHERE employees.id = attendance_records.employee_id), 0'
+        ') WHERE department_id IS NULL'
+    ))
+    if inspector.has_table('attendance_daily_stats'):
+        connection.execute(text('DELETE FROM attendance_daily_stats'))
+
+
+# (버전, 설명, 적용 함수) - 버전은 PRAGMA user_version에 기록되며 순서대로 한 번씩 적용된다
+MIGRATIONS = (
+    (1, '조회 경로 복합/유일 인덱스 추가', _add_lookup_indexes),
+    (2, '출퇴근 기록 당시 부서 저장', _backfill_attendance_departments),
+)
+
+
+def run_migrations(db):
+    """데이터베이스의 PRAGMA user_version 이후 마이그레이션을 순서대로 적용
+
+    마이그레이션이 끝난 뒤 user_version을 올리며, 중간에 실패하면 다음 시작 때 처음부터 다시 적용되므로
+    각 마이그레이션은 반복 적용해도 안전하게 작성한다(IF NOT EXISTS 등).
+    ensure_indexes()보다 먼저 호출해야 유일 인덱스가 중복 검사 없이 만들어지지 않는다.
+    적용한 (버전, 설명) 목록을 반환한다.
+    """
+    applied = []
+    for version, description, migrate in MIGRATIONS:
+        with db.engine.begin() as connection:
+            current = connection.exec_driver_sql('PRAGMA user_version').scalar()
+            if current >= version:
+                continue
+            migrate(connection)
+            connection.exec_driver_sql(f'PRAGMA user_version = {int(version)}')
+        applied.append((version, description))
+    return applied
@@ -0,0 +1,182 @@
+import math
+from bisect import bisect_right
+
+# 입력 금액 항목
+ALLOWANCE_FIELDS = (
+    'position_allowance', 'meal_allowance', 'transport_allowance', 'family_allowance',
+    'overtime_allowance', 'night_allowance', 'holiday_allowance', 'other_allowances'
+)
+BONUS_FIELDS = ('performance_bonus', 'annual_bonus', 'special_bonus')
+MANUAL_DEDUCTION_FIELDS = ('union_fee', 'other_deductions')
+INPUT_FIELDS = ('basic_salary',) + ALLOWANCE_FIELDS + BONUS_FIELDS + MANUAL_DEDUCTION_FIELDS
+
+# 계산 결과 항목
+RESULT_FIELDS = (
+    'total_allowances', 'total_bonus', 'gross_pay',
+    'national_pension', 'health_insurance', 'long_term_care', 'employment_insurance',
+    'income_tax', 'local_tax', 'total_deductions', 'net_pay'
+)
+
+
+class RateTable:
+    """적용 연도별 세율/보험요율표
+
+    income_tax_brackets는 (구간 하한, 세율) 목록이며, 각 구간의 누적 세액(하한까지의 세액)은
+    생성 시 한 번 계산해 두고 bisect로 구간을 찾는다.
+    """
+
+    def __init__(self, effective_year, pension_rate, pension_base_cap, health_rate, long_term_care_rate,
+                 employment_rate, income_tax_brackets, local_tax_rate):
+        self.effective_year = effective_year
+        self.pension_rate = pension_rate
+        self.pension_base_cap = pension_base_cap
+        self.health_rate = health_rate
+        self.long_term_care_rate = long_term_care_rate  # 건강보험료 대비
+        self.employment_rate = employment_rate
+        self.local_tax_rate = local_tax_rate  # 소득세 대비
+
+        self.bracket_floors = [floor for floor, _ in income_tax_brackets]
+        self.bracket_rates = [rate for _, rate in income_tax_brackets]
+        self.bracket_bases = [0]
+        for i in range(1, len(income_tax_brackets)):
+            width = self.bracket_floors[i] - self.bracket_floors[i - 1]
+            self.bracket_bases.append(self.bracket_bases[-1] + width * self.bracket_rates[i - 1])
+
+    def income_tax(self, taxable_income):
+        """과세 소득에 대한 소득세 (구간 하한까지의 누적 세액 + 초과분 x 구간 세율)"""
+        index = max(bisect_right(self.bracket_floors, taxable_income) - 1, 0)
+        return self.bracket_bases[index] + (taxable_income - self.bracket_floors[index]) * self.bracket_rates[index]
+
+    def to_dict(self):
+        return {
+            'effective_year': self.effective_year,
+            'pension_rate': self.pension_rate,
+            'pension_base_cap': self.pension_base_cap,
+            'health_rate': self.health_rate,
+            'long_term_care_rate': self.long_term_care_rate,
+            'employment_rate': self.employment_rate,
+            'income_tax_brackets': [
+                {'floor': floor, 'rate': rate, 'base_tax': base}
+                for floor, rate, base in zip(self.bracket_floors, self.bracket_rates, self.bracket_bases)
+            ],
+            'local_tax_rate': self.local_tax_rate
+        }
+
+
+# 적용 연도 오름차순. 요율이 바뀌면 새 연도의 표를 추가한다.
+# (가장 이른 표보다 이전 연도의 급여에도 가장 이른 표를 적용)
+RATE_TABLES = [
+    RateTable(
+        effective_year=2025,
+        pension_rate=0.045,
+        pension_base_cap=5530000,
+        health_rate=0.03545,
+        long_term_care_rate=0.1295,
+        employment_rate=0.009,
+        income_tax_brackets=[
+            (0, 0.06),
+            (1200000, 0.15),
+            (4600000, 0.24),
+            (8800000, 0.35),
+        ],
+        local_tax_rate=0.1
+    ),
+]
+_EFFECTIVE_YEARS = [table.effective_year for table in RATE_TABLES]
+
+
+def get_rate_table(year):
+    """해당 연도에 적용되는 요율표"""
+    if year is None:
+        return RATE_TABLES[-1]
+    index = max(bisect_right(_EFFECTIVE_YEARS, year) - 1, 0)
+    return RATE_TABLES[index]
+
+
+def compute_batch(rows, year=None):
+    """여러 급여 행(dict)의 총액, 4대보험, 소득세/지방소득세를 한 번에 계산
+
+    입력 금액 항목을 열 단위로 꺼내 합산한 뒤 행마다 요율표를 적용하여 RESULT_FIELDS를 채운다.
+    요율표는 행의 'year'(없으면 year 인자, 그것도 없으면 최신 표)로 고른다.
+    벌크 insert/update에 바로 넘길 수 있도록 rows를 그대로 반환한다.
+    """
+    if not rows:
+        return rows
+
+    def column(field):
+        return [float(row.get(field) or 0) for row in rows]
+
+    def column_sum(fields):
+        return [sum(values) for values in zip(*(column(field) for field in fields))]
+
+    basic = column('basic_salary')
+    allowances = column_sum(ALLOWANCE_FIELDS)
+    bonuses = column_sum(BONUS_FIELDS)
+    manual_deductions = column_sum(MANUAL_DEDUCTION_FIELDS)
+
+    tables = {}
+    for i, row in enumerate(rows):
+        row_year = row.get('year') or year
+        table = tables.get(row_year)
+        if table is None:
+            table = tables[row_year] = get_rate_table(row_year)
+
+        insurable = basic[i] + allowances[i]
+        gross = insurable + bonuses[i]
+
+        # 4대보험
+        pension = min(insurable, table.pension_base_cap) * table.pension_rate
+        health = insurable * table.health_rate
+        long_term_care = health * table.long_term_care_rate
+        employment = insurable * table.employment_rate
+
+        # 소득세 / 지방소득세
+        income_tax = table.income_tax(gross - (pension + health + employment))
+        local_tax = income_tax * table.local_tax_rate
+
+        total_deductions = (
+            pension + health + employment + long_term_care +
+            income_tax + local_tax + manual_deductions[i]
+        )
+
+        row.update({
+            'total_allowances': allowances[i],
+            'total_bonus': bonuses[i],
+            'gross_pay': gross,
+            'national_pension': pension,
+            'health_insurance': health,
+            'long_term_care': long_term_care,
+            'employment_insurance': employment,
+            'income_tax': income_tax,
+            'local_tax': local_tax,
+            'total_deductions': total_deductions,
+            'net_pay': gross - total_deductions
+        })
+
+    return rows
+
+
+def preview(values, year=None):
+    """입력 금액 dict로 계산 결과 미리보기 (DB/세션을 사용하지 않는 순수 함수)
+
+    저장 경로(PayrollRecord.calculate_tax_and_insurance)와 같은 compute_batch를 사용한다.
+    없는 항목은 0으로 보며, 숫자가 아니거나(nan/inf 포함) 음수인 항목은 ValueError.
+    """
+    row = {}
+    for field in INPUT_FIELDS:
+        value = values.get(field) or 0
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            try:
+                value = float(str(value).replace(',', ''))
+            except ValueError:
+                raise ValueError(f'{field}는 숫자여야 합니다.')
+        if not math.isfinite(value):
+            raise ValueError(f'{field}는 숫자여야 합니다.')
+        if value < 0:
+            raise ValueError(f'{field}는 음수일 수 없습니다.')
+        row[field] = float(value)
+
+    row['year'] = year
+    compute_batch([row])
+    row['rate_table_year'] = get_rate_table(year).effective_year
+    return row
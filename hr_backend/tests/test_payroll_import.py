@@ -0,0 +1,18 @@
+import pytest
+
+from src.utils.payroll_import import parse_import_row
+
+
+@pytest.mark.parametrize('value', ['nan', 'inf', '-inf', 'NaN', float('inf')])
+def test_non_finite_numbers_are_row_errors(value):
+    values, errors = parse_import_row({'employee_number': 'E0001', 'period': '2025-01', 'basic_salary': value})
+
+    assert 'basic_salary' not in values
+    assert errors and errors[0].startswith('basic_salary:')
+
+
+def test_non_finite_integer_field_is_row_error():
+    values, errors = parse_import_row({'employee_number': 'E0001', 'period': '2025-01', 'work_days': 'inf'})
+
+    assert 'work_days' not in values
+    assert len(errors) == 1
@@ -0,0 +1,23 @@
+from types import SimpleNamespace
+
+from src.utils.pdf_generator import PayrollPDFGenerator, _sample_payroll_record
+
+
+def _record_without_optional_fields():
+    """직급/부서/메모가 없는 직원의 급여 레코드"""
+    record = _sample_payroll_record()
+    record.employee = SimpleNamespace(name='홍길동', employee_number='EMP0002', position=None, department=None)
+    record.memo = None
+    return record
+
+
+def test_template_renders_employee_without_position_department_or_memo():
+    pdf = PayrollPDFGenerator().generate_payroll_pdf(_record_without_optional_fields()).getvalue()
+
+    assert pdf.startswith(b'%PDF-')
+
+
+def test_flow_layout_renders_employee_without_position_department_or_memo():
+    pdf = PayrollPDFGenerator().generate_flow_pdf(_record_without_optional_fields()).getvalue()
+
+    assert pdf.startswith(b'%PDF-')
@@ -0,0 +1,16 @@
+import pytest
+
+from src.utils import tax_engine
+
+
+@pytest.mark.parametrize('value', ['nan', 'inf', '-inf', float('nan'), float('inf')])
+def test_preview_rejects_non_finite_amounts(value):
+    with pytest.raises(ValueError):
+        tax_engine.preview({'basic_salary': value})
+
+
+def test_preview_accepts_comma_separated_amounts():
+    result = tax_engine.preview({'basic_salary': '3,000,000'})
+
+    assert result['basic_salary'] == 3000000
+    assert 0 < result['net_pay'] < result['gross_pay']
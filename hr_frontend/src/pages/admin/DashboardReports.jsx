@@ -19,61 +19,30 @@ const DashboardReports = () => {
   });
   const [activeTab, setActiveTab] = useState('overview');
 
-  // 대시보드 개요 데이터
-  const { data: overviewData, isLoading: overviewLoading, refetch: refetchOverview } = useQuery({
-    queryKey: ['dashboard-overview'],
+  // 대시보드 데이터 (개요/출근 트렌드/부서별 통계/급여 트렌드를 한 번에 조회)
+  const { data: bundleData, isLoading: bundleLoading, refetch: refetchDashboard } = useQuery({
+    queryKey: ['dashboard-bundle'],
     queryFn: async () => {
-      const response = await fetch('http://localhost:5007/api/dashboard/overview', {
-        headers: {
-          'Authorization': `Bearer ${localStorage.getItem('token')}`
-        }
-      });
-      if (!response.ok) throw new Error('대시보드 개요를 불러오는데 실패했습니다.');
-      return response.json();
-    }
-  });
-
-  // 출근 트렌드 데이터
-  const { data: attendanceTrendData, isLoading: attendanceTrendLoading } = useQuery({
-    queryKey: ['attendance-trend'],
-    queryFn: async () => {
-      const response = await fetch('http://localhost:5007/api/dashboard/charts/attendance-trend', {
-        headers: {
-          'Authorization': `Bearer ${localStorage.getItem('token')}`
-        }
-      });
-      if (!response.ok) throw new Error('출근 트렌드를 불러오는데 실패했습니다.');
-      return response.json();
-    }
-  });
-
-  // 부서별 통계 데이터
-  const { data: departmentStatsData, isLoading: departmentStatsLoading } = useQuery({
-    queryKey: ['department-stats'],
-    queryFn: async () => {
-      const response = await fetch('http://localhost:5007/api/dashboard/charts/department-stats', {
-        headers: {
-          'Authorization': `Bearer ${localStorage.getItem('token')}`
-        }
+      const params = new URLSearchParams({
+        sections: 'overview,attendance_trend,department_stats,payroll_trend',
+        overview_fields: 'overview,attendance,evaluation,payroll,recent_activities',
+        attendance_trend_fields: 'chart_data',
+        department_stats_fields: 'department_stats',
+        payroll_trend_fields: 'chart_data'
       });
-      if (!response.ok) throw new Error('부서별 통계를 불러오는데 실패했습니다.');
-      return response.json();
-    }
-  });
-
-  // 급여 트렌드 데이터
-  const { data: payrollTrendData, isLoading: payrollTrendLoading } = useQuery({
-    queryKey: ['payroll-trend'],
-    queryFn: async () => {
-      const response = await fetch('http://localhost:5007/api/dashboard/charts/payroll-trend', {
+      const response = await fetch(`http://localhost:5007/api/dashboard/bundle?${params}`, {
         headers: {
           'Authorization': `Bearer ${localStorage.getItem('token')}`
         }
       });
-      if (!response.ok) throw new Error('급여 트렌드를 불러오는데 실패했습니다.');
+      if (!response.ok) throw new Error('대시보드 데이터를 불러오는데 실패했습니다.');
       return response.json();
     }
   });
+  const overviewData = bundleData?.overview;
+  const attendanceTrendData = bundleData?.attendance_trend;
+  const departmentStatsData = bundleData?.department_stats;
+  const payrollTrendData = bundleData?.payroll_trend;
 
   // 종합 리포트 데이터
   const { data: summaryReportData, isLoading: summaryReportLoading } = useQuery({
@@ -138,7 +107,7 @@ const DashboardReports = () => {
   // 차트 색상 설정
   const COLORS = ['#3B82F6', '#10B981', '#F59E0B', '#EF4444', '#8B5CF6', '#06B6D4'];
 
-  if (overviewLoading) {
+  if (bundleLoading) {
     return (
       <div className="flex items-center justify-center h-64">
         <div className="animate-spin rounded-full h-8 w-8 border-b-2 border-blue-600"></div>
@@ -157,7 +126,7 @@ const DashboardReports = () => {
         <div className="flex items-center space-x-3">
           <button
             onClick={() => {
-              refetchOverview();
+              refetchDashboard();
             }}
             className="px-4 py-2 bg-blue-600 text-white rounded-md hover:bg-blue-700 flex items-center"
           >
@@ -366,7 +335,7 @@ const DashboardReports = () => {
       {activeTab === 'charts' && (
         <div className="space-y-6">
           {/* 출근 트렌드 차트 */}
-          {!attendanceTrendLoading && attendanceTrendData && (
+          {!bundleLoading && attendanceTrendData && (
             <div className="bg-white p-6 rounded-lg shadow">
               <h3 className="text-lg font-medium text-gray-900 mb-4">출근 트렌드 (최근 12개월)</h3>
               <div className="h-80">
@@ -398,7 +367,7 @@ const DashboardReports = () => {
           )}
 
           {/* 부서별 통계 차트 */}
-          {!departmentStatsLoading && departmentStatsData && (
+          {!bundleLoading && departmentStatsData && (
             <div className="grid grid-cols-1 lg:grid-cols-2 gap-6">
               {/* 부서별 직원 수 */}
               <div className="bg-white p-6 rounded-lg shadow">
@@ -445,7 +414,7 @@ const DashboardReports = () => {
           )}
 
           {/* 급여 트렌드 차트 */}
-          {!payrollTrendLoading && payrollTrendData && (
+          {!bundleLoading && payrollTrendData && (
             <div className="bg-white p-6 rounded-lg shadow">
               <h3 className="text-lg font-medium text-gray-900 mb-4">급여 트렌드 (최근 12개월)</h3>
               <div className="h-80">